@@ -0,0 +1,227 @@
+"""
+Benchmark suite: operator timings and full GA runs across problem sizes.
+
+    python benchmarks/bench.py --output results.json
+    python benchmarks/bench.py --baseline baseline.json --tolerance 0.25
+
+Results are written as JSON. With --baseline, the run fails (exit code 1) when
+any timing is slower than the baseline by more than the tolerance, or when a GA
+run's solution quality (best fitness / proven optimum or upper bound) drops by
+more than --quality-tolerance. Use --save-baseline to record a new baseline on
+the machine that will run the comparison.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ga.crossover import Crossover  # noqa: E402
+from ga.engine import GAConfig, GAEngine  # noqa: E402
+from ga.exact import branch_and_bound  # noqa: E402
+from ga.fitness import evaluate_fitness, Item, KnapsackInstance  # noqa: E402
+from ga.mutation import Mutation  # noqa: E402
+from ga.population import create_population  # noqa: E402
+from ga.selection import (  # noqa: E402
+    roulette_selection,
+    roulette_selection_indices,
+    tournament_selection,
+    tournament_selection_indices,
+)
+
+ITEM_COUNTS = (50, 1_000, 10_000, 100_000)
+QUICK_ITEM_COUNTS = (50, 1_000)
+POPULATION_SIZES = (50, 200)
+GA_GENERATIONS = 20
+REPEAT = 5
+TOLERANCE = 0.25  # allowed relative slowdown
+QUALITY_TOLERANCE = 0.01  # allowed absolute drop in best fitness / reference
+EXACT_TIME_LIMIT = 10.0  # seconds branch-and-bound may spend proving the reference optimum
+
+
+def make_instance(num_items, seed=0):
+    """Random instance with main.py's item distribution and capacity for about half the weight."""
+    rng = random.Random(seed)
+    items = [Item(rng.randint(1, 20), rng.randint(1, 15)) for _ in range(num_items)]
+    return KnapsackInstance(items, 4 * num_items)
+
+
+CALIBRATION_MATRIX = np.ones((200, 1_000), dtype=np.uint8)
+
+
+def calibration():
+    """Fixed Python and numpy workload timed next to every case, so timings can be compared across machine load."""
+    sum(i * i for i in range(20_000))
+    CALIBRATION_MATRIX.sum(axis=1)
+
+
+def time_call(function, repeat=REPEAT):
+    """
+    Time `function` over `repeat` measurements, each at least 0.2s long (or a
+    single call), interleaved with measurements of calibration().
+    Returns:
+        dict with the median seconds per call, the median ratio of a measurement
+        to the calibration measured just before it ("relative") and the spread of
+        those ratios relative to their median ("noise")
+    """
+    timer, reference = timeit.Timer(function), timeit.Timer(calibration)
+    number, _ = timer.autorange()
+    reference_number, _ = reference.autorange()
+    seconds, relative = [], []
+    for _ in range(repeat):
+        reference_seconds = reference.timeit(reference_number) / reference_number
+        seconds.append(timer.timeit(number) / number)
+        relative.append(seconds[-1] / reference_seconds)
+    median = statistics.median(relative)
+    noise = (max(relative) - min(relative)) / median
+    return {"seconds": statistics.median(seconds), "relative": median, "noise": noise}
+
+
+def operator_benchmarks(num_items, population_size, repeat=REPEAT):
+    """Per-call timings of the GA operators, both the list-based originals and their batched forms."""
+    instance = make_instance(num_items)
+    items = list(instance)
+    rng = np.random.default_rng(0)
+    matrix = rng.integers(0, 2, (population_size, num_items), dtype=np.uint8)
+    population = matrix.tolist()
+    fitness_scores = instance.evaluate_population(matrix).tolist()
+    half = population_size // 2 * 2
+
+    cases = {
+        "evaluate_fitness": lambda: evaluate_fitness(population[0], items, instance.capacity),
+        "evaluate_population": lambda: instance.evaluate_population(matrix),
+        "roulette_selection": lambda: roulette_selection(population, fitness_scores),
+        "roulette_selection_indices": lambda: roulette_selection_indices(fitness_scores, population_size, rng),
+        "tournament_selection": lambda: tournament_selection(population, fitness_scores, 5),
+        "tournament_selection_indices": lambda: tournament_selection_indices(fitness_scores, population_size, 5, rng),
+        "crossover_one_point": lambda: Crossover.one_point(population[0], population[1]),
+        "crossover_one_point_batch": lambda: Crossover.one_point_batch(matrix[0:half:2], matrix[1:half:2], rng),
+        "mutation_bit_flip": lambda: Mutation.bit_flip(population[0], 0.05),
+        "mutation_population_bit_flip": lambda: Mutation.population_bit_flip(matrix, 0.05, rng),
+        "create_population": lambda: create_population(items, size=population_size),
+    }
+    return [
+        {"name": name, "items": num_items, "population": population_size, **time_call(function, repeat)}
+        for name, function in cases.items()
+    ]
+
+
+def ga_benchmark(num_items, population_size, generations=GA_GENERATIONS, repeat=REPEAT,
+                 exact_time_limit=EXACT_TIME_LIMIT):
+    """
+    One seeded GA run with main.py's default settings, timed and scored
+    against the branch-and-bound optimum (or its proven upper bound when the
+    time limit stops the search first).
+    """
+    instance = make_instance(num_items)
+    config = GAConfig(population_size=population_size, generations=generations, seed=0)
+    runs = {}
+    timing = time_call(lambda: runs.update(result=GAEngine(instance, config).run()), repeat)
+    result = runs["result"]
+    reference = branch_and_bound(instance, time_limit=exact_time_limit)
+    return {
+        "name": "genetic_algorithm",
+        "items": num_items,
+        "population": population_size,
+        "generations": generations,
+        **timing,
+        "best_fitness": result.best_fitness,
+        "reference": reference.upper_bound,
+        "reference_optimal": reference.optimal,
+        "quality": result.best_fitness / reference.upper_bound if reference.upper_bound else 1.0,
+    }
+
+
+def run_suite(item_counts=ITEM_COUNTS, population_sizes=POPULATION_SIZES, generations=GA_GENERATIONS,
+              repeat=REPEAT, exact_time_limit=EXACT_TIME_LIMIT):
+    results = []
+    for num_items in item_counts:
+        for population_size in population_sizes:
+            print(f"Benchmarking {num_items} items x {population_size} individuals", file=sys.stderr)
+            results.extend(operator_benchmarks(num_items, population_size, repeat))
+            results.append(ga_benchmark(num_items, population_size, generations, repeat, exact_time_limit))
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def _key(record):
+    return record["name"], record["items"], record["population"]
+
+
+def compare(report, baseline, tolerance=TOLERANCE, quality_tolerance=QUALITY_TOLERANCE):
+    """
+    Regressions of `report` against `baseline`; cases missing from either side are ignored.
+    Timings are compared relative to the calibration workload when both
+    reports have it, so a machine that is slower as a whole does not fail the
+    run, and a slowdown must also exceed the larger noise of the two measurements.
+    Returns:
+        list of human-readable regression messages (empty when everything passes)
+    """
+    previous = {_key(record): record for record in baseline["results"]}
+    regressions = []
+    for record in report["results"]:
+        old = previous.get(_key(record))
+        if old is None:
+            continue
+        label = "{} (items={}, population={})".format(*_key(record))
+        measure = "relative" if "relative" in record and "relative" in old else "seconds"
+        noise = max(record.get("noise", 0.0), old.get("noise", 0.0))
+        if record[measure] > old[measure] * (1 + tolerance + noise):
+            regressions.append(f"{label}: {record['seconds']:.6f}s vs baseline {old['seconds']:.6f}s "
+                               f"({record[measure] / old[measure]:.2f}x by {measure} time)")
+        if "quality" in old and record["quality"] < old["quality"] - quality_tolerance:
+            regressions.append(f"{label}: quality {record['quality']:.4f} vs baseline {old['quality']:.4f}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time GA operators and runs across problem sizes.")
+    parser.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    parser.add_argument("--items", type=int, nargs="+", help=f"item counts (default: {ITEM_COUNTS})")
+    parser.add_argument("--populations", type=int, nargs="+", default=list(POPULATION_SIZES))
+    parser.add_argument("--quick", action="store_true", help=f"only item counts {QUICK_ITEM_COUNTS}")
+    parser.add_argument("--generations", type=int, default=GA_GENERATIONS)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--exact-time-limit", type=float, default=EXACT_TIME_LIMIT)
+    parser.add_argument("--baseline", help="baseline JSON report to compare against")
+    parser.add_argument("--save-baseline", help="also write this report as a new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--quality-tolerance", type=float, default=QUALITY_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    item_counts = args.items or (QUICK_ITEM_COUNTS if args.quick else ITEM_COUNTS)
+    report = run_suite(item_counts, args.populations, args.generations, args.repeat, args.exact_time_limit)
+
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        Path(args.output).write_text(text + "\n")
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(text + "\n")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(Path(args.baseline).read_text()), args.tolerance,
+                              args.quality_tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+import argparse
+import csv
+import json
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from itertools import groupby
+
+import numpy as np
+
+from ga.engine import GAConfig, GAEngine
+from ga.exact import branch_and_bound, dp_solve
+from ga.fitness import Item, KnapsackInstance
+
+BATCH_SOLVERS = ("ga", "dp", "bnb")
+INPUT_FORMATS = ("jsonl", "csv")
+# Instances submitted but not yet written, per worker; bounds memory on very large inputs
+PENDING_PER_WORKER = 2
+
+
+class BatchRecord:
+    __slots__ = ("index", "instance_id", "capacity", "values", "weights", "resources", "error")
+
+    def __init__(self, index, instance_id, capacity, values, weights, resources=None, error=None):
+        self.index = index
+        self.instance_id = instance_id
+        self.capacity = capacity
+        self.values = values
+        self.weights = weights
+        self.resources = resources  # per-item extra demands of multi-dimensional instances
+        self.error = error  # why the input could not be parsed; reported instead of solving
+
+    def instance(self):
+        resources = self.resources if self.resources is not None else [()] * len(self.values)
+        items = [Item(v, w, r) for v, w, r in zip(self.values, self.weights, resources)]
+        return KnapsackInstance(items, self.capacity)
+
+
+def _parse_item(item):
+    if isinstance(item, dict):
+        return item["value"], item["weight"], tuple(item.get("resources", ()))
+    if isinstance(item, (list, tuple)) and len(item) >= 2:
+        return item[0], item[1], tuple(item[2:])
+    raise ValueError("items must be [value, weight, ...] lists or {'value', 'weight'} objects")
+
+
+def read_jsonl(lines):
+    """
+    Stream instances from JSON lines, one instance per line:
+    {"id": "load-1", "capacity": 200, "items": [[value, weight], ...]}
+    Multi-dimensional instances give one capacity per constraint and list each
+    item's extra demands after its weight:
+    {"capacity": [200, 50], "items": [[value, weight, volume], ...]}
+    Blank lines are skipped and a missing id defaults to the record index.
+    A line that cannot be parsed still yields a record, with its error set.
+    Args:
+        lines: iterable of text lines (e.g. an open file)
+    Returns:
+        generator of BatchRecord
+    """
+    index = 0
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        data = None
+        try:
+            data = json.loads(line)
+            pairs = [_parse_item(item) for item in data["items"]]
+            capacity = data["capacity"]
+        except (KeyError, TypeError, ValueError) as error:
+            instance_id = data.get("id", index) if isinstance(data, dict) else index
+            yield BatchRecord(index, instance_id, None, [], [], error=f"Line {line_number}: invalid instance ({error}).")
+            index += 1
+            continue
+        values = [value for value, _, _ in pairs]
+        weights = [weight for _, weight, _ in pairs]
+        resources = [extra for _, _, extra in pairs]
+        resources = resources if isinstance(capacity, list) or any(resources) else None
+        yield BatchRecord(index, data.get("id", index), capacity, values, weights, resources)
+        index += 1
+
+
+def read_csv(lines):
+    """
+    Stream instances from CSV with one item per row and the columns
+    id,capacity,value,weight. Consecutive rows sharing an id form one instance;
+    an invalid row sets the error of its instance's record.
+    Args:
+        lines: iterable of text lines with a header row
+    Returns:
+        generator of BatchRecord
+    """
+    reader = csv.DictReader(lines)
+    missing = {"id", "capacity", "value", "weight"} - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"CSV input is missing columns: {', '.join(sorted(missing))}.")
+
+    for index, (instance_id, rows) in enumerate(groupby(reader, key=lambda row: row["id"])):
+        values, weights, capacity, error = [], [], None, None
+        for row in rows:
+            try:
+                capacity = int(row["capacity"])
+                values.append(int(row["value"]))
+                weights.append(int(row["weight"]))
+            except (TypeError, ValueError) as row_error:
+                error = error or f"Line {reader.line_num}: invalid item row ({row_error})."
+        yield BatchRecord(index, instance_id, capacity, values, weights, error=error)
+
+
+def read_instances(lines, input_format="jsonl"):
+    if input_format == "jsonl":
+        return read_jsonl(lines)
+    if input_format == "csv":
+        return read_csv(lines)
+    raise ValueError(f"Unknown input format '{input_format}'.")
+
+
+def instance_seed(seed, index):
+    """Independent GA seed for the instance at `index`; None keeps runs unseeded."""
+    if seed is None:
+        return None
+    return int(np.random.SeedSequence([seed, index]).generate_state(1, np.uint64)[0])
+
+
+def solve_record(record, solver="ga", config=None, time_limit=None):
+    """
+    Solve one instance and return its result row. Parse errors and any error
+    raised while building or solving the instance are reported in the row
+    instead of aborting the batch.
+    Args:
+        record: BatchRecord to solve
+        solver: "ga", "dp" or "bnb"
+        config: GAConfig for the "ga" solver; its seed is derived per instance
+        time_limit: seconds for "bnb" before it returns its incumbent
+    Returns:
+        dict with id, index, best_fitness, weight, selected items and elapsed seconds
+    """
+    start = time.perf_counter()
+    row = {"id": record.instance_id, "index": record.index, "solver": solver}
+    try:
+        if record.error is not None:
+            raise ValueError(record.error)
+        instance = record.instance()
+        if solver == "ga":
+            config = config if config is not None else GAConfig()
+            # Workers already run in parallel; a nested evaluation pool would oversubscribe
+            config = replace(config, seed=instance_seed(config.seed, record.index), parallel_workers=0, verbose=False)
+            result = GAEngine(instance, config).run()
+            solution, fitness = result.best_solution, result.best_fitness
+        elif solver == "bnb":
+            result = branch_and_bound(instance, time_limit=time_limit)
+            solution, fitness = result.best_solution, result.best_fitness
+            row["gap"] = result.gap
+        elif solver == "dp":
+            solution, fitness = dp_solve(instance)
+        else:
+            raise ValueError(f"Unknown solver backend '{solver}'.")
+
+        selected = [i for i, gene in enumerate(solution or ()) if gene]
+        row["best_fitness"] = fitness
+        row["weight"] = sum(record.weights[i] for i in selected)
+        row["selected"] = selected
+    except Exception as error:  # one bad instance must not end the stream
+        row["error"] = str(error)
+    row["elapsed"] = time.perf_counter() - start
+    return row
+
+
+def solve_stream(records, solver="ga", config=None, workers=0, time_limit=None):
+    """
+    Solve a stream of instances and yield each result row as soon as it
+    finishes, in completion order. At most PENDING_PER_WORKER instances per
+    worker are held in memory, so the input can be arbitrarily long.
+    Args:
+        records: iterable of BatchRecord
+        solver: "ga", "dp" or "bnb"
+        config: GAConfig for the "ga" solver
+        workers: worker processes; 0 solves in the calling process
+        time_limit: seconds per instance for "bnb"
+    Returns:
+        generator of result dicts (see solve_record)
+    """
+    if solver not in BATCH_SOLVERS:
+        raise ValueError(f"Unknown solver backend '{solver}'.")
+    if workers <= 0:
+        for record in records:
+            yield solve_record(record, solver, config, time_limit)
+        return
+
+    max_pending = workers * PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for record in records:
+            pending.add(executor.submit(solve_record, record, solver, config, time_limit))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run_batch(lines, output, input_format="jsonl", solver="ga", config=None, workers=0, time_limit=None):
+    """
+    Read instances from `lines`, solve them and write one JSON result per line
+    to `output`, flushing after each so partial results survive interruption.
+    Returns:
+        (solved, failed, total_elapsed) counts for the summary line
+    """
+    solved = failed = 0
+    total_elapsed = 0.0
+    for row in solve_stream(read_instances(lines, input_format), solver, config, workers, time_limit):
+        output.write(json.dumps(row) + "\n")
+        output.flush()
+        total_elapsed += row["elapsed"]
+        if "error" in row:
+            failed += 1
+        else:
+            solved += 1
+    return solved, failed, total_elapsed
+
+
+def parse_args(argv=None):
+    defaults = GAConfig()
+    parser = argparse.ArgumentParser(description="Solve a stream of knapsack instances.")
+    parser.add_argument("input", help="JSONL or CSV instance file, or '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL result file (default: stdout)")
+    parser.add_argument("--format", choices=INPUT_FORMATS, help="input format (default: from the file extension)")
+    parser.add_argument("--solver", choices=BATCH_SOLVERS, default="ga")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes; 0 solves serially")
+    parser.add_argument("--time-limit", type=float, default=None, help="seconds per instance for bnb")
+    parser.add_argument("--population-size", type=int, default=defaults.population_size)
+    parser.add_argument("--generations", type=int, default=defaults.generations)
+    parser.add_argument("--mutation-rate", type=float, default=defaults.mutation_rate)
+    parser.add_argument("--selection", default=defaults.selection)
+    parser.add_argument("--crossover", default=defaults.crossover)
+    parser.add_argument("--seeding", default=defaults.seeding)
+    parser.add_argument("--repair", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    config = GAConfig(
+        population_size=args.population_size,
+        generations=args.generations,
+        mutation_rate=args.mutation_rate,
+        selection=args.selection,
+        crossover=args.crossover,
+        seeding=args.seeding,
+        repair=args.repair,
+        seed=args.seed,
+    )
+    input_format = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        solved, failed, total_elapsed = run_batch(
+            source, output, input_format, args.solver, config, args.workers, args.time_limit
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Solved {solved} instances ({failed} failed) in {total_elapsed:.2f}s of solver time", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
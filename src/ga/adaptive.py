@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+
+from ga.stopping import population_diversity
+
+ADAPTIVE_MUTATION_MODES = ("fixed", "one_fifth", "self_adaptive")
+# 1/5th success rule: target share of children that beat their better parent, and the step applied per generation
+TARGET_SUCCESS_RATE = 0.2
+ONE_FIFTH_FACTOR = 0.85
+# Log-normal learning rate of self-adaptive per-individual mutation rates
+LEARNING_RATE = 0.22
+MAX_MUTATION_RATE = 0.5
+
+
+class ParameterControl:
+    """
+    Adaptive mutation rate and tournament size for one GA run, updated once
+    per generation from the offspring success rate and population diversity.
+
+    Mutation modes:
+        "fixed": config.mutation_rate throughout
+        "one_fifth": one rate for the whole population, raised when more than
+            1/5 of the children beat their better parent and lowered otherwise
+        "self_adaptive": every individual carries its own rate; children inherit
+            the geometric mean of their parents' rates with log-normal noise, so
+            selection favours rates that produce fit offspring
+    With adaptive_tournament, the tournament size grows from config.tournament_size
+    to config.max_tournament_size as diversity falls from its initial value.
+    Args:
+        config: GAConfig of the run
+        num_items: genome length (the minimum mutation rate is 1 / num_items)
+    """
+
+    def __init__(self, config, num_items):
+        self.mode = config.adaptive_mutation
+        self.adaptive_tournament = config.adaptive_tournament
+        self.min_tournament_size = config.tournament_size
+        self.max_tournament_size = config.max_tournament_size
+        self.min_rate = min(1 / max(num_items, 1), config.mutation_rate)
+        self.max_rate = max(MAX_MUTATION_RATE, config.mutation_rate)
+        self.mutation_rate = config.mutation_rate
+        self.tournament_size = config.tournament_size
+        self.rates = None  # per-individual rates ("self_adaptive")
+        self.parent_fitness = None  # better parent's fitness for each row of the current population
+        self.reference_diversity = None
+        self.success_rate = None
+        self.diversity = None
+
+    def clip(self, rates):
+        return np.clip(rates, self.min_rate, self.max_rate)
+
+    def initial_rates(self, size, rng):
+        """Per-individual rates of the initial population, spread log-normally around config.mutation_rate."""
+        if self.mode == "self_adaptive":
+            self.rates = self.clip(self.mutation_rate * np.exp(LEARNING_RATE * rng.standard_normal(size)))
+
+    def offspring(self, fitness_scores, elite_indices, parent_indices, population_size, rng):
+        """
+        Record the parents of the next population (elites first, then children of
+        consecutive parent pairs) and return the children's mutation rates when
+        they are self-adaptive.
+        Returns:
+            per-child rates, or None when all children share mutation_rate
+        """
+        fitness_scores = np.asarray(fitness_scores, dtype=np.float64)
+        parents1, parents2 = parent_indices[0::2], parent_indices[1::2]
+        better_parent = np.repeat(np.maximum(fitness_scores[parents1], fitness_scores[parents2]), 2)
+        elites = np.full(len(elite_indices), np.nan)  # elites are copies, not offspring
+        self.parent_fitness = np.concatenate((elites, better_parent))[:population_size]
+
+        if self.mode != "self_adaptive":
+            return None
+        inherited = np.repeat(np.sqrt(self.rates[parents1] * self.rates[parents2]), 2)
+        child_rates = self.clip(inherited * np.exp(LEARNING_RATE * rng.standard_normal(len(inherited))))
+        self.rates = np.concatenate((self.rates[elite_indices], child_rates))[:population_size]
+        return child_rates
+
+    def update(self, fitness_scores, population=None):
+        """
+        Adapt the parameters after a generation has been evaluated.
+        Args:
+            fitness_scores: fitness of the current population
+            population: current population (only read with adaptive_tournament)
+        Returns:
+            dict of the decisions taken, for logging
+        """
+        decisions = {}
+        if self.parent_fitness is not None:
+            children = ~np.isnan(self.parent_fitness)
+            if children.any():
+                improved = np.asarray(fitness_scores, dtype=np.float64)[children] > self.parent_fitness[children]
+                self.success_rate = float(improved.mean())
+                decisions["success_rate"] = self.success_rate
+
+        if self.mode == "one_fifth" and self.success_rate is not None:
+            factor = 1 / ONE_FIFTH_FACTOR if self.success_rate > TARGET_SUCCESS_RATE else ONE_FIFTH_FACTOR
+            self.mutation_rate = float(self.clip(self.mutation_rate * factor))
+        elif self.mode == "self_adaptive":
+            self.mutation_rate = float(np.exp(np.log(self.rates).mean()))
+        if self.mode != "fixed":
+            decisions["mutation_rate"] = self.mutation_rate
+
+        if self.adaptive_tournament and population is not None:
+            self.diversity = population_diversity(population)
+            if self.reference_diversity is None:
+                self.reference_diversity = self.diversity
+            ratio = min(self.diversity / self.reference_diversity, 1.0) if self.reference_diversity > 0 else 0.0
+            span = self.max_tournament_size - self.min_tournament_size
+            self.tournament_size = self.min_tournament_size + int(math.floor(span * (1 - ratio) + 0.5))
+            decisions["diversity"] = self.diversity
+            decisions["tournament_size"] = self.tournament_size
+        return decisions
+
+    def state(self):
+        """Scalar state for checkpoints; per-individual rates are saved separately."""
+        return {
+            "mutation_rate": self.mutation_rate,
+            "tournament_size": self.tournament_size,
+            "reference_diversity": self.reference_diversity,
+            "success_rate": self.success_rate,
+        }
+
+    def restore(self, state, rates=None):
+        self.mutation_rate = state["mutation_rate"]
+        self.tournament_size = state["tournament_size"]
+        self.reference_diversity = state["reference_diversity"]
+        self.success_rate = state["success_rate"]
+        self.rates = None if rates is None else np.asarray(rates, dtype=np.float64)
+        self.parent_fitness = None
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from hashlib import blake2b
+
+import numpy as np
+
+from ga.genome import BIT_ORDER
+
+KEY_SIZE = 16  # bytes of blake2b digest per genome
+ENTRY_OVERHEAD_BYTES = 160  # approximate cost of one OrderedDict entry with its key and score
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of fitness scores keyed by a compact genome hash.
+    A cache is only valid for one problem instance and capacity.
+    Args:
+        max_entries: maximum number of cached genomes
+        max_bytes: optional approximate memory limit; the tighter of the two limits wins
+    """
+
+    def __init__(self, max_entries=100_000, max_bytes=None):
+        if max_bytes is not None:
+            max_entries = min(max_entries, max_bytes // ENTRY_OVERHEAD_BYTES)
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry.")
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._scores = OrderedDict()
+
+    def __len__(self):
+        return len(self._scores)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @staticmethod
+    def key(genome):
+        """Hash a binary genome (list or array of 0/1 genes); rows that are already packed go to packed_key."""
+        genome = np.asarray(genome, dtype=np.uint8)
+        return blake2b(np.packbits(genome, bitorder=BIT_ORDER).tobytes(), digest_size=KEY_SIZE).digest()
+
+    @staticmethod
+    def packed_key(packed):
+        """Hash a bit-packed genome row (see ga.genome); equals key() of the unpacked genome."""
+        return blake2b(np.ascontiguousarray(packed).tobytes(), digest_size=KEY_SIZE).digest()
+
+    def get(self, key):
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._scores.move_to_end(key)
+        return score
+
+    def put(self, key, score):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self.max_entries:
+            self._scores.popitem(last=False)
+
+    def clear(self):
+        self._scores.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate_population(self, population, evaluate):
+        """
+        Score a population, evaluating only genomes that are not cached.
+        Args:
+            population: 2-D binary matrix, one row per individual
+            evaluate: function scoring a 2-D matrix of rows (e.g. KnapsackInstance.evaluate_population)
+        Returns:
+            list of scores in population order
+        """
+        population = np.asarray(population, dtype=np.uint8)
+        packed = np.packbits(population, axis=1, bitorder=BIT_ORDER)
+        keys = [self.packed_key(row) for row in packed]
+
+        scores = []
+        pending = {}  # key -> rows with that genome, so duplicates are evaluated once
+        for index, key in enumerate(keys):
+            score = self._scores.get(key)
+            if score is None:
+                pending.setdefault(key, []).append(index)
+            else:
+                self._scores.move_to_end(key)
+            scores.append(score)
+
+        self.misses += len(pending)
+        self.hits += len(keys) - len(pending)
+
+        if pending:
+            first_rows = [indices[0] for indices in pending.values()]
+            for (key, indices), score in zip(pending.items(), evaluate(population[first_rows]).tolist()):
+                self.put(key, score)
+                for index in indices:
+                    scores[index] = score
+
+        return scores
@@ -0,0 +1,108 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from ga.genome import pack_individual, pack_population, unpack_individual, unpack_population
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class Checkpoint:
+    """
+    Everything needed to continue a GA run after `generation`: the evaluated
+    population and its fitness, the run's result so far, and the exact state
+    of the random generators and stop criteria before the next generation is bred.
+    """
+    generation: int
+    population: np.ndarray  # (population size x items) uint8 gene matrix
+    fitness_scores: List[float]
+    best_solution: Optional[List[int]]
+    best_fitness: float
+    best_fitness_history: List[float] = field(default_factory=list)
+    avg_fitness_history: List[float] = field(default_factory=list)
+    rng_state: dict = field(default_factory=dict)  # numpy BitGenerator.state
+    random_state: tuple = ()  # random.Random.getstate()
+    stopping_state: dict = field(default_factory=dict)  # EarlyStopping.state()
+    control_state: dict = field(default_factory=dict)  # ParameterControl.state(), when adaptive
+    mutation_rates: Optional[np.ndarray] = None  # self-adaptive per-individual rates
+
+
+def save_checkpoint(path, checkpoint):
+    """
+    Write a checkpoint as an uncompressed .npz archive: the population is stored
+    packed (1 bit per gene) and the histories as contiguous arrays, with the
+    small scalar state in a JSON header. The file is written next to `path`
+    and renamed over it, so a preempted write never leaves a torn checkpoint.
+    Args:
+        path: checkpoint file path
+        checkpoint: Checkpoint to save
+    """
+    num_items = checkpoint.population.shape[1]
+    random_version, random_internal, random_gauss = checkpoint.random_state
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "generation": checkpoint.generation,
+        "num_items": num_items,
+        "best_fitness": checkpoint.best_fitness,
+        "has_best_solution": checkpoint.best_solution is not None,
+        "rng_state": checkpoint.rng_state,
+        "random_version": random_version,
+        "random_gauss": random_gauss,
+        "stopping_state": checkpoint.stopping_state,
+        "control_state": checkpoint.control_state,
+    }
+    arrays = {}
+    if checkpoint.mutation_rates is not None:
+        arrays["mutation_rates"] = np.asarray(checkpoint.mutation_rates, dtype=np.float64)
+    best_solution = checkpoint.best_solution if checkpoint.best_solution is not None else [0] * num_items
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        np.savez(
+            file,
+            header=np.array(json.dumps(header)),
+            population=pack_population(checkpoint.population),
+            fitness_scores=np.asarray(checkpoint.fitness_scores),
+            best_solution=pack_individual(best_solution),
+            best_fitness_history=np.asarray(checkpoint.best_fitness_history),
+            avg_fitness_history=np.asarray(checkpoint.avg_fitness_history, dtype=np.float64),
+            random_internal=np.asarray(random_internal, dtype=np.uint32),
+            **arrays,
+        )
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint written by save_checkpoint.
+    Returns:
+        Checkpoint
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        header = json.loads(archive["header"].item())
+        if header["version"] != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {header['version']}.")
+        num_items = header["num_items"]
+        best_solution = None
+        if header["has_best_solution"]:
+            best_solution = unpack_individual(archive["best_solution"], num_items)
+        return Checkpoint(
+            generation=header["generation"],
+            population=unpack_population(archive["population"], num_items),
+            fitness_scores=archive["fitness_scores"].tolist(),
+            best_solution=best_solution,
+            best_fitness=header["best_fitness"],
+            best_fitness_history=archive["best_fitness_history"].tolist(),
+            avg_fitness_history=archive["avg_fitness_history"].tolist(),
+            rng_state=header["rng_state"],
+            random_state=(header["random_version"], tuple(archive["random_internal"].tolist()), header["random_gauss"]),
+            stopping_state=header["stopping_state"],
+            control_state=header.get("control_state", {}),
+            mutation_rates=archive["mutation_rates"] if "mutation_rates" in archive.files else None,
+        )
@@ -1,6 +1,68 @@
 import random
 from typing import List, Tuple
 
+import numpy as np
+
+from ga.genome import gene_mask, pack_population, packed_length, suffix_masks
+
+CROSSOVER_STRATEGIES = ("one_point", "two_point", "k_point", "uniform")
+# Above this many cut points the packed mask is built unpacked and packed once, instead of one XOR per cut
+PACKED_MASK_MAX_POINTS = 8
+
+def _apply_mask(parents1, parents2, mask):
+    # Genes where the mask is set are swapped between the two parents
+    parents1 = np.asarray(parents1, dtype=np.uint8)
+    parents2 = np.asarray(parents2, dtype=np.uint8)
+    swap = (parents1 ^ parents2) & mask
+    return parents1 ^ swap, parents2 ^ swap
+
+
+def _distinct_cuts(num_pairs, num_items, points, rng):
+    # `points` distinct sorted cut points per row in [1, num_items - 1]; rows with a repeat are redrawn
+    if 2 * points > num_items - 1:  # dense cuts: a partial shuffle of every position is cheaper than redrawing
+        return np.sort(np.argpartition(rng.random((num_pairs, num_items - 1)), points - 1, axis=1)[:, :points] + 1)
+    cuts = np.sort(rng.integers(1, num_items, (num_pairs, points)), axis=1)
+    repeated = np.flatnonzero((np.diff(cuts, axis=1) == 0).any(axis=1))
+    while len(repeated):
+        cuts[repeated] = np.sort(rng.integers(1, num_items, (len(repeated), points)), axis=1)
+        repeated = repeated[(np.diff(cuts[repeated], axis=1) == 0).any(axis=1)]
+    return cuts
+
+
+def _cut_points(num_pairs, num_items, points, rng):
+    # (num_pairs, points) cut points in [1, num_items - 1], distinct and sorted per row
+    if points == 1:
+        return rng.integers(1, num_items, (num_pairs, 1))
+    return _distinct_cuts(num_pairs, num_items, points, rng)
+
+
+def _cut_mask(num_pairs, num_items, points, rng):
+    # Each row toggles between parents at `points` distinct cut points in [1, num_items - 1]
+    points = min(points, num_items - 1)
+    if points < 1 or num_pairs == 0:
+        return np.zeros((num_pairs, num_items), dtype=np.uint8)
+    cuts = _cut_points(num_pairs, num_items, points, rng)
+    if points == 1:
+        return (np.arange(num_items) >= cuts).view(np.uint8)
+    toggles = np.zeros((num_pairs, num_items), dtype=np.uint8)
+    toggles[np.arange(num_pairs)[:, None], cuts] = 1
+    # Parity of the toggles seen so far (uint8 wraps at 256, which keeps the parity)
+    return np.cumsum(toggles, axis=1, dtype=np.uint8) & 1
+
+
+def _packed_cut_mask(num_pairs, num_items, points, rng):
+    # Packed _cut_mask from the same cut points: the XOR of one suffix mask per cut
+    points = min(points, num_items - 1)
+    if points > PACKED_MASK_MAX_POINTS:
+        return pack_population(_cut_mask(num_pairs, num_items, points, rng))
+    mask = np.zeros((num_pairs, packed_length(num_items)), dtype=np.uint8)
+    if points < 1 or num_pairs == 0:
+        return mask
+    for cuts in _cut_points(num_pairs, num_items, points, rng).T:
+        mask ^= suffix_masks(cuts, num_items)
+    return mask
+
+
 class Crossover:
     @staticmethod
     def one_point(parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
@@ -9,3 +71,133 @@ class Crossover:
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
         return child1, child2
+
+    @staticmethod
+    def k_point(parent1: List[int], parent2: List[int], points: int) -> Tuple[List[int], List[int]]:
+        """k-point crossover for binary individuals: the children swap every other segment between cuts."""
+        points = min(points, len(parent1) - 1)
+        if points < 1:
+            return parent1[:], parent2[:]
+        cuts = sorted(random.sample(range(1, len(parent1)), points)) + [len(parent1)]
+        child1, child2 = [], []
+        start, swapped = 0, False
+        for cut in cuts:
+            source1, source2 = (parent2, parent1) if swapped else (parent1, parent2)
+            child1 += source1[start:cut]
+            child2 += source2[start:cut]
+            start, swapped = cut, not swapped
+        return child1, child2
+
+    @staticmethod
+    def uniform(parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
+        """Uniform crossover for binary individuals: every gene comes from either parent with equal probability."""
+        picks = [random.random() < 0.5 for _ in parent1]
+        child1 = [gene2 if pick else gene1 for gene1, gene2, pick in zip(parent1, parent2, picks)]
+        child2 = [gene1 if pick else gene2 for gene1, gene2, pick in zip(parent1, parent2, picks)]
+        return child1, child2
+
+    @staticmethod
+    def pair(strategy, parent1, parent2, crossover_rate=1.0, points=3):
+        """
+        Crossover of one pair of list individuals with the `random` module, the
+        per-pair counterpart of Crossover.batch.
+        Args:
+            strategy: one of CROSSOVER_STRATEGIES
+            parent1, parent2: binary lists
+            crossover_rate: probability that the pair is crossed; otherwise copies are returned
+            points: cut points for the "k_point" strategy
+        Returns:
+            (child1, child2)
+        """
+        if strategy not in CROSSOVER_STRATEGIES:
+            raise ValueError(f"Unknown crossover strategy '{strategy}'. Use one of {CROSSOVER_STRATEGIES}.")
+        if crossover_rate < 1 and random.random() >= crossover_rate:
+            return parent1[:], parent2[:]
+        if strategy == "one_point":
+            return Crossover.one_point(parent1, parent2)
+        if strategy == "uniform":
+            return Crossover.uniform(parent1, parent2)
+        return Crossover.k_point(parent1, parent2, 2 if strategy == "two_point" else points)
+
+    @staticmethod
+    def k_point_batch(parents1, parents2, points, rng=None):
+        """k-point crossover for every pair of rows of two (M, N) parent matrices at once."""
+        rng = rng if rng is not None else np.random.default_rng()
+        num_pairs, num_items = np.shape(parents1)
+        return _apply_mask(parents1, parents2, _cut_mask(num_pairs, num_items, points, rng))
+
+    @staticmethod
+    def one_point_batch(parents1, parents2, rng=None):
+        """One-point crossover for every pair of rows of two (M, N) parent matrices at once."""
+        return Crossover.k_point_batch(parents1, parents2, 1, rng)
+
+    @staticmethod
+    def two_point_batch(parents1, parents2, rng=None):
+        """Two-point crossover for every pair of rows of two (M, N) parent matrices at once."""
+        return Crossover.k_point_batch(parents1, parents2, 2, rng)
+
+    @staticmethod
+    def uniform_batch(parents1, parents2, rng=None):
+        """Uniform crossover: every gene comes from either parent with equal probability."""
+        rng = rng if rng is not None else np.random.default_rng()
+        mask = rng.integers(0, 2, size=np.shape(parents1), dtype=np.uint8)
+        return _apply_mask(parents1, parents2, mask)
+
+    @staticmethod
+    def batch(strategy, parents1, parents2, crossover_rate=1.0, points=3, rng=None):
+        """
+        Batched crossover over the parent matrices of a whole generation.
+        Args:
+            strategy: one of CROSSOVER_STRATEGIES
+            parents1, parents2: (M, N) binary matrices, row i of each forms a pair
+            crossover_rate: probability that a pair is crossed; other pairs are copied unchanged
+            points: cut points for the "k_point" strategy
+            rng: numpy Generator (a fresh one is used if omitted)
+        Returns:
+            (children1, children2) as (M, N) uint8 matrices
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        if strategy == "uniform":
+            children1, children2 = Crossover.uniform_batch(parents1, parents2, rng)
+        elif strategy in ("one_point", "two_point", "k_point"):
+            points = {"one_point": 1, "two_point": 2}.get(strategy, points)
+            children1, children2 = Crossover.k_point_batch(parents1, parents2, points, rng)
+        else:
+            raise ValueError(f"Unknown crossover strategy '{strategy}'. Use one of {CROSSOVER_STRATEGIES}.")
+
+        if crossover_rate < 1:
+            skipped = rng.random(len(children1)) >= crossover_rate
+            children1[skipped] = np.asarray(parents1, dtype=np.uint8)[skipped]
+            children2[skipped] = np.asarray(parents2, dtype=np.uint8)[skipped]
+        return children1, children2
+
+    @staticmethod
+    def batch_packed(strategy, parents1, parents2, num_items, crossover_rate=1.0, points=3, rng=None):
+        """
+        Crossover.batch on bit-packed parent rows (see ga.genome): the children
+        are parents1 ^ ((parents1 ^ parents2) & mask), with the mask built
+        packed, so genes are never unpacked. Cut-point strategies draw the same
+        random numbers as Crossover.batch and give the same children packed.
+        Args:
+            strategy: one of CROSSOVER_STRATEGIES
+            parents1, parents2: (M, ceil(N/8)) packed matrices, row i of each forms a pair
+            num_items: genome length N
+            crossover_rate: probability that a pair is crossed; other pairs are copied unchanged
+            points: cut points for the "k_point" strategy
+            rng: numpy Generator (a fresh one is used if omitted)
+        Returns:
+            (children1, children2) as packed uint8 matrices
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        num_pairs = len(parents1)
+        if strategy == "uniform":
+            mask = rng.integers(0, 256, (num_pairs, packed_length(num_items)), dtype=np.uint8) & gene_mask(num_items)
+        elif strategy in ("one_point", "two_point", "k_point"):
+            points = {"one_point": 1, "two_point": 2}.get(strategy, points)
+            mask = _packed_cut_mask(num_pairs, num_items, points, rng)
+        else:
+            raise ValueError(f"Unknown crossover strategy '{strategy}'. Use one of {CROSSOVER_STRATEGIES}.")
+
+        if crossover_rate < 1:
+            mask[rng.random(num_pairs) >= crossover_rate] = 0
+        return _apply_mask(parents1, parents2, mask)
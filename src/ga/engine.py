@@ -0,0 +1,524 @@
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from ga.adaptive import ADAPTIVE_MUTATION_MODES, ParameterControl
+from ga.cache import FitnessCache
+from ga.checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from ga.crossover import Crossover, CROSSOVER_STRATEGIES
+from ga.exact import dp_solve
+from ga.incremental import IncrementalEvaluator
+from ga.genome import pack_population, unpack_population
+from ga.mapped import BLOCK_BYTES, MappedStorage, PackedPopulation, PackedStorage
+from ga.instrumentation import count_unique, GenerationStats, NULL_TIMER, PhaseTimer, ProgressPrinter
+from ga.mutation import Mutation
+from ga.parallel import ParallelEvaluator
+from ga.population import POPULATION_SIZE, seeded_individuals, SEEDING_MODES
+from ga.repair import repair_population
+from ga.selection import roulette_selection_indices, tournament_selection_indices
+from ga.stopping import EarlyStopping
+
+SELECTION_STRATEGIES = ("roulette", "tournament")
+STORAGE_MODES = ("memory", "packed", "mmap")
+
+
+@dataclass
+class GAConfig:
+    """Parameters of one GA run. Defaults match the demonstration settings in main.py."""
+    population_size: int = POPULATION_SIZE
+    generations: int = 200
+    mutation_rate: float = 0.05
+    tournament_size: int = 5  # starting (minimum) size when adaptive_tournament is set
+    elitism_size: int = 5
+    selection: str = "roulette"  # "roulette" or "tournament"
+    crossover: str = "one_point"  # "one_point", "two_point", "k_point" or "uniform"
+    crossover_rate: float = 1.0
+    crossover_points: int = 3  # cut points for "k_point"
+    seeding: str = "random"  # "random", "greedy" or "randomized_greedy"
+    seed_with_exact: bool = False  # insert the exact DP optimum into the initial population
+    repair: bool = False
+    penalty_fitness: bool = False
+    fitness_cache_size: int = 0  # 0 disables the fitness cache
+    incremental: bool = False  # delta evaluation of children (one-point crossover only)
+    parallel_workers: int = 0  # 0 keeps evaluation in-process
+    stall_generations: int = 0  # stop after this many generations without improvement; 0 disables
+    target_fitness: Optional[float] = None  # stop once the best fitness reaches this value
+    stop_at_bound: bool = False  # stop once the best fitness reaches the Dantzig upper bound
+    time_budget: Optional[float] = None  # wall-clock seconds for the whole run
+    min_diversity: float = 0.0  # stop once population diversity falls below this; 0 disables
+    checkpoint_path: Optional[str] = None  # file saved every checkpoint_interval generations; None disables
+    checkpoint_interval: int = 100
+    storage: str = "memory"  # "memory", "packed" (1 bit per gene in memory) or "mmap" (packed, on disk)
+    storage_dir: Optional[str] = None  # directory for "mmap" storage; defaults to a temporary directory
+    block_bytes: int = BLOCK_BYTES  # "packed"/"mmap" working set: unpacked genes processed per row block
+    adaptive_mutation: str = "fixed"  # "fixed", "one_fifth" or "self_adaptive" (see ga.adaptive)
+    adaptive_tournament: bool = False  # raise the tournament size as population diversity falls
+    max_tournament_size: int = 10
+    seed: Optional[int] = None
+    verbose: bool = False  # attach a ProgressPrinter (best/average fitness every 10 generations)
+
+    def __post_init__(self):
+        if self.population_size < 1:
+            raise ValueError("Population size must be positive.")
+        if self.selection not in SELECTION_STRATEGIES:
+            raise ValueError(f"Unknown selection strategy '{self.selection}'.")
+        if self.crossover not in CROSSOVER_STRATEGIES:
+            raise ValueError(f"Unknown crossover strategy '{self.crossover}'.")
+        if self.seeding not in SEEDING_MODES:
+            raise ValueError(f"Unknown seeding mode '{self.seeding}'.")
+        if self.incremental and self.crossover != "one_point":
+            raise ValueError("Incremental evaluation only supports one-point crossover.")
+        if self.incremental and (self.repair or self.penalty_fitness):
+            raise ValueError("Incremental evaluation does not support repair or penalty fitness.")
+        if self.incremental and (self.fitness_cache_size or self.parallel_workers):
+            raise ValueError("Incremental evaluation does not support the fitness cache or parallel workers.")
+        if self.stall_generations < 0:
+            raise ValueError("Stall generations must not be negative.")
+        if self.time_budget is not None and self.time_budget < 0:
+            raise ValueError("Time budget must not be negative.")
+        if self.checkpoint_interval < 1:
+            raise ValueError("Checkpoint interval must be positive.")
+        if self.adaptive_mutation not in ADAPTIVE_MUTATION_MODES:
+            raise ValueError(f"Unknown adaptive mutation mode '{self.adaptive_mutation}'.")
+        if self.adaptive_mutation == "self_adaptive" and self.incremental:
+            raise ValueError("Incremental evaluation does not support self-adaptive mutation rates.")
+        if self.adaptive_tournament and self.selection != "tournament":
+            raise ValueError("Adaptive tournament size requires tournament selection.")
+        if self.adaptive_tournament and self.max_tournament_size < self.tournament_size:
+            raise ValueError("Maximum tournament size must not be below the tournament size.")
+        if self.storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode '{self.storage}'.")
+        if self.storage != "memory" and (self.incremental or self.fitness_cache_size or self.parallel_workers
+                                         or self.checkpoint_path):
+            raise ValueError(
+                "Packed and memory-mapped storage do not support incremental evaluation, the fitness cache, "
+                "parallel workers or checkpoints."
+            )
+
+
+@dataclass
+class GAResult:
+    best_solution: Optional[List[int]]
+    best_fitness: float
+    best_fitness_history: List[float] = field(default_factory=list)
+    avg_fitness_history: List[float] = field(default_factory=list)
+    stop_reason: str = "generations"  # one of ga.stopping.STOP_REASONS
+
+    @property
+    def generations_run(self):
+        return len(self.best_fitness_history)
+
+    def results(self):
+        """(best_solution, best_fitness, best_fitness_history, avg_fitness_history), as display_results expects."""
+        return self.best_solution, self.best_fitness, self.best_fitness_history, self.avg_fitness_history
+
+
+class Improvement(NamedTuple):
+    """A new incumbent, as yielded by GAEngine.anytime; elapsed is seconds since the run started."""
+    generation: int
+    best_solution: List[int]
+    best_fitness: float
+    elapsed: float
+
+
+class GAEngine:
+    """
+    Genetic algorithm for one knapsack instance. The engine owns its instance,
+    parameters and random generators and never touches module-level state, so
+    several engines can run side by side in threads or worker processes.
+    Args:
+        instance: KnapsackInstance being solved
+        config: GAConfig (defaults to GAConfig())
+        sinks: EventSinks receiving per-generation statistics; without any,
+            no statistics are gathered and phases are not timed
+    """
+
+    def __init__(self, instance, config=None, sinks=()):
+        self.instance = instance
+        self.config = config if config is not None else GAConfig()
+        self.sinks = list(sinks)
+        if self.config.verbose:
+            self.sinks.append(ProgressPrinter())
+        numpy_seed, python_seed = np.random.SeedSequence(self.config.seed).spawn(2)
+        self.rng = np.random.default_rng(numpy_seed)
+        self.random = random.Random(int(python_seed.generate_state(1)[0]))
+        self.cache = FitnessCache(self.config.fitness_cache_size) if self.config.fitness_cache_size > 0 else None
+        self.evaluator = IncrementalEvaluator(instance) if self.config.incremental else None
+        self.storage = None
+        adaptive = self.config.adaptive_mutation != "fixed" or self.config.adaptive_tournament
+        self.control = ParameterControl(self.config, len(instance)) if adaptive else None
+
+    @property
+    def mutation_rate(self):
+        return self.control.mutation_rate if self.control is not None else self.config.mutation_rate
+
+    @property
+    def tournament_size(self):
+        return self.control.tournament_size if self.control is not None else self.config.tournament_size
+
+    def create_individuals(self, size, individuals=None):
+        """
+        Gene matrix of `size` new individuals, seeded according to config.seeding.
+        Args:
+            size: number of rows
+            individuals: seeded_individuals stream to continue, when a population is built in blocks
+        """
+        if self.config.seeding == "random":
+            return self.rng.integers(0, 2, (size, len(self.instance)), dtype=np.uint8)
+        if individuals is None:
+            individuals = seeded_individuals(self.instance, self.config.seeding, self.random)
+        # Filled row by row, so only one individual is ever held as a list of ints
+        genes = np.empty((size, len(self.instance)), dtype=np.uint8)
+        for row, individual in zip(range(size), individuals):
+            genes[row] = individual
+        return genes
+
+    def initial_population(self):
+        config = self.config
+        if config.storage == "mmap":
+            self.storage = MappedStorage(config.population_size, len(self.instance), config.block_bytes,
+                                         config.storage_dir)
+        elif config.storage == "packed":
+            self.storage = PackedStorage(config.population_size, len(self.instance), config.block_bytes)
+        if self.storage is not None:
+            population = self.storage.current
+            individuals = seeded_individuals(self.instance, config.seeding, self.random)
+            for start, stop in population.blocks():
+                population.write(start, self.create_individuals(stop - start, individuals))
+            if config.seed_with_exact:
+                population.write(0, [dp_solve(self.instance)[0]])
+            return population
+
+        population = self.create_individuals(config.population_size)
+        if config.seed_with_exact:
+            population[0] = dp_solve(self.instance)[0]
+
+        if self.evaluator is not None:
+            return [self.evaluator.track(individual) for individual in population]
+        return population
+
+    def genes(self, population):
+        """Population as a gene matrix, whether or not individuals are tracked."""
+        if self.evaluator is not None:
+            return np.array([individual.genes for individual in population], dtype=np.uint8)
+        return population
+
+    def evaluate(self, population, pool=None):
+        """Fitness scores of a population, as a list."""
+        if self.evaluator is not None:
+            return [self.evaluator.fitness(individual) for individual in population]
+        if isinstance(population, PackedPopulation):
+            return population.evaluate(self.instance)
+
+        evaluate = pool.evaluate_population if pool is not None else self.instance.evaluate_population
+        if self.cache is not None:
+            return self.cache.evaluate_population(population, evaluate)
+        return evaluate(population).tolist()
+
+    def select_parents(self, population, fitness_scores, num_parents):
+        config = self.config
+        if config.penalty_fitness and isinstance(population, PackedPopulation):
+            fitness_scores = population.evaluate(self.instance, penalized=True)
+        elif config.penalty_fitness:
+            fitness_scores = self.instance.evaluate_population_penalized(population).tolist()
+
+        if config.selection == "tournament":
+            return tournament_selection_indices(fitness_scores, num_parents, self.tournament_size, self.rng)
+        if sum(fitness_scores) > 0:
+            return roulette_selection_indices(fitness_scores, num_parents, self.rng)
+        # Fallback to random selection if all fitness scores are 0
+        return self.rng.integers(0, len(population), num_parents)
+
+    def next_generation(self, population, fitness_scores, timer=NULL_TIMER):
+        """Elitism, selection, crossover and mutation: the population of the next generation."""
+        config = self.config
+        timer.start()
+
+        # Elitism: keep best individuals
+        sorted_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)
+        elite_indices = sorted_indices[:config.elitism_size]
+        timer.lap("elitism")
+
+        num_parents = 2 * -(-max(config.population_size - len(elite_indices), 0) // 2)
+        parent_indices = self.select_parents(population, fitness_scores, num_parents)
+        child_rates = None
+        if self.control is not None:
+            child_rates = self.control.offspring(
+                fitness_scores, elite_indices, parent_indices, config.population_size, self.rng
+            )
+        timer.lap("selection")
+
+        if self.evaluator is not None:
+            new_population = [population[i].copy() for i in elite_indices]
+            for parent1, parent2 in zip(parent_indices[0::2], parent_indices[1::2]):
+                if config.crossover_rate < 1 and self.rng.random() >= config.crossover_rate:
+                    child1, child2 = population[parent1].copy(), population[parent2].copy()
+                else:
+                    # Delta evaluation: children inherit their totals from the parents
+                    point = int(self.rng.integers(1, len(self.instance))) if len(self.instance) > 1 else 1
+                    child1, child2 = self.evaluator.one_point(population[parent1], population[parent2], point)
+                timer.lap("crossover")
+                new_population.append(self.evaluator.bit_flip(child1, self.mutation_rate, self.rng))
+                new_population.append(self.evaluator.bit_flip(child2, self.mutation_rate, self.rng))
+                timer.lap("mutation")
+            return new_population[:config.population_size]
+
+        if isinstance(population, PackedPopulation):
+            # Breed packed parent rows block by block into the spare population; genes are only unpacked for repair
+            target = self.storage.spare
+            target.array[:len(elite_indices)] = population.array[elite_indices]
+            num_children = config.population_size - len(elite_indices)
+            for start in range(0, num_children, population.rows):
+                pairs = parent_indices[start:start + population.rows]
+                rates = child_rates[start:start + len(pairs)] if child_rates is not None else None
+                children = self.breed_packed(population.array[pairs[0::2]], population.array[pairs[1::2]], timer, rates)
+                children = children[:num_children - start]
+                offset = len(elite_indices) + start
+                target.array[offset:offset + len(children)] = children
+            return self.storage.swap()
+
+        # Crossover and mutation for the whole generation at once
+        children = self.breed(population[parent_indices[0::2]], population[parent_indices[1::2]], timer, child_rates)
+        return np.concatenate((population[elite_indices], children))[:config.population_size]
+
+    def breed(self, parents1, parents2, timer=NULL_TIMER, mutation_rates=None):
+        """
+        Children of paired parent rows (crossover, mutation and optional repair),
+        interleaved by pair. With `mutation_rates`, child i mutates at mutation_rates[i].
+        """
+        config = self.config
+        children1, children2 = Crossover.batch(
+            config.crossover, parents1, parents2, config.crossover_rate, config.crossover_points, self.rng
+        )
+        children = np.empty((2 * len(parents1), len(self.instance)), dtype=np.uint8)
+        children[0::2] = children1
+        children[1::2] = children2
+        timer.lap("crossover")
+        if mutation_rates is not None:
+            children = Mutation.population_bit_flip_rows(children, mutation_rates, self.rng)
+        else:
+            children = Mutation.population_bit_flip(children, self.mutation_rate, self.rng)
+        timer.lap("mutation")
+        if config.repair:
+            children = repair_population(children, self.instance)
+            timer.lap("repair")
+        return children
+
+    def breed_packed(self, parents1, parents2, timer=NULL_TIMER, mutation_rates=None):
+        """breed() on bit-packed parent rows; returns the packed children."""
+        config = self.config
+        num_items = len(self.instance)
+        children1, children2 = Crossover.batch_packed(
+            config.crossover, parents1, parents2, num_items, config.crossover_rate, config.crossover_points, self.rng
+        )
+        children = np.empty((2 * len(parents1), parents1.shape[1]), dtype=np.uint8)
+        children[0::2] = children1
+        children[1::2] = children2
+        timer.lap("crossover")
+        if mutation_rates is not None:
+            children = Mutation.packed_population_bit_flip_rows(children, mutation_rates, num_items, self.rng)
+        else:
+            children = Mutation.packed_population_bit_flip(children, self.mutation_rate, num_items, self.rng)
+        timer.lap("mutation")
+        if config.repair:
+            children = pack_population(repair_population(unpack_population(children, num_items), self.instance))
+            timer.lap("repair")
+        return children
+
+    def evolve(self, result, resume_from=None):
+        """
+        The generation loop. Each generation is bred from the previous one,
+        evaluated and recorded into `result` (histories, incumbent and, when the
+        run ends early, stop_reason), then the generator yields (generation,
+        improved). Closing the generator early releases the evaluation pool.
+        Attached sinks receive a GenerationStats per generation and
+        on_finish(result) when the loop ends. With config.checkpoint_path set, a
+        checkpoint is saved every config.checkpoint_interval generations.
+        Args:
+            result: GAResult to fill in
+            resume_from: optional Checkpoint (or its path) to continue from
+        Returns:
+            generator of (generation, improved) pairs
+        """
+        config = self.config
+        stopping = EarlyStopping.from_config(config, self.instance)
+        if resume_from is None:
+            population, fitness_scores, first_generation = self.initial_population(), None, 0
+            if self.control is not None:
+                self.control.initial_rates(config.population_size, self.rng)
+        else:
+            population, fitness_scores = self.restore(resume_from, result, stopping)
+            first_generation = len(result.best_fitness_history)
+        timer = PhaseTimer() if self.sinks else NULL_TIMER
+
+        pool = ParallelEvaluator(self.instance, config.parallel_workers) if config.parallel_workers > 0 else None
+        try:
+            for generation in range(first_generation, config.generations):
+                if fitness_scores is not None:
+                    population = self.next_generation(population, fitness_scores, timer)
+
+                timer.start()
+                cache_hits, cache_misses = (self.cache.hits, self.cache.misses) if self.cache is not None else (0, 0)
+                fitness_scores = self.evaluate(population, pool)
+                timer.lap("evaluation")
+
+                best_index = fitness_scores.index(max(fitness_scores))
+                current_best_fitness = fitness_scores[best_index]
+                avg_fitness = sum(fitness_scores) / len(fitness_scores)
+
+                result.best_fitness_history.append(current_best_fitness)
+                result.avg_fitness_history.append(avg_fitness)
+
+                improved = current_best_fitness > result.best_fitness
+                if improved:
+                    result.best_fitness = current_best_fitness
+                    result.best_solution = population[best_index].tolist()
+
+                adaptation = {}
+                if self.control is not None:
+                    tracked = self.genes(population) if self.control.adaptive_tournament else None
+                    adaptation = self.control.update(fitness_scores, tracked)
+                    timer.lap("adaptation")
+
+                stop_reason = stopping.check(
+                    result.best_fitness, self.genes(population) if stopping.min_diversity else None
+                )
+                if stop_reason is not None:
+                    result.stop_reason = stop_reason
+
+                if self.sinks:
+                    stats = self.generation_stats(generation, population, fitness_scores, result, cache_hits, cache_misses)
+                    stats.timings = timer.reset()
+                    stats.adaptation = adaptation
+                    for sink in self.sinks:
+                        sink.on_generation(stats)
+
+                if config.checkpoint_path and stop_reason is None and (generation + 1) % config.checkpoint_interval == 0:
+                    save_checkpoint(config.checkpoint_path, self.checkpoint(population, fitness_scores, result, stopping))
+
+                yield generation, improved
+
+                if stop_reason is not None:
+                    break
+        finally:
+            if pool is not None:
+                pool.close()
+            if self.storage is not None:
+                self.storage.close()
+                self.storage = None
+            for sink in self.sinks:
+                sink.on_finish(result)
+
+    def checkpoint(self, population, fitness_scores, result, stopping):
+        """Checkpoint of an evaluated generation, taken before the next one is bred."""
+        return Checkpoint(
+            generation=len(result.best_fitness_history) - 1,
+            population=self.genes(population),
+            fitness_scores=fitness_scores,
+            best_solution=result.best_solution,
+            best_fitness=result.best_fitness,
+            best_fitness_history=list(result.best_fitness_history),
+            avg_fitness_history=list(result.avg_fitness_history),
+            rng_state=self.rng.bit_generator.state,
+            random_state=self.random.getstate(),
+            stopping_state=stopping.state(),
+            control_state=self.control.state() if self.control is not None else {},
+            mutation_rates=self.control.rates if self.control is not None else None,
+        )
+
+    def restore(self, checkpoint, result, stopping):
+        """
+        Load a checkpoint into this engine, `result` and `stopping`.
+        Returns:
+            (population, fitness_scores) of the checkpointed generation
+        """
+        if not isinstance(checkpoint, Checkpoint):
+            checkpoint = load_checkpoint(checkpoint)
+        population = checkpoint.population
+        if population.shape != (self.config.population_size, len(self.instance)):
+            raise ValueError(
+                f"Checkpoint population of shape {population.shape} does not match "
+                f"{self.config.population_size} individuals of {len(self.instance)} items."
+            )
+
+        self.rng.bit_generator.state = checkpoint.rng_state
+        self.random.setstate(checkpoint.random_state)
+        stopping.restore(checkpoint.stopping_state)
+        if self.control is not None:
+            self.control.restore(checkpoint.control_state, checkpoint.mutation_rates)
+        result.best_solution = checkpoint.best_solution
+        result.best_fitness = checkpoint.best_fitness
+        result.best_fitness_history[:] = checkpoint.best_fitness_history
+        result.avg_fitness_history[:] = checkpoint.avg_fitness_history
+
+        if self.evaluator is not None:
+            population = [self.evaluator.track(individual) for individual in population]
+        return population, list(checkpoint.fitness_scores)
+
+    def generation_stats(self, generation, population, fitness_scores, result, cache_hits=0, cache_misses=0):
+        """GenerationStats for an evaluated population; phase timings are filled in by the caller."""
+        if isinstance(population, PackedPopulation):
+            infeasible, unique_genomes = population.count_infeasible(self.instance), population.count_unique()
+        else:
+            genes = self.genes(population)
+            infeasible = self.instance.count_infeasible(genes)
+            unique_genomes = count_unique(genes)
+        if self.cache is not None:
+            cache_hits = self.cache.hits - cache_hits
+            evaluations = self.cache.misses - cache_misses
+        else:
+            cache_hits, evaluations = 0, len(fitness_scores)
+        return GenerationStats(
+            generation=generation,
+            best_fitness=max(fitness_scores),
+            avg_fitness=sum(fitness_scores) / len(fitness_scores),
+            incumbent_fitness=result.best_fitness,
+            evaluations=evaluations,
+            infeasible=infeasible,
+            cache_hits=cache_hits,
+            unique_genomes=unique_genomes,
+        )
+
+    def run(self, resume_from=None):
+        """
+        Run until the generation budget or an early-stopping criterion ends the
+        run; returns a GAResult. With `resume_from` (a Checkpoint or its path)
+        the run continues exactly where the checkpoint was taken.
+        """
+        result = GAResult(None, 0)
+        for _ in self.evolve(result, resume_from):
+            pass
+        return result
+
+    def anytime(self, result=None, resume_from=None, deadline=None):
+        """
+        Anytime form of run(): yields an Improvement each time the incumbent
+        improves, so a caller can stop consuming at any point and keep the last
+        one. With `deadline`, the generator also ends once that many seconds
+        have passed, checked after every generation whether or not it improved,
+        so a caller blocked in next() regains control within one generation of
+        the deadline. config.time_budget bounds a run that nobody interrupts.
+        Args:
+            result: optional GAResult that receives the histories and stop_reason
+            resume_from: optional Checkpoint (or its path) to continue from
+            deadline: optional seconds after the start at which the run ends
+                (stop_reason "deadline")
+        Returns:
+            generator of Improvement(generation, best_solution, best_fitness, elapsed)
+        """
+        result = result if result is not None else GAResult(None, 0)
+        start = time.perf_counter()
+        generations = self.evolve(result, resume_from)
+        try:
+            for generation, improved in generations:
+                if improved:
+                    yield Improvement(generation, result.best_solution, result.best_fitness, time.perf_counter() - start)
+                last = result.stop_reason != "generations" or generation + 1 >= self.config.generations
+                if deadline is not None and not last and time.perf_counter() - start >= deadline:
+                    result.stop_reason = "deadline"
+                    break
+        finally:
+            generations.close()
@@ -0,0 +1,218 @@
+import math
+import time
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from ga.fitness import INVALID_SOLUTION_SCORE
+
+# Nodes explored between two checks of the branch-and-bound time limit
+TIME_CHECK_INTERVAL = 1024
+
+# Largest bitset (items x capacity bits) kept for reconstruction before switching to divide-and-conquer
+DP_BITSET_LIMIT_BYTES = 64 * 2**20
+
+
+def _integral_capacity(weights, capacity):
+    if not np.all(np.mod(weights, 1) == 0):
+        raise ValueError("Dynamic programming needs integer item weights.")
+    return int(math.floor(capacity))
+
+
+def _dp_table(values, weights, capacity, record=False):
+    """
+    Rolling 1-D knapsack table: best[c] is the best value using weight <= c.
+    With record=True also returns, per item, the packed bitset of capacities
+    at which taking the item improved the table.
+    """
+    best = np.zeros(capacity + 1, dtype=np.result_type(values.dtype, np.int64))
+    taken = []
+    for value, weight in zip(values, weights.astype(np.int64)):
+        if weight > capacity:
+            taken.append(None)
+            continue
+        candidate = best[:capacity + 1 - weight] + value
+        improved = candidate > best[weight:]
+        best[weight:] = np.where(improved, candidate, best[weight:])
+        if record:
+            taken.append(np.packbits(improved))
+    return best, taken
+
+
+def _reconstruct_bitset(values, weights, capacity):
+    best, taken = _dp_table(values, weights, capacity, record=True)
+    chosen = []
+    remaining = capacity
+    for index in range(len(values) - 1, -1, -1):
+        weight = int(weights[index])
+        bits = taken[index]
+        if bits is None or remaining < weight:
+            continue
+        offset = remaining - weight
+        if bits[offset >> 3] & (0x80 >> (offset & 7)):
+            chosen.append(index)
+            remaining -= weight
+    return chosen
+
+
+def _reconstruct_divide(values, weights, capacity, memory_limit):
+    # Hirschberg-style: split the items, find how the optimal solution splits the
+    # capacity between the halves with two forward passes, then recurse
+    if len(values) * (capacity + 1) <= memory_limit * 8 or len(values) < 2:
+        return _reconstruct_bitset(values, weights, capacity)
+
+    middle = len(values) // 2
+    left, _ = _dp_table(values[:middle], weights[:middle], capacity)
+    right, _ = _dp_table(values[middle:], weights[middle:], capacity)
+    split = int(np.argmax(left + right[::-1]))
+
+    chosen = _reconstruct_divide(values[:middle], weights[:middle], split, memory_limit)
+    chosen += [middle + index for index in
+               _reconstruct_divide(values[middle:], weights[middle:], capacity - split, memory_limit)]
+    return chosen
+
+
+def dp_solve(instance, capacity=None, memory_limit=DP_BITSET_LIMIT_BYTES):
+    """
+    Exact 0/1 knapsack by O(n*W) dynamic programming with a rolling 1-D table.
+    Reconstruction keeps 1 bit per item and capacity while that fits in
+    memory_limit, and otherwise splits the items recursively so memory stays O(W).
+    Args:
+        instance: KnapsackInstance (weights must be integers)
+        capacity: optional override of the instance capacity
+        memory_limit: bytes allowed for the reconstruction bitsets
+    Returns:
+        (best_solution, best_value) with best_value scored like evaluate_fitness
+    """
+    instance.require_single_constraint("Dynamic programming")
+    capacity = instance.capacity if capacity is None else capacity
+    if capacity < 0:
+        return [0] * len(instance), INVALID_SOLUTION_SCORE
+    capacity = _integral_capacity(instance.weights, capacity)
+
+    chosen = _reconstruct_divide(instance.values, instance.weights, capacity, memory_limit)
+    solution = [0] * len(instance)
+    for index in chosen:
+        solution[index] = 1
+    return solution, instance.evaluate(solution, capacity)
+
+
+@dataclass
+class ExactResult:
+    """Outcome of a bounded exact search."""
+    best_solution: List[int]
+    best_fitness: float
+    upper_bound: float
+    gap: float  # (upper_bound - best_fitness) / upper_bound; 0 when proven optimal
+    optimal: bool
+    nodes: int
+
+
+def optimality_gap(fitness, upper_bound):
+    """Relative gap between a solution's fitness and a proven upper bound."""
+    if upper_bound <= 0:
+        return 0.0
+    return max(upper_bound - fitness, 0) / upper_bound
+
+
+class _RatioSortedItems:
+    # Items that fit on their own, sorted by value/weight ratio, with prefix sums for O(log n) Dantzig bounds
+
+    def __init__(self, instance, capacity):
+        weights = instance.weights.tolist()
+        self.order = [index for index in instance.ratio_order.tolist() if weights[index] <= capacity]
+        self.values = [instance.values[index].item() for index in self.order]
+        self.weights = [weights[index] for index in self.order]
+        self.capacity = capacity
+        self.prefix_values = [0]
+        self.prefix_weights = [0]
+        for value, weight in zip(self.values, self.weights):
+            self.prefix_values.append(self.prefix_values[-1] + value)
+            self.prefix_weights.append(self.prefix_weights[-1] + weight)
+        self.integral = all(float(value).is_integer() for value in self.values)
+
+    def bound(self, level, weight, value):
+        """Dantzig bound: greedy fill of items level.. plus a fraction of the first that does not fit."""
+        remaining = self.capacity - weight
+        stop = bisect_right(self.prefix_weights, self.prefix_weights[level] + remaining) - 1
+        bound = value + self.prefix_values[stop] - self.prefix_values[level]
+        if stop < len(self.order):
+            used = self.prefix_weights[stop] - self.prefix_weights[level]
+            bound += (remaining - used) * self.values[stop] / self.weights[stop]
+        # With integer values no solution can beat the rounded-down bound
+        return math.floor(bound + 1e-9) if self.integral else bound
+
+
+def dantzig_bound(instance, capacity=None):
+    """Upper bound on the optimum from the fractional (LP) relaxation."""
+    instance.require_single_constraint("The Dantzig bound")
+    capacity = instance.capacity if capacity is None else capacity
+    if capacity < 0:
+        return 0
+    return _RatioSortedItems(instance, capacity).bound(0, 0, 0)
+
+
+def branch_and_bound(instance, capacity=None, time_limit=None):
+    """
+    Exact 0/1 knapsack by depth-first branch-and-bound over items sorted by
+    value/weight ratio, pruning with the Dantzig fractional bound. Suited to
+    large capacities and weights where the DP table would be too big.
+    Args:
+        instance: KnapsackInstance
+        capacity: optional override of the instance capacity
+        time_limit: optional seconds after which the best incumbent is returned
+    Returns:
+        ExactResult; when the time limit stops the search, upper_bound and gap
+        are still proven (the best bound among unexplored nodes)
+    """
+    instance.require_single_constraint("Branch-and-bound")
+    capacity = instance.capacity if capacity is None else capacity
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    if capacity < 0:
+        return ExactResult([0] * len(instance), INVALID_SOLUTION_SCORE, 0, 0.0, True, 0)
+
+    items = _RatioSortedItems(instance, capacity)
+    num_items = len(items.order)
+
+    # Greedy incumbent
+    best_value, best_taken, weight = 0, 0, 0
+    for level in range(num_items):
+        if weight + items.weights[level] <= capacity:
+            weight += items.weights[level]
+            best_value += items.values[level]
+            best_taken |= 1 << level
+
+    stack = [(0, 0, 0, 0, items.bound(0, 0, 0))]
+    nodes = 0
+    while stack:
+        if deadline is not None and nodes % TIME_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            break
+        level, weight, value, taken, bound = stack.pop()
+        if bound <= best_value or level == num_items:
+            continue
+        nodes += 1
+
+        # Leaving item `level` out needs a fresh bound
+        exclude_bound = items.bound(level + 1, weight, value)
+        if exclude_bound > best_value:
+            stack.append((level + 1, weight, value, taken, exclude_bound))
+
+        # Taking it keeps the parent's bound; pushed last so it is explored first
+        if weight + items.weights[level] <= capacity:
+            value += items.values[level]
+            taken |= 1 << level
+            if value > best_value:
+                best_value, best_taken = value, taken
+            stack.append((level + 1, weight + items.weights[level], value, taken, bound))
+
+    open_bounds = [node[4] for node in stack if node[4] > best_value]
+    upper_bound = max(open_bounds, default=best_value)
+
+    solution = [0] * len(instance)
+    for level, index in enumerate(items.order):
+        if best_taken >> level & 1:
+            solution[index] = 1
+    best_fitness = instance.evaluate(solution, capacity) if len(instance) else INVALID_SOLUTION_SCORE
+    return ExactResult(solution, best_fitness, upper_bound, optimality_gap(best_fitness, upper_bound), not open_bounds, nodes)
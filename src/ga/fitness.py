@@ -1,12 +1,32 @@
+from functools import cached_property
+
+import numpy as np
+
+from ga.genome import byte_lookup_table, packed_length, packed_sum
+
 INVALID_SOLUTION_SCORE = 0
 
 
 class Item:
-    def __init__(self, value, weight):
+    """
+    Knapsack item. `resources` lists the item's demand on each constraint after
+    weight (e.g. volume, pallet slots) for multi-dimensional instances.
+    """
+    __slots__ = ("value", "weight", "resources")
+
+    def __init__(self, value, weight, resources=()):
         self.value = value
         self.weight = weight
+        self.resources = tuple(resources)
+
+    @property
+    def demand(self):
+        """Demand on every constraint, weight first."""
+        return (self.weight, *self.resources)
 
     def __repr__(self):
+        if self.resources:
+            return f"Item(value={self.value}, weight={self.weight}, resources={self.resources})"
         return f"Item(value={self.value}, weight={self.weight})"
 
 
@@ -20,6 +40,9 @@ def evaluate_fitness(individual, items, capacity):
     Returns:
         total value if within capacity and valid, otherwise INVALID_SOLUTION_SCORE
     """
+    if isinstance(items, KnapsackInstance):  # Pre-validated, array-backed fast path
+        return items.evaluate(individual, capacity)
+
     if not (len(individual) == len(items)):
         raise ValueError("Input lists must have the same length.")
 
@@ -42,3 +65,269 @@ def evaluate_fitness(individual, items, capacity):
         return INVALID_SOLUTION_SCORE
 
     return total_value
+
+
+def evaluate_population_fitness(population, values, weights, capacity):
+    """
+    Evaluate fitness for a whole population in one pass.
+    Args:
+        population: 2-D uint8/bool matrix, one binary row per individual
+        values: vector with the value of each item
+        weights: vector with the weight of each item
+        capacity: maximum weight capacity of knapsack
+    Returns:
+        numpy array with, for every row, the same score evaluate_fitness gives
+    """
+    values = np.asarray(values)
+    weights = np.asarray(weights)
+    population = np.asarray(population)
+    if population.size == 0:
+        population = population.reshape(len(population), len(values))
+
+    if population.ndim != 2 or not (population.shape[1] == len(values) == len(weights)):
+        raise ValueError("Input lists must have the same length.")
+
+    if len(values) == 0 or (values < 0).any() or (weights < 0).any():
+        return np.full(len(population), INVALID_SOLUTION_SCORE, dtype=values.dtype)
+
+    return _population_scores(population, values, weights, capacity)
+
+
+def _population_scores(population, values, weights, capacity):
+    # Value and weight totals for every individual in a single matrix product
+    totals = population @ np.column_stack((values, weights))
+    total_values = totals[:, 0].astype(values.dtype, copy=False)
+    return _scores(total_values, totals[:, 1], capacity)
+
+
+def _scores(total_values, total_weights, capacity):
+    feasible = (total_weights <= capacity) & (total_values > 0)
+    return np.where(feasible, total_values, INVALID_SOLUTION_SCORE)
+
+
+def _multi_scores(totals, value_dtype, capacities):
+    # totals: (P, 1 + D) value and per-constraint demand totals
+    total_values = totals[:, 0].astype(value_dtype, copy=False)
+    feasible = (totals[:, 1:] <= capacities).all(axis=1) & (total_values > 0)
+    return np.where(feasible, total_values, INVALID_SOLUTION_SCORE)
+
+
+def evaluate_packed_fitness(packed_population, values, weights, capacity, tables=None):
+    """
+    Evaluate fitness directly on bit-packed genomes (see ga.genome).
+    Args:
+        packed_population: (P, ceil(N/8)) uint8 matrix, or a single packed row
+        values: vector with the value of each item
+        weights: vector with the weight of each item
+        capacity: maximum weight capacity of knapsack
+        tables: optional (value_table, weight_table) from byte_lookup_table, to
+            avoid rebuilding them on every call
+    Returns:
+        numpy array with the same scores evaluate_fitness gives for each genome
+    """
+    values = np.asarray(values)
+    weights = np.asarray(weights)
+    packed_population = np.asarray(packed_population, dtype=np.uint8)
+    if packed_population.ndim == 1:
+        packed_population = packed_population[None, :]
+
+    if len(values) != len(weights) or packed_population.shape[1] != packed_length(len(values)):
+        raise ValueError("Input lists must have the same length.")
+
+    if len(values) == 0 or (values < 0).any() or (weights < 0).any():
+        return np.full(len(packed_population), INVALID_SOLUTION_SCORE, dtype=values.dtype)
+
+    value_table, weight_table = tables if tables is not None else (byte_lookup_table(values), byte_lookup_table(weights))
+    return _scores(packed_sum(packed_population, value_table), packed_sum(packed_population, weight_table), capacity)
+
+
+class KnapsackInstance:
+    """
+    Knapsack problem built once from a list of items.
+    Items are validated at construction and kept as contiguous value/weight
+    arrays, so evaluation never re-checks or dereferences Item objects.
+
+    A sequence of D capacities makes the instance multi-dimensional: every item
+    then carries D - 1 `resources` after its weight, and a selection is feasible
+    only when it fits every capacity. Single-constraint instances keep the
+    value/weight evaluation path unchanged.
+    Args:
+        items: list of Item objects (values, weights and resources must not be negative)
+        capacity: maximum weight capacity of knapsack, or one capacity per constraint
+    """
+
+    def __init__(self, items, capacity):
+        if items is None:
+            raise ValueError("Input list must have values.")
+
+        self.items = tuple(items)
+        self.dimensions = len(capacity) if np.ndim(capacity) else 1
+        self.capacities = np.array(capacity, ndmin=1)
+        self.capacity = self.capacities[0].item() if np.ndim(capacity) else capacity
+        self.values = np.array([item.value for item in self.items])
+        self.weights = np.array([item.weight for item in self.items])
+
+        if self.dimensions < 1 or self.capacities.ndim != 1:
+            raise ValueError("Capacity must be a number or a flat sequence of numbers.")
+        if any(len(item.resources) != self.dimensions - 1 for item in self.items):
+            raise ValueError(f"Every item needs {self.dimensions - 1} resources for {self.dimensions} capacities.")
+        if self.dimensions == 1:
+            self.demands = self.weights[:, None]
+        else:
+            self.demands = np.array([item.demand for item in self.items]).reshape(len(self.items), self.dimensions)
+
+        if not all(np.issubdtype(array.dtype, np.number) for array in (self.values, self.demands, self.capacities)):
+            raise ValueError("Item values, weights and capacities must be numbers.")
+        if (self.values < 0).any() or (self.demands < 0).any():
+            raise ValueError("Item values and weights must not be negative.")
+
+        self.total_value = self.values.sum().item()
+        self.total_weight = self.weights.sum().item()
+        # Multi-dimensional ratios divide value by the summed demand, each as a share of its capacity
+        load = self.weights if self.dimensions == 1 else self.relative_demands.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.ratios = np.where(load > 0, self.values / load, np.inf)
+
+        for array in (self.values, self.weights, self.demands, self.capacities, self.ratios):
+            array.flags.writeable = False
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __repr__(self):
+        capacity = self.capacities.tolist() if self.dimensions > 1 else self.capacity
+        return f"KnapsackInstance(items={len(self.items)}, capacity={capacity})"
+
+    @property
+    def num_items(self):
+        return len(self.items)
+
+    def require_single_constraint(self, feature):
+        """Raise ValueError for features that only handle the weight constraint."""
+        if self.dimensions > 1:
+            raise ValueError(f"{feature} supports single-constraint instances only.")
+
+    @cached_property
+    def relative_demands(self):
+        """Demands as shares of each capacity, (items, D); zero capacities count a positive demand as infinite."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            relative = np.where(self.demands > 0, self.demands / self.capacities, 0.0)
+        relative.flags.writeable = False
+        return relative
+
+    @cached_property
+    def _value_demands(self):
+        # Values and every constraint's demands side by side, so one matrix product totals them all
+        stacked = np.column_stack((self.values, self.demands))
+        stacked.flags.writeable = False
+        return stacked
+
+    def _capacities(self, capacity):
+        if capacity is None:
+            return self.capacities
+        capacities = np.array(capacity, ndmin=1)
+        if capacities.shape != self.capacities.shape:
+            raise ValueError(f"Capacity override needs {self.dimensions} values.")
+        return capacities
+
+    def excess(self, population, capacity=None):
+        """Demand over capacity per constraint, (P, D) and never negative, for a 2-D binary population."""
+        if self.dimensions == 1:
+            capacity = self.capacity if capacity is None else capacity
+            return np.maximum(np.asarray(population) @ self.weights - capacity, 0)[:, None]
+        return np.maximum(np.asarray(population) @ self.demands - self._capacities(capacity), 0)
+
+    def count_infeasible(self, population, capacity=None):
+        """Rows of a 2-D binary population that exceed some capacity."""
+        if self.dimensions == 1:
+            capacity = self.capacity if capacity is None else capacity
+            return int(np.count_nonzero(np.asarray(population) @ self.weights > capacity))
+        return int(np.count_nonzero(self.excess(population, capacity).any(axis=1)))
+
+    @cached_property
+    def ratio_order(self):
+        """Item indices sorted by value/weight ratio, best first."""
+        order = np.argsort(-self.ratios, kind="stable")
+        order.flags.writeable = False
+        return order
+
+    @cached_property
+    def packed_tables(self):
+        """(value_table, weight_table) for evaluating bit-packed genomes."""
+        self.require_single_constraint("Packed evaluation")
+        return byte_lookup_table(self.values), byte_lookup_table(self.weights)
+
+    def evaluate(self, individual, capacity=None):
+        """Score a single binary individual; same result as evaluate_fitness."""
+        genes = np.asarray(individual, dtype=np.uint8)
+        if len(genes) != len(self.items):
+            raise ValueError("Input lists must have the same length.")
+        if not len(genes):
+            return INVALID_SOLUTION_SCORE
+        if self.dimensions > 1:
+            totals = (genes @ self._value_demands)[None, :]
+            return _multi_scores(totals, self.values.dtype, self._capacities(capacity))[0].item()
+        capacity = self.capacity if capacity is None else capacity
+        return _scores(genes @ self.values, genes @ self.weights, capacity).item()
+
+    def evaluate_population(self, population, capacity=None):
+        """Score every row of a 2-D binary population matrix."""
+        population = np.asarray(population)
+        if population.size == 0:
+            population = population.reshape(len(population), len(self.items))
+        if population.ndim != 2 or population.shape[1] != len(self.items):
+            raise ValueError("Input lists must have the same length.")
+        if not len(self.items):
+            return np.full(len(population), INVALID_SOLUTION_SCORE, dtype=self.values.dtype)
+        if self.dimensions > 1:
+            # Feasibility of every row on every constraint from one population x items x (1 + D) product
+            return _multi_scores(population @ self._value_demands, self.values.dtype, self._capacities(capacity))
+        capacity = self.capacity if capacity is None else capacity
+        return _population_scores(population, self.values, self.weights, capacity)
+
+    @cached_property
+    def default_penalty(self):
+        """
+        Penalty per unit of excess weight: the best finite value/weight ratio. On
+        multi-dimensional instances it applies per unit of excess capacity share.
+        """
+        finite = self.ratios[np.isfinite(self.ratios)]
+        return finite.max().item() if len(finite) else 1.0
+
+    def evaluate_population_penalized(self, population, penalty=None, capacity=None):
+        """
+        Graded-penalty fitness: overweight individuals score their total value minus
+        penalty * excess weight (never below INVALID_SOLUTION_SCORE) instead of
+        INVALID_SOLUTION_SCORE, so selection can still tell near-feasible ones apart.
+        Feasible individuals score exactly as in evaluate_population.
+        Multi-dimensional excess is summed over constraints as shares of each capacity.
+        """
+        population = np.asarray(population)
+        if population.ndim != 2 or population.shape[1] != len(self.items):
+            raise ValueError("Input lists must have the same length.")
+        penalty = self.default_penalty if penalty is None else penalty
+        if self.dimensions > 1:
+            capacities = self._capacities(capacity)
+            totals = population @ self._value_demands
+            with np.errstate(divide="ignore", invalid="ignore"):
+                shares = np.maximum(totals[:, 1:] - capacities, 0) / capacities
+            excess = np.nan_to_num(shares, nan=0.0, posinf=np.inf).sum(axis=1)
+            return np.maximum(totals[:, 0] - penalty * excess, INVALID_SOLUTION_SCORE)
+        capacity = self.capacity if capacity is None else capacity
+
+        totals = population @ np.column_stack((self.values, self.weights))
+        excess = np.maximum(totals[:, 1] - capacity, 0)
+        scores = totals[:, 0] - penalty * excess
+        return np.maximum(scores, INVALID_SOLUTION_SCORE)
+
+    def evaluate_packed(self, packed_population, capacity=None):
+        """Score bit-packed genomes (see ga.genome); single-constraint instances only."""
+        self.require_single_constraint("Packed evaluation")
+        capacity = self.capacity if capacity is None else capacity
+        return evaluate_packed_fitness(packed_population, self.values, self.weights, capacity, self.packed_tables)
@@ -0,0 +1,90 @@
+import numpy as np
+
+# Bit i of a genome lives in byte i // 8 at position i % 8
+BIT_ORDER = "little"
+
+# _BYTE_BITS[b] holds the 8 genes encoded by byte value b
+_BYTE_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1, bitorder=BIT_ORDER)
+
+
+def packed_length(num_items):
+    """Number of bytes needed to store num_items genes at 1 bit per gene."""
+    return (num_items + 7) // 8
+
+
+def pack_individual(individual):
+    """Pack a binary list into a uint8 row using 1 bit per gene."""
+    return np.packbits(np.asarray(individual, dtype=np.uint8), bitorder=BIT_ORDER)
+
+
+def unpack_individual(packed, num_items):
+    """Unpack a packed row back into a binary list of num_items genes."""
+    return np.unpackbits(packed, count=num_items, bitorder=BIT_ORDER).tolist()
+
+
+def pack_population(population):
+    """Pack a population (list of binary lists or 2-D matrix) into a (P, ceil(N/8)) uint8 matrix."""
+    matrix = np.asarray(population, dtype=np.uint8)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(matrix), -1)
+    return np.packbits(matrix, axis=1, bitorder=BIT_ORDER)
+
+
+def unpack_population(packed, num_items):
+    """Unpack a packed population into a (P, num_items) uint8 matrix."""
+    return np.unpackbits(packed, axis=1, count=num_items, bitorder=BIT_ORDER)
+
+
+def gene_mask(num_items):
+    """Packed row with every gene set and the padding bits of the last byte clear."""
+    mask = np.full(packed_length(num_items), 0xFF, dtype=np.uint8)
+    if num_items % 8:
+        mask[-1] = (1 << num_items % 8) - 1
+    return mask
+
+
+def suffix_masks(points, num_items):
+    """(M, ceil(N/8)) packed masks; row i has the genes from points[i] onwards set."""
+    points = np.asarray(points, dtype=np.int64)[:, None]
+    byte = np.arange(packed_length(num_items))
+    full, partial = points >> 3, (0xFF << (points & 7)) & 0xFF
+    masks = np.where(byte > full, 0xFF, np.where(byte == full, partial, 0)).astype(np.uint8)
+    return masks & gene_mask(num_items)
+
+
+def flip_genes(packed, rows, genes):
+    """
+    Flip, in place, gene genes[i] of row rows[i] of a packed population.
+    (row, gene) pairs must be distinct and sorted row-major, as flip_positions
+    returns them, so flips sharing a byte are combined before the XOR. `packed`
+    must be C-contiguous.
+    """
+    flat = packed.reshape(-1)
+    byte = np.asarray(rows, dtype=np.int64) * packed.shape[-1] + (np.asarray(genes) >> 3)
+    if not len(byte):
+        return packed
+    bits = np.left_shift(1, np.asarray(genes) & 7).astype(np.uint8)
+    starts = np.flatnonzero(np.diff(byte, prepend=-1))
+    flat[byte[starts]] ^= np.bitwise_or.reduceat(bits, starts)
+    return packed
+
+
+def byte_lookup_table(vector):
+    """
+    Per-byte lookup table for summing a vector over packed genomes.
+    Args:
+        vector: one entry per item (values or weights)
+    Returns:
+        (ceil(N/8), 256) array where table[j, b] is the sum of the entries
+        selected by byte value b at byte position j
+    """
+    vector = np.asarray(vector)
+    padded = np.zeros(packed_length(len(vector)) * 8, dtype=vector.dtype)
+    padded[:len(vector)] = vector
+    return padded.reshape(-1, 8) @ _BYTE_BITS.T.astype(vector.dtype)
+
+
+def packed_sum(packed, table):
+    """Sum a lookup table over every row of a packed population."""
+    packed = np.asarray(packed)
+    return table[np.arange(table.shape[0]), packed].sum(axis=-1)
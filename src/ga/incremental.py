@@ -0,0 +1,126 @@
+import math
+import random
+
+import numpy as np
+
+from ga.fitness import INVALID_SOLUTION_SCORE
+
+
+class TrackedIndividual:
+    """
+    Binary individual that carries its running value/weight totals.
+    Totals are also kept per block of genes so crossover can read prefix
+    sums at any cut point without re-summing the whole genome.
+    """
+
+    __slots__ = ("genes", "value", "weight", "block_values", "block_weights")
+
+    def __init__(self, genes, value, weight, block_values, block_weights):
+        self.genes = genes
+        self.value = value
+        self.weight = weight
+        self.block_values = block_values
+        self.block_weights = block_weights
+
+    def __len__(self):
+        return len(self.genes)
+
+    def copy(self):
+        return TrackedIndividual(
+            self.genes.copy(), self.value, self.weight, self.block_values.copy(), self.block_weights.copy()
+        )
+
+    def tolist(self):
+        return self.genes.tolist()
+
+
+class IncrementalEvaluator:
+    """
+    Delta fitness evaluation for mutated and crossed-over children.
+    Args:
+        instance: KnapsackInstance being solved
+        block_size: genes per prefix-sum block (defaults to about sqrt(N))
+    """
+
+    def __init__(self, instance, block_size=None):
+        instance.require_single_constraint("Incremental evaluation")
+        self.instance = instance
+        self.num_items = len(instance)
+        self.block_size = block_size or max(8, math.isqrt(self.num_items))
+        self.num_blocks = -(-self.num_items // self.block_size)
+        self._padded_values = self._pad(instance.values)
+        self._padded_weights = self._pad(instance.weights)
+
+    def _pad(self, vector):
+        padded = np.zeros(self.num_blocks * self.block_size, dtype=vector.dtype)
+        padded[:self.num_items] = vector
+        return padded.reshape(self.num_blocks, self.block_size)
+
+    def track(self, individual):
+        """Full O(N) summary of an individual; only needed once per lineage."""
+        genes = np.array(individual, dtype=np.uint8)
+        if len(genes) != self.num_items:
+            raise ValueError("Input lists must have the same length.")
+        padded = self._pad(genes)
+        block_values = (padded * self._padded_values).sum(axis=1)
+        block_weights = (padded * self._padded_weights).sum(axis=1)
+        return TrackedIndividual(genes, block_values.sum().item(), block_weights.sum().item(), block_values, block_weights)
+
+    def fitness(self, individual, capacity=None):
+        """Score from the carried totals; same result as evaluate_fitness."""
+        capacity = self.instance.capacity if capacity is None else capacity
+        if individual.weight > capacity or individual.value <= 0:
+            return INVALID_SOLUTION_SCORE
+        return individual.value
+
+    def bit_flip(self, individual, mutation_rate, rng=None):
+        """Bit flip mutation updating the totals in O(flipped genes)."""
+        rng = rng if rng is not None else np.random.default_rng()
+        mutated = individual.copy()
+        num_flips = rng.binomial(self.num_items, mutation_rate) if self.num_items else 0
+        if not num_flips:
+            return mutated
+
+        positions = rng.choice(self.num_items, size=num_flips, replace=False)
+        signs = 1 - 2 * mutated.genes[positions].astype(np.int64)  # +1 when a gene turns on, -1 when it turns off
+        mutated.genes[positions] ^= 1
+
+        value_deltas = signs * self.instance.values[positions]
+        weight_deltas = signs * self.instance.weights[positions]
+        blocks = positions // self.block_size
+        np.add.at(mutated.block_values, blocks, value_deltas)
+        np.add.at(mutated.block_weights, blocks, weight_deltas)
+        mutated.value += value_deltas.sum().item()
+        mutated.weight += weight_deltas.sum().item()
+        return mutated
+
+    def _prefix(self, individual, point):
+        """Value/weight of genes [0, point) plus the partial sums inside the cut block."""
+        block, start = divmod(point, self.block_size)
+        start = point - start
+        genes = individual.genes[start:point]
+        partial_value = (genes @ self.instance.values[start:point]).item()
+        partial_weight = (genes @ self.instance.weights[start:point]).item()
+        prefix_value = individual.block_values[:block].sum().item() + partial_value
+        prefix_weight = individual.block_weights[:block].sum().item() + partial_weight
+        return prefix_value, prefix_weight, partial_value, partial_weight
+
+    def _child(self, head, tail, point, head_prefix, tail_prefix):
+        block = point // self.block_size
+        genes = np.concatenate((head.genes[:point], tail.genes[point:]))
+        block_values = np.concatenate((head.block_values[:block + 1], tail.block_values[block + 1:]))
+        block_weights = np.concatenate((head.block_weights[:block + 1], tail.block_weights[block + 1:]))
+        if block < self.num_blocks:
+            # The cut block mixes the head's genes before the cut with the tail's genes after it
+            block_values[block] = head_prefix[2] + tail.block_values[block] - tail_prefix[2]
+            block_weights[block] = head_prefix[3] + tail.block_weights[block] - tail_prefix[3]
+        value = head_prefix[0] + tail.value - tail_prefix[0]
+        weight = head_prefix[1] + tail.weight - tail_prefix[1]
+        return TrackedIndividual(genes, value, weight, block_values, block_weights)
+
+    def one_point(self, parent1, parent2, point=None):
+        """One-point crossover computing the children's totals from the parents' prefix sums."""
+        point = random.randint(1, self.num_items - 1) if point is None else point
+        prefix1 = self._prefix(parent1, point)
+        prefix2 = self._prefix(parent2, point)
+        return self._child(parent1, parent2, point, prefix1, prefix2), self._child(parent2, parent1, point, prefix2, prefix1)
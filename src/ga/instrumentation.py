@@ -0,0 +1,147 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict
+
+import numpy as np
+
+# Phases of a generation, in the order they run
+PHASES = ("evaluation", "adaptation", "elitism", "selection", "crossover", "mutation", "repair")
+
+
+@dataclass
+class GenerationStats:
+    """What happened in one generation: fitness, time per phase and population counts."""
+    generation: int
+    best_fitness: float  # best of this generation
+    avg_fitness: float
+    incumbent_fitness: float  # best of the run so far
+    evaluations: int  # fitness evaluations actually computed (cache misses when caching)
+    infeasible: int  # individuals over capacity
+    cache_hits: int
+    unique_genomes: int
+    timings: Dict[str, float] = field(default_factory=dict)  # seconds per phase
+    adaptation: Dict[str, float] = field(default_factory=dict)  # ParameterControl decisions, when adaptive
+
+    def as_dict(self):
+        return asdict(self)
+
+
+class PhaseTimer:
+    """Accumulates wall time per phase; each lap closes the interval since the previous start or lap."""
+
+    def __init__(self):
+        self.timings = {}
+        self._last = time.perf_counter()
+
+    def start(self):
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        self.timings[phase] = self.timings.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def reset(self):
+        timings, self.timings = self.timings, {}
+        return timings
+
+
+class _NullTimer:
+    """Stand-in for PhaseTimer when nothing listens, so uninstrumented runs never read the clock."""
+
+    def start(self):
+        pass
+
+    def lap(self, phase):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+def count_unique(genes):
+    """Number of distinct genomes in a population matrix."""
+    if len(genes) == 0:
+        return 0
+    return len(np.unique(np.packbits(genes, axis=1), axis=0))
+
+
+class EventSink:
+    """
+    Receiver of engine events. Subclasses override the hooks they need;
+    GAEngine only gathers statistics when at least one sink is attached.
+    """
+
+    def on_generation(self, stats):
+        """Called once per generation with its GenerationStats."""
+
+    def on_finish(self, result):
+        """Called once when the run ends (or its generator is closed) with the GAResult."""
+
+
+class ProgressPrinter(EventSink):
+    """Prints the best and average fitness every `interval` generations and at the end of the run."""
+
+    def __init__(self, interval=10):
+        self.interval = interval
+        self.last = None
+
+    def _print(self, stats):
+        print(f"Generation {stats.generation:3d}: Best={stats.best_fitness:>3}, Avg={stats.avg_fitness:6.2f}")
+
+    def on_generation(self, stats):
+        self.last = stats
+        if stats.generation % self.interval == 0:
+            self._print(stats)
+
+    def on_finish(self, result):
+        if self.last is None:
+            return
+        if self.last.generation % self.interval != 0:
+            self._print(self.last)
+        if result.stop_reason != "generations":
+            print(f"Stopped at generation {self.last.generation} ({result.stop_reason})")
+
+
+class StatsRecorder(EventSink):
+    """Keeps every GenerationStats in memory, e.g. for tests or notebooks."""
+
+    def __init__(self):
+        self.generations = []
+        self.result = None
+
+    def on_generation(self, stats):
+        self.generations.append(stats)
+
+    def on_finish(self, result):
+        self.result = result
+
+
+class JsonLinesWriter(EventSink):
+    """
+    Writes one JSON object per generation, plus a final {"event": "finish"} line.
+    Args:
+        target: file path, or an open text file (left open for the caller)
+    """
+
+    def __init__(self, target):
+        self._owned = isinstance(target, (str, bytes)) or hasattr(target, "__fspath__")
+        self.file = open(target, "w") if self._owned else target
+
+    def _write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+
+    def on_generation(self, stats):
+        self._write(dict(event="generation", **stats.as_dict()))
+
+    def on_finish(self, result):
+        self._write({
+            "event": "finish",
+            "best_fitness": result.best_fitness,
+            "generations": result.generations_run,
+            "stop_reason": result.stop_reason,
+        })
+        self.file.flush()
+        if self._owned:
+            self.file.close()
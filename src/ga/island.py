@@ -0,0 +1,205 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from ga.crossover import Crossover, CROSSOVER_STRATEGIES
+from ga.engine import SELECTION_STRATEGIES
+from ga.mutation import Mutation
+from ga.population import create_individual
+from ga.selection import roulette_selection, tournament_selection
+
+TOPOLOGIES = ("ring", "full")
+
+# KnapsackInstance shared with pool workers once, through the pool initializer
+_island_instance = None
+
+
+@dataclass
+class IslandConfig:
+    """GA settings of one island."""
+    population_size: int = 100
+    mutation_rate: float = 0.05
+    selection: str = "roulette"  # "roulette" or "tournament"
+    tournament_size: int = 5
+    elitism_size: int = 5
+    crossover: str = "one_point"  # "one_point", "two_point", "k_point" or "uniform"
+    crossover_rate: float = 1.0
+    crossover_points: int = 3  # cut points for "k_point"
+
+    def __post_init__(self):
+        if self.selection not in SELECTION_STRATEGIES:
+            raise ValueError(f"Unknown selection strategy '{self.selection}'.")
+        if self.crossover not in CROSSOVER_STRATEGIES:
+            raise ValueError(f"Unknown crossover strategy '{self.crossover}'.")
+
+
+@dataclass
+class IslandState:
+    """Everything an island needs to continue evolving, including its RNG state."""
+    rng_state: tuple
+    population: Optional[list] = None
+    best_solution: Optional[list] = None
+    best_fitness: int = 0
+    best_fitness_history: List[float] = field(default_factory=list)
+    avg_fitness_history: List[float] = field(default_factory=list)
+
+    def results(self):
+        """(best_solution, best_fitness, best_fitness_history, avg_fitness_history), as display_results expects."""
+        return self.best_solution, self.best_fitness, self.best_fitness_history, self.avg_fitness_history
+
+
+@dataclass
+class IslandResult:
+    best_solution: Optional[list]
+    best_fitness: int
+    best_fitness_history: List[float]
+    avg_fitness_history: List[float]
+    islands: List[IslandState]
+
+    def results(self):
+        """Global (best_solution, best_fitness, best_fitness_history, avg_fitness_history)."""
+        return self.best_solution, self.best_fitness, self.best_fitness_history, self.avg_fitness_history
+
+
+def _set_instance(instance):
+    global _island_instance
+    _island_instance = instance
+
+
+def _select(population, fitness_scores, config):
+    if config.selection == "tournament":
+        return tournament_selection(population, fitness_scores, config.tournament_size)
+    if sum(fitness_scores) > 0:
+        return roulette_selection(population, fitness_scores)
+    # Fallback to random selection if all fitness scores are 0
+    return random.choice(population)
+
+
+def evolve_island(config, state, generations, instance=None):
+    """
+    Run `generations` GA generations on one island with the ga operators.
+    The global `random` module is switched to the island's own RNG state for
+    the duration of the call, so results do not depend on which process runs it.
+    Returns:
+        the updated IslandState
+    """
+    instance = instance if instance is not None else _island_instance
+    saved_state = random.getstate()
+    random.setstate(state.rng_state)
+    try:
+        population = state.population
+        if population is None:
+            population = [create_individual(instance) for _ in range(config.population_size)]
+        for _ in range(generations):
+            fitness_scores = instance.evaluate_population(np.asarray(population, dtype=np.uint8)).tolist()
+            best_index = fitness_scores.index(max(fitness_scores))
+            state.best_fitness_history.append(fitness_scores[best_index])
+            state.avg_fitness_history.append(sum(fitness_scores) / len(fitness_scores))
+            if fitness_scores[best_index] > state.best_fitness:
+                state.best_fitness = fitness_scores[best_index]
+                state.best_solution = population[best_index].copy()
+
+            sorted_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)
+            new_population = [population[i].copy() for i in sorted_indices[:config.elitism_size]]
+            while len(new_population) < config.population_size:
+                parent1 = _select(population, fitness_scores, config)
+                parent2 = _select(population, fitness_scores, config)
+                child1, child2 = Crossover.pair(
+                    config.crossover, parent1, parent2, config.crossover_rate, config.crossover_points
+                )
+                new_population.append(Mutation.bit_flip(child1, config.mutation_rate))
+                new_population.append(Mutation.bit_flip(child2, config.mutation_rate))
+            population = new_population[:config.population_size]
+
+        state.population = population
+        state.rng_state = random.getstate()
+        return state
+    finally:
+        random.setstate(saved_state)
+
+
+def _destinations(index, num_islands, topology):
+    if topology == "ring":
+        return [(index + 1) % num_islands]
+    return [other for other in range(num_islands) if other != index]
+
+
+def migrate(instance, states, migration_size, topology="ring"):
+    """Send each island's best `migration_size` individuals to its neighbours, replacing their worst."""
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology '{topology}'. Use one of {TOPOLOGIES}.")
+
+    scores = [instance.evaluate_population(np.asarray(state.population, dtype=np.uint8)).tolist() for state in states]
+    emigrants = []
+    for state, fitness_scores in zip(states, scores):
+        best = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)[:migration_size]
+        emigrants.append([(state.population[i].copy(), fitness_scores[i]) for i in best])
+
+    inboxes = [[] for _ in states]
+    for index in range(len(states)):
+        for destination in _destinations(index, len(states), topology):
+            inboxes[destination].extend(emigrants[index])
+
+    for state, fitness_scores, inbox in zip(states, scores, inboxes):
+        worst = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i])
+        for position, (individual, _) in zip(worst, sorted(inbox, key=lambda m: m[1], reverse=True)):
+            state.population[position] = individual.copy()
+
+
+def run_islands(instance, configs, generations, migration_interval=10, migration_size=2,
+                topology="ring", workers=None, seed=None):
+    """
+    Island-model GA: independent populations evolving in separate processes,
+    exchanging their best individuals every `migration_interval` generations.
+    Args:
+        instance: KnapsackInstance being solved
+        configs: one IslandConfig per island
+        generations: total generations per island
+        migration_interval: generations between migrations (K)
+        migration_size: individuals each island sends per migration
+        topology: "ring" (to the next island) or "full" (to every other island)
+        workers: processes to use (defaults to one per island, capped by os.cpu_count()); 1 runs in-process
+        seed: optional seed making the whole run reproducible
+    Returns:
+        IslandResult with global and per-island histories
+    """
+    if not configs:
+        raise ValueError("At least one island is required.")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology '{topology}'. Use one of {TOPOLOGIES}.")
+
+    seeder = random.Random(seed)
+    states = [IslandState(random.Random(seeder.getrandbits(64)).getstate()) for _ in configs]
+
+    workers = workers or min(len(configs), os.cpu_count() or 1)
+    executor = None
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_set_instance, initargs=(instance,))
+
+    try:
+        done = 0
+        while done < generations:
+            epoch = min(migration_interval, generations - done)
+            if executor is not None:
+                states = list(executor.map(evolve_island, configs, states, [epoch] * len(configs)))
+            else:
+                states = [evolve_island(config, state, epoch, instance) for config, state in zip(configs, states)]
+            done += epoch
+            if done < generations and len(states) > 1 and migration_size > 0:
+                migrate(instance, states, migration_size, topology)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    best_state = max(states, key=lambda state: state.best_fitness)
+    best_fitness_history = [max(values) for values in zip(*(state.best_fitness_history for state in states))]
+    total_size = sum(config.population_size for config in configs)
+    avg_fitness_history = [
+        sum(avg * config.population_size for avg, config in zip(values, configs)) / total_size
+        for values in zip(*(state.avg_fitness_history for state in states))
+    ]
+    return IslandResult(best_state.best_solution, best_state.best_fitness, best_fitness_history, avg_fitness_history, states)
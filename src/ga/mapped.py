@@ -0,0 +1,166 @@
+import os
+import tempfile
+from hashlib import blake2b
+
+import numpy as np
+
+from ga.genome import BIT_ORDER, pack_population, packed_length, unpack_population
+
+# Default size of one row block of unpacked genes (1 byte per gene). Evaluation and
+# variation allocate temporaries of a few times this size while a block is processed.
+BLOCK_BYTES = 64 * 2**20
+DIGEST_SIZE = 8  # bytes of blake2b digest per row when counting distinct genomes
+
+
+def block_rows(num_items, block_bytes=BLOCK_BYTES):
+    """Rows per block so one unpacked block (rows x items bytes) stays within block_bytes; always even and >= 2."""
+    rows = max(block_bytes // max(num_items, 1), 2)
+    return rows - rows % 2
+
+
+class PackedPopulation:
+    """
+    Population stored as packed bits (1 bit per gene, see ga.genome) in memory.
+    Variation works on the packed rows directly; evaluation and population
+    measures unpack at most one block of rows at a time.
+    Args:
+        size: number of individuals
+        num_items: genes per individual
+        rows: rows per block (see block_rows)
+    """
+
+    def __init__(self, size, num_items, rows):
+        self.num_items = num_items
+        self.rows = rows
+        self.array = np.zeros((size, packed_length(num_items)), dtype=np.uint8)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index):
+        """Unpacked genes of one individual."""
+        return np.unpackbits(self.array[index], count=self.num_items, bitorder=BIT_ORDER)
+
+    def blocks(self):
+        """(start, stop) row ranges of at most `rows` rows covering the population."""
+        for start in range(0, len(self), self.rows):
+            yield start, min(start + self.rows, len(self))
+
+    def read(self, start, stop):
+        return unpack_population(self.array[start:stop], self.num_items)
+
+    def take(self, indices):
+        """Unpacked genes of the individuals at `indices` (at most one block of them)."""
+        return unpack_population(self.array[np.asarray(indices)], self.num_items)
+
+    def write(self, start, genes):
+        self.array[start:start + len(genes)] = pack_population(genes)
+
+    def _reads_packed(self, instance):
+        # Per-byte lookup tables score packed rows without unpacking them, while the
+        # tables (256 entries per byte of genome, for values and weights) fit one block
+        table_bytes = 2 * 256 * self.array.shape[1] * max(instance.values.itemsize, instance.weights.itemsize)
+        return instance.dimensions == 1 and table_bytes <= self.rows * self.num_items
+
+    def evaluate(self, instance, penalized=False):
+        """Fitness of every row as a list, evaluated block by block."""
+        scores = np.empty(len(self), dtype=np.result_type(instance.values.dtype, np.float64 if penalized else np.int64))
+        packed = not penalized and self._reads_packed(instance)
+        for start, stop in self.blocks():
+            if packed:
+                scores[start:stop] = instance.evaluate_packed(self.array[start:stop])
+            elif penalized:
+                scores[start:stop] = instance.evaluate_population_penalized(self.read(start, stop))
+            else:
+                scores[start:stop] = instance.evaluate_population(self.read(start, stop))
+        return scores.tolist()
+
+    def ones_per_locus(self):
+        ones = np.zeros(self.num_items, dtype=np.int64)
+        for start, stop in self.blocks():
+            ones += self.read(start, stop).sum(axis=0, dtype=np.int64)
+        return ones
+
+    def count_infeasible(self, instance):
+        return sum(instance.count_infeasible(self.read(start, stop)) for start, stop in self.blocks())
+
+    def count_unique(self):
+        """Distinct genomes, compared by an 8-byte digest per row so memory grows with the row count only."""
+        digests = np.empty(len(self), dtype=np.uint64)
+        for start, stop in self.blocks():
+            block = b"".join(blake2b(row.tobytes(), digest_size=DIGEST_SIZE).digest() for row in self.array[start:stop])
+            digests[start:stop] = np.frombuffer(block, dtype=np.uint64)
+        return len(np.unique(digests))
+
+    def flush(self):
+        pass
+
+
+class MappedPopulation(PackedPopulation):
+    """
+    PackedPopulation kept in a memory-mapped .npy file, so resident memory is
+    bounded by the block size instead of population size x items.
+    Args:
+        path: .npy file backing the population (created or overwritten)
+        size: number of individuals
+        num_items: genes per individual
+        rows: rows per block (see block_rows)
+    """
+
+    def __init__(self, path, size, num_items, rows):
+        self.path = path
+        self.num_items = num_items
+        self.rows = rows
+        self.array = np.lib.format.open_memmap(path, "w+", np.uint8, (size, packed_length(num_items)))
+
+    def flush(self):
+        self.array.flush()
+
+
+class PackedStorage:
+    """
+    Current and next generation as two in-memory PackedPopulations. Each
+    generation is bred from `current` into `spare`, then swap() exchanges them.
+    Args:
+        size: number of individuals
+        num_items: genes per individual
+        block_bytes: working-set budget per block of unpacked rows
+    """
+
+    def __init__(self, size, num_items, block_bytes=BLOCK_BYTES):
+        rows = block_rows(num_items, block_bytes)
+        self.current = PackedPopulation(size, num_items, rows)
+        self.spare = PackedPopulation(size, num_items, rows)
+
+    def swap(self):
+        self.current.flush()
+        self.current, self.spare = self.spare, self.current
+        return self.current
+
+    def close(self):
+        self.current = self.spare = None
+
+
+class MappedStorage(PackedStorage):
+    """
+    Current and next generation as two MappedPopulations on local disk. Each
+    generation is bred from `current` into `spare`, then swap() exchanges them.
+    Args:
+        size: number of individuals
+        num_items: genes per individual
+        block_bytes: working-set budget per block of unpacked rows
+        directory: where the files live; defaults to a temporary directory removed by close()
+    """
+
+    def __init__(self, size, num_items, block_bytes=BLOCK_BYTES, directory=None):
+        self._temporary = tempfile.TemporaryDirectory(prefix="ga-population-") if directory is None else None
+        self.directory = self._temporary.name if directory is None else directory
+        rows = block_rows(num_items, block_bytes)
+        self.current = MappedPopulation(os.path.join(self.directory, "population_a.npy"), size, num_items, rows)
+        self.spare = MappedPopulation(os.path.join(self.directory, "population_b.npy"), size, num_items, rows)
+
+    def close(self):
+        # Drop the maps before deleting their files
+        self.current = self.spare = None
+        if self._temporary is not None:
+            self._temporary.cleanup()
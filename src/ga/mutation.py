@@ -1,5 +1,30 @@
+import math
 import random
 
+import numpy as np
+
+from ga.genome import flip_genes
+
+
+def flip_positions(length, mutation_rate, rng=None):
+    """
+    Sorted positions to flip among `length` genes, each flipped independently
+    with probability mutation_rate. Positions are found by jumping geometric
+    gaps, so the cost scales with the number of flips, not with `length`.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if length == 0 or mutation_rate <= 0:
+        return np.empty(0, dtype=np.int64)
+    if mutation_rate >= 1:
+        return np.arange(length)
+
+    expected = length * mutation_rate
+    batch = int(expected + 4 * math.sqrt(expected)) + 16
+    positions = np.cumsum(rng.geometric(mutation_rate, batch)) - 1
+    while positions[-1] < length - 1:
+        positions = np.concatenate((positions, positions[-1] + np.cumsum(rng.geometric(mutation_rate, batch))))
+    return positions[:np.searchsorted(positions, length)]
+
 
 class Mutation:
     @staticmethod
@@ -9,4 +34,48 @@ class Mutation:
         for i in range(len(mutated)):
             if random.random() < mutation_rate:
                 mutated[i] = 1 - mutated[i]
-        return mutated
\ No newline at end of file
+        return mutated
+
+    @staticmethod
+    def geometric_bit_flip(individual, mutation_rate, rng=None):
+        """Bit flip mutation sampling only the flipped genes (geometric gaps)."""
+        mutated = individual[:]
+        for i in flip_positions(len(mutated), mutation_rate, rng).tolist():
+            mutated[i] = 1 - mutated[i]
+        return mutated
+
+    @staticmethod
+    def population_bit_flip(population, mutation_rate, rng=None):
+        """Bit flip mutation over a whole 2-D population matrix; returns a mutated copy."""
+        mutated = np.array(population, dtype=np.uint8)
+        flat = mutated.reshape(-1)
+        flat[flip_positions(flat.size, mutation_rate, rng)] ^= 1
+        return mutated
+
+    @staticmethod
+    def population_bit_flip_rows(population, mutation_rates, rng=None):
+        """Bit flip mutation where row i flips each gene with probability mutation_rates[i]; returns a mutated copy."""
+        mutated = np.array(population, dtype=np.uint8)
+        for row, mutation_rate in zip(mutated, mutation_rates):
+            row[flip_positions(len(row), mutation_rate, rng)] ^= 1
+        return mutated
+
+    @staticmethod
+    def packed_population_bit_flip(packed, mutation_rate, num_items, rng=None):
+        """
+        population_bit_flip on a bit-packed population (see ga.genome): the same
+        random draws flip the same genes, applied as XORs on the packed bytes.
+        Returns a mutated copy.
+        """
+        mutated = np.array(packed, dtype=np.uint8)
+        rows, genes = np.divmod(flip_positions(len(mutated) * num_items, mutation_rate, rng), num_items)
+        return flip_genes(mutated, rows, genes)
+
+    @staticmethod
+    def packed_population_bit_flip_rows(packed, mutation_rates, num_items, rng=None):
+        """population_bit_flip_rows on a bit-packed population; returns a mutated copy."""
+        mutated = np.array(packed, dtype=np.uint8)
+        for row, mutation_rate in enumerate(mutation_rates):
+            genes = flip_positions(num_items, mutation_rate, rng)
+            flip_genes(mutated, np.full(len(genes), row), genes)
+        return mutated
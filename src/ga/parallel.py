@@ -0,0 +1,122 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from ga.fitness import evaluate_population_fitness
+
+# Genes (population size x items) below which evaluation stays in the calling process
+PARALLEL_THRESHOLD = 2_000_000
+
+# Per-process state of pool workers: the shared instance arrays and attached population buffers
+_worker_state = {}
+
+
+def _share(array):
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+    return shm
+
+
+def _init_worker(values_spec, weights_spec, capacity):
+    for key, (name, length, dtype) in (("values", values_spec), ("weights", weights_spec)):
+        shm = SharedMemory(name=name)
+        _worker_state[key + "_shm"] = shm
+        _worker_state[key] = np.ndarray((length,), dtype, buffer=shm.buf)
+    _worker_state["capacity"] = capacity
+    _worker_state["populations"] = {}
+
+
+def _evaluate_rows(population_name, shape, start, stop, capacity):
+    populations = _worker_state["populations"]
+    if population_name not in populations:
+        populations.clear()  # The parent only keeps one population buffer alive at a time
+        populations[population_name] = SharedMemory(name=population_name)
+    rows = np.ndarray(shape, np.uint8, buffer=populations[population_name].buf)[start:stop]
+    capacity = _worker_state["capacity"] if capacity is None else capacity
+    return evaluate_population_fitness(rows, _worker_state["values"], _worker_state["weights"], capacity)
+
+
+class ParallelEvaluator:
+    """
+    Evaluates populations by sharding rows across a process pool.
+    The instance arrays are placed in shared memory once and each generation's
+    population is copied into a shared buffer, so tasks only carry row ranges.
+    Scores are identical to KnapsackInstance.evaluate_population.
+    Args:
+        instance: KnapsackInstance being solved
+        workers: number of processes (defaults to os.cpu_count())
+        threshold: population size x items below which evaluation stays serial
+    """
+
+    def __init__(self, instance, workers=None, threshold=PARALLEL_THRESHOLD):
+        instance.require_single_constraint("Parallel evaluation")
+        self.instance = instance
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self._executor = None
+        self._shared = []
+        self._population_shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start(self):
+        values_shm = _share(self.instance.values)
+        weights_shm = _share(self.instance.weights)
+        self._shared = [values_shm, weights_shm]
+        num_items = len(self.instance)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(
+                (values_shm.name, num_items, self.instance.values.dtype),
+                (weights_shm.name, num_items, self.instance.weights.dtype),
+                self.instance.capacity,
+            ),
+        )
+
+    def _population_buffer(self, population):
+        if self._population_shm is None or self._population_shm.size < population.nbytes:
+            self._release_population()
+            self._population_shm = SharedMemory(create=True, size=max(population.nbytes, 1))
+        np.ndarray(population.shape, np.uint8, buffer=self._population_shm.buf)[...] = population
+        return self._population_shm.name
+
+    def evaluate_population(self, population, capacity=None):
+        """Score every row of a 2-D binary population matrix."""
+        population = np.asarray(population, dtype=np.uint8)
+        if self.workers < 2 or population.size < self.threshold or len(population) < 2:
+            return self.instance.evaluate_population(population, capacity)
+        if population.ndim != 2 or population.shape[1] != len(self.instance):
+            raise ValueError("Input lists must have the same length.")
+
+        if self._executor is None:
+            self._start()
+        name = self._population_buffer(population)
+        bounds = np.linspace(0, len(population), min(self.workers, len(population)) + 1, dtype=int)
+        futures = [
+            self._executor.submit(_evaluate_rows, name, population.shape, start, stop, capacity)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        return np.concatenate([future.result() for future in futures])
+
+    def _release_population(self):
+        if self._population_shm is not None:
+            self._population_shm.close()
+            self._population_shm.unlink()
+            self._population_shm = None
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release_population()
+        for shm in self._shared:
+            shm.close()
+            shm.unlink()
+        self._shared = []
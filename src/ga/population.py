@@ -1,13 +1,85 @@
 import random
+from itertools import islice
 
-POPULATION_SIZE = 50
+from ga.fitness import KnapsackInstance
 
+POPULATION_SIZE = 100
+SEEDING_MODES = ("random", "greedy", "randomized_greedy")
+GREEDY_NOISE = 0.5  # Randomized greedy scales each ratio by a factor in [1 - noise, 1 + noise]
 
-def create_population(items):
+
+def create_population(items, seeding="random", size=None, rng=None):
+    """
+    Create the initial population.
+    Args:
+        items: list of Item objects, or a KnapsackInstance (required by the greedy modes)
+        seeding: "random" (fair coin per gene), "greedy" (one ratio-greedy individual,
+            the rest random) or "randomized_greedy" (ratio-greedy plus noisy-ratio greedy individuals)
+        size: number of individuals (defaults to POPULATION_SIZE)
+        rng: random.Random to draw from (defaults to the global random module)
+    """
     if not items:
         raise ValueError("Input list must have values.")
-    return [create_individual(items) for _ in range(POPULATION_SIZE)]
+    if seeding not in SEEDING_MODES:
+        raise ValueError(f"Unknown seeding mode '{seeding}'. Use one of {SEEDING_MODES}.")
+
+    size = POPULATION_SIZE if size is None else size
+    return list(islice(seeded_individuals(items, seeding, rng), size))
+
+
+def seeded_individuals(items, seeding="random", rng=None):
+    """
+    Endless stream of the individuals create_population returns, in the same
+    order, so a large population can be built a block at a time.
+    """
+    if seeding == "random":
+        while True:
+            yield create_individual(items, rng)
+
+    yield create_greedy_individual(items)
+    while True:
+        if seeding == "greedy":
+            yield create_individual(items, rng)
+        else:
+            yield create_greedy_individual(items, GREEDY_NOISE, rng)
+
+
+def create_individual(items, rng=None):
+    rng = rng if rng is not None else random
+    return [rng.randint(0, 1) for _ in range(len(items))]
+
+
+def create_greedy_individual(instance, noise=0.0, rng=None):
+    """
+    Fill the knapsack by value/weight ratio, best first, skipping items that do not fit
+    (in any constraint, on multi-dimensional instances).
+    With noise > 0 each ratio is scaled by a random factor in [1 - noise, 1 + noise]
+    (randomized greedy), which gives different feasible individuals of similar quality.
+    """
+    if not isinstance(instance, KnapsackInstance):
+        raise ValueError("Greedy seeding needs a KnapsackInstance, which carries the capacity.")
+    if noise > 0:
+        rng = rng if rng is not None else random
+        ratios = instance.ratios.tolist()
+        keys = [ratio * rng.uniform(1 - noise, 1 + noise) for ratio in ratios]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=True)
+    else:
+        order = instance.ratio_order.tolist()
 
+    individual = [0] * len(instance)
+    if instance.dimensions > 1:
+        demands = instance.demands.tolist()
+        remaining = instance.capacities.tolist()
+        for index in order:
+            if all(demand <= left for demand, left in zip(demands[index], remaining)):
+                individual[index] = 1
+                remaining = [left - demand for demand, left in zip(demands[index], remaining)]
+        return individual
 
-def create_individual(items):
-    return [random.randint(0, 1) for _ in items]
+    weights = instance.weights.tolist()
+    remaining = instance.capacity
+    for index in order:
+        if weights[index] <= remaining:
+            individual[index] = 1
+            remaining -= weights[index]
+    return individual
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+def repair_population(population, instance, capacity=None):
+    """
+    Make every infeasible individual feasible by removing its selected items
+    in ascending value/weight ratio order until it fits the capacity (every
+    capacity on multi-dimensional instances). Feasible individuals are left untouched.
+    Args:
+        population: 2-D binary matrix, one row per individual
+        instance: KnapsackInstance being solved
+        capacity: optional override of the instance capacity
+    Returns:
+        repaired copy of the population as a uint8 matrix
+    """
+    population = np.array(population, dtype=np.uint8)
+    if population.size == 0:
+        return population.reshape(len(population), len(instance))
+    if instance.dimensions > 1:
+        return _repair_multi(population, instance, capacity)
+
+    capacity = instance.capacity if capacity is None else capacity
+    excess = population @ instance.weights - capacity
+    infeasible = np.flatnonzero(excess > 0)
+    if not len(infeasible):
+        return population
+
+    worst_first = instance.ratio_order[::-1]
+    rows = population[np.ix_(infeasible, worst_first)]
+    removable = rows * instance.weights[worst_first]
+    # Remove an item while the weight removed before it still leaves the row overweight
+    removed_before = np.cumsum(removable, axis=1) - removable
+    remove = (rows == 1) & (removed_before < excess[infeasible, None])
+    rows[remove] = 0
+    population[np.ix_(infeasible, worst_first)] = rows
+    return population
+
+
+def _repair_multi(population, instance, capacity):
+    excess = instance.excess(population, capacity)
+    infeasible = np.flatnonzero(excess.any(axis=1))
+    if not len(infeasible):
+        return population
+
+    worst_first = instance.ratio_order[::-1]
+    rows = population[np.ix_(infeasible, worst_first)]
+    removable = rows[:, :, None] * instance.demands[worst_first]
+    # Same rule per constraint: remove an item while the demand removed before it leaves any constraint exceeded
+    removed_before = np.cumsum(removable, axis=1) - removable
+    remove = (rows == 1) & (removed_before < excess[infeasible, None, :]).any(axis=2)
+    rows[remove] = 0
+    population[np.ix_(infeasible, worst_first)] = rows
+    return population
+
+
+def repair_individual(individual, instance, capacity=None):
+    """Repair a single binary list; see repair_population."""
+    return repair_population([individual], instance, capacity)[0].tolist()
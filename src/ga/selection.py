@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 def tournament_selection(population, fitness_scores, tournament_size):
     #Realiza a seleção por torneio usando 3 variaveis:
     #1 population: lista de indivíduos (listas binárias).
@@ -28,3 +30,51 @@ def roulette_selection(population, fitness_scores):
         current += fitness
         if current >= pick:
             return individual.copy()  # Retorna uma cópia ao invés de uma referência
+
+
+def roulette_selection_indices(fitness_scores, num_parents, rng=None):
+
+    #Seleção por roleta em lote: monta a distribuição acumulada uma vez por geração
+    #e sorteia todos os pais de uma só vez com busca binária (O(log n) por pai).
+    #1 fitness_scores: lista/array com valores de fitness (não negativos) da população.
+    #2 num_parents: quantidade de pais a sortear.
+    #3 rng: numpy Generator opcional (usa um novo se omitido).
+    #Retorna os índices dos pais; quem chama decide quando copiar os indivíduos.
+
+    fitness_scores = np.asarray(fitness_scores)
+    if (fitness_scores < 0).any():
+        raise ValueError("O fitness não pode ser negativo na seleção por roleta.")
+
+    cumulative = np.cumsum(fitness_scores)
+    total_fitness = cumulative[-1] if len(cumulative) else 0
+    if total_fitness <= 0:
+        raise ValueError("O fitness total deve ser positivo. Não é possível realizar a seleção por roleta.")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    picks = rng.random(num_parents) * total_fitness
+    # Primeiro índice cuja soma acumulada alcança o sorteio, como na roleta linear
+    return np.searchsorted(cumulative, picks, side="left")
+
+
+def tournament_selection_indices(fitness_scores, num_parents, tournament_size, rng=None):
+
+    #Seleção por torneio em lote, sem montar listas de (indivíduo, fitness):
+    #sorteia todos os torneios da geração como uma matriz (num_parents x tournament_size)
+    #de índices e escolhe o vencedor de cada linha com argmax sobre o fitness.
+    #Os competidores são sorteados com reposição, o que evita custo O(P) por pai.
+    #1 fitness_scores: lista/array com valores de fitness da população.
+    #2 num_parents: quantidade de pais a sortear.
+    #3 tournament_size: número de competidores por torneio.
+    #4 rng: numpy Generator opcional (usa um novo se omitido).
+    #Retorna os índices dos vencedores.
+
+    fitness_scores = np.asarray(fitness_scores)
+    if tournament_size < 1:
+        raise ValueError("O torneio deve ter pelo menos um competidor.")
+    if len(fitness_scores) == 0:
+        raise ValueError("A população não pode ser vazia.")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    competitors = rng.integers(0, len(fitness_scores), size=(num_parents, tournament_size))
+    winners = fitness_scores[competitors].argmax(axis=1)  # Em empate vence o primeiro sorteado
+    return competitors[np.arange(num_parents), winners]
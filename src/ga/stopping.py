@@ -0,0 +1,105 @@
+import time
+
+import numpy as np
+
+from ga.exact import dantzig_bound
+from ga.mapped import PackedPopulation
+
+# Why a run ended; "generations" means it used its full generation budget and
+# "deadline" that GAEngine.anytime's caller deadline passed
+STOP_REASONS = ("generations", "stall", "target", "time_budget", "diversity", "deadline")
+
+
+def population_diversity(population):
+    """
+    Mean pairwise Hamming distance between individuals, as a fraction of the
+    genome length: about 0.5 for a uniformly random population and 0 once
+    every individual is identical.
+    Args:
+        population: population matrix (population size x items) of 0/1 genes, or a PackedPopulation
+    Returns:
+        diversity in [0, 1]
+    """
+    if isinstance(population, PackedPopulation):
+        size, num_items = len(population), population.num_items
+        ones = population.ones_per_locus() if size >= 2 else None
+    else:
+        population = np.asarray(population, dtype=np.uint8)
+        size, num_items = population.shape
+        ones = population.sum(axis=0, dtype=np.int64)
+    if size < 2 or num_items == 0:
+        return 0.0
+    # Pairs that differ at each locus: ones x zeros, out of size x (size - 1) / 2 pairs
+    differing_pairs = (ones * (size - ones)).sum()
+    return float(differing_pairs / (num_items * size * (size - 1) / 2))
+
+
+class EarlyStopping:
+    """
+    Stop criteria of a GA run, checked once per generation. Each criterion is
+    disabled by its default value.
+    Args:
+        stall_generations: stop after this many generations without improvement (0 disables)
+        target_fitness: stop once the best fitness reaches this value
+        time_budget: stop after this many wall-clock seconds
+        min_diversity: stop once population_diversity falls below this value (0 disables)
+    """
+
+    def __init__(self, stall_generations=0, target_fitness=None, time_budget=None, min_diversity=0.0):
+        if stall_generations < 0:
+            raise ValueError("Stall generations must not be negative.")
+        if time_budget is not None and time_budget < 0:
+            raise ValueError("Time budget must not be negative.")
+        self.stall_generations = stall_generations
+        self.target_fitness = target_fitness
+        self.time_budget = time_budget
+        self.min_diversity = min_diversity
+        self.start = time.perf_counter()
+        self.best_fitness = None
+        self.stalled = 0
+
+    @classmethod
+    def from_config(cls, config, instance):
+        """Criteria from a GAConfig; stop_at_bound targets the instance's Dantzig upper bound."""
+        target = config.target_fitness
+        if config.stop_at_bound:
+            bound = dantzig_bound(instance)
+            target = bound if target is None else min(target, bound)
+        return cls(config.stall_generations, target, config.time_budget, config.min_diversity)
+
+    def state(self):
+        """Progress of the criteria, for checkpoints."""
+        return {"best_fitness": self.best_fitness, "stalled": self.stalled, "elapsed": self.elapsed}
+
+    def restore(self, state):
+        """Continue from state(); the time budget keeps counting from the saved elapsed time."""
+        self.best_fitness = state["best_fitness"]
+        self.stalled = state["stalled"]
+        self.start = time.perf_counter() - state["elapsed"]
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def check(self, best_fitness, population=None):
+        """
+        Record one generation and return the reason to stop, or None to continue.
+        Args:
+            best_fitness: best fitness found so far in the run
+            population: current population matrix (only read when min_diversity is set)
+        """
+        if self.best_fitness is None or best_fitness > self.best_fitness:
+            self.best_fitness = best_fitness
+            self.stalled = 0
+        else:
+            self.stalled += 1
+
+        if self.target_fitness is not None and best_fitness >= self.target_fitness:
+            return "target"
+        if self.stall_generations and self.stalled >= self.stall_generations:
+            return "stall"
+        if self.min_diversity and population is not None and population_diversity(population) < self.min_diversity:
+            return "diversity"
+        if self.time_budget is not None and self.elapsed >= self.time_budget:
+            return "time_budget"
+        return None
@@ -1,28 +1,81 @@
+import os
 import random
 
-import matplotlib.pyplot as plt
+import numpy as np
 
-from ga.fitness import evaluate_fitness, Item
-from ga.population import create_population
-from src.ga.crossover import Crossover
-from src.ga.mutation import Mutation
-from src.ga.selection import roulette_selection
+from ga.engine import GAConfig, GAEngine
+from ga.exact import branch_and_bound, dp_solve, optimality_gap
+from ga.fitness import evaluate_population_fitness, Item, KnapsackInstance
+from ga.instrumentation import JsonLinesWriter
+from ga.island import IslandConfig, run_islands
+from report import show_history, write_outputs
+
+DEFAULTS = GAConfig()
 
 # Configuration parameters - Balanced for demonstration
 NUM_ITEMS = 50  # Challenging but manageable
-POPULATION_SIZE = 100  # Good diversity without performance issues
-GENERATIONS = 200
-MUTATION_RATE = 0.05
-TOURNAMENT_SIZE = 5
-ELITISM_SIZE = 5
+POPULATION_SIZE = DEFAULTS.population_size  # Good diversity without performance issues
+GENERATIONS = DEFAULTS.generations
+MUTATION_RATE = DEFAULTS.mutation_rate
+TOURNAMENT_SIZE = DEFAULTS.tournament_size  # Starting size when ADAPTIVE_TOURNAMENT is set
+ELITISM_SIZE = DEFAULTS.elitism_size
+SELECTION_STRATEGY = DEFAULTS.selection  # "roulette" or "tournament"
+CROSSOVER_STRATEGY = DEFAULTS.crossover  # "one_point", "two_point", "k_point" or "uniform"
+CROSSOVER_RATE = DEFAULTS.crossover_rate  # Probability that a pair of parents is crossed
+CROSSOVER_POINTS = DEFAULTS.crossover_points  # Cut points for "k_point" crossover
 KNAPSACK_CAPACITY = 200  # Proportional to item count
+FITNESS_CACHE_SIZE = DEFAULTS.fitness_cache_size  # Max cached genomes; 0 disables the fitness cache
+INCREMENTAL_EVALUATION = DEFAULTS.incremental  # Carry running totals and score children by delta updates
+PARALLEL_WORKERS = DEFAULTS.parallel_workers  # Processes for fitness evaluation; 0 keeps it serial (small problems stay serial anyway)
+NUM_ISLANDS = 0  # Independent populations in separate processes; 0 or 1 runs a single population
+MIGRATION_INTERVAL = 10  # Generations between island migrations
+MIGRATION_SIZE = 2  # Best individuals each island sends per migration
+SOLVER_BACKEND = "ga"  # "ga" (genetic algorithm), "dp" (dynamic programming) or "bnb" (branch-and-bound)
+EXACT_TIME_LIMIT = 10.0  # Seconds before branch-and-bound returns its best incumbent
+REPORT_OPTIMALITY_GAP = False  # Prove an upper bound with branch-and-bound and report the GA's gap to it
+SEEDING = DEFAULTS.seeding  # Initial population: "random", "greedy" or "randomized_greedy"
+REPAIR = DEFAULTS.repair  # Make overweight children feasible by dropping their lowest-ratio items
+PENALTY_FITNESS = DEFAULTS.penalty_fitness  # Select with a graded penalty for excess weight instead of a flat zero
+SEED_WITH_EXACT = DEFAULTS.seed_with_exact  # Insert the exact DP optimum into the initial GA population
+STALL_GENERATIONS = DEFAULTS.stall_generations  # Stop after this many generations without improvement; 0 runs all GENERATIONS
+TARGET_FITNESS = DEFAULTS.target_fitness  # Stop once this fitness is reached; None disables
+STOP_AT_BOUND = DEFAULTS.stop_at_bound  # Stop once the best fitness reaches the Dantzig upper bound (provably optimal)
+TIME_BUDGET = DEFAULTS.time_budget  # Wall-clock seconds for the GA run; None disables
+MIN_DIVERSITY = DEFAULTS.min_diversity  # Stop once population diversity (0-0.5) drops below this; 0 disables
+CHECKPOINT_PATH = DEFAULTS.checkpoint_path  # File the GA run is checkpointed to; None disables
+CHECKPOINT_INTERVAL = DEFAULTS.checkpoint_interval  # Generations between checkpoints
+RESUME_FROM_CHECKPOINT = False  # Continue from CHECKPOINT_PATH when it exists
+ADAPTIVE_MUTATION = DEFAULTS.adaptive_mutation  # "fixed", "one_fifth" (1/5th success rule) or "self_adaptive" (per-individual rates)
+ADAPTIVE_TOURNAMENT = DEFAULTS.adaptive_tournament  # Grow the tournament from TOURNAMENT_SIZE to MAX_TOURNAMENT_SIZE as diversity falls (tournament selection only)
+MAX_TOURNAMENT_SIZE = DEFAULTS.max_tournament_size
+STORAGE = DEFAULTS.storage  # "memory" (1 byte per gene), "packed" (1 bit per gene) or "mmap" (packed, on disk)
+OUTPUT_MODE = "plot"  # "plot" opens an interactive chart; "headless" writes CSV/JSON (and optionally PNG) files instead
+OUTPUT_DIR = "results"  # Directory for headless output files
+SAVE_PNG = True  # In headless mode, also render the fitness chart to OUTPUT_DIR/fitness.png
+INSTRUMENTATION_LOG = None  # JSON-lines file for per-generation phase timings and counts; None disables
 
 # Generate random items
 items = [Item(random.randint(1, 20), random.randint(1, 15)) for _ in range(NUM_ITEMS)]
 
 
-def calculate_population_fitness(population, items, capacity):
-    return [evaluate_fitness(individual, items, capacity) for individual in population]
+def calculate_population_fitness(population, items, capacity, cache=None, pool=None):
+    population_matrix = np.asarray(population, dtype=np.uint8)
+    if pool is not None:
+        def evaluate(rows):
+            return pool.evaluate_population(rows, capacity)
+    elif isinstance(items, KnapsackInstance):
+        def evaluate(rows):
+            return items.evaluate_population(rows, capacity)
+    else:
+        values = [item.value for item in items]
+        weights = [item.weight for item in items]
+
+        def evaluate(rows):
+            return evaluate_population_fitness(rows, values, weights, capacity)
+
+    if cache is not None:
+        return cache.evaluate_population(population_matrix, evaluate)
+    return evaluate(population_matrix).tolist()
 
 
 def get_best_individual(population, fitness_scores):
@@ -30,6 +83,41 @@ def get_best_individual(population, fitness_scores):
     return population[best_idx], fitness_scores[best_idx]
 
 
+def build_config():
+    """GAConfig from the module-level parameters; the seed follows the `random` module."""
+    return GAConfig(
+        population_size=POPULATION_SIZE,
+        generations=GENERATIONS,
+        mutation_rate=MUTATION_RATE,
+        tournament_size=TOURNAMENT_SIZE,
+        elitism_size=ELITISM_SIZE,
+        selection=SELECTION_STRATEGY,
+        crossover=CROSSOVER_STRATEGY,
+        crossover_rate=CROSSOVER_RATE,
+        crossover_points=CROSSOVER_POINTS,
+        seeding=SEEDING,
+        seed_with_exact=SEED_WITH_EXACT,
+        repair=REPAIR,
+        penalty_fitness=PENALTY_FITNESS,
+        fitness_cache_size=FITNESS_CACHE_SIZE,
+        incremental=INCREMENTAL_EVALUATION,
+        parallel_workers=PARALLEL_WORKERS,
+        stall_generations=STALL_GENERATIONS,
+        target_fitness=TARGET_FITNESS,
+        stop_at_bound=STOP_AT_BOUND,
+        time_budget=TIME_BUDGET,
+        min_diversity=MIN_DIVERSITY,
+        adaptive_mutation=ADAPTIVE_MUTATION,
+        adaptive_tournament=ADAPTIVE_TOURNAMENT,
+        max_tournament_size=MAX_TOURNAMENT_SIZE,
+        checkpoint_path=CHECKPOINT_PATH,
+        checkpoint_interval=CHECKPOINT_INTERVAL,
+        storage=STORAGE,
+        seed=random.getrandbits(64),
+        verbose=True,
+    )
+
+
 def genetic_algorithm():
     print("=== Knapsack Optimization with Genetic Algorithm ===")
     print(f"Items: {items}")
@@ -37,63 +125,91 @@ def genetic_algorithm():
     print(f"Population size: {POPULATION_SIZE}")
     print(f"Generations: {GENERATIONS}")
     print(f"Mutation rate: {MUTATION_RATE}")
+    print(f"Selection: {SELECTION_STRATEGY}")
+    print(f"Crossover: {CROSSOVER_STRATEGY} (rate {CROSSOVER_RATE})")
     print("-" * 50)
 
-    population = create_population(items)
-
-    best_fitness_history = []
-    avg_fitness_history = []
-    best_solution = None
-    best_fitness = 0
+    sinks = [JsonLinesWriter(INSTRUMENTATION_LOG)] if INSTRUMENTATION_LOG else []
+    engine = GAEngine(KnapsackInstance(items, KNAPSACK_CAPACITY), build_config(), sinks)
+    resume_from = None
+    if RESUME_FROM_CHECKPOINT and CHECKPOINT_PATH and os.path.exists(CHECKPOINT_PATH):
+        resume_from = CHECKPOINT_PATH
+        print(f"Resuming from checkpoint {resume_from}")
+    result = engine.run(resume_from)
+    print(f"Stopped after {result.generations_run} generations ({result.stop_reason})")
 
-    for generation in range(GENERATIONS):
-        fitness_scores = calculate_population_fitness(population, items, KNAPSACK_CAPACITY)
+    if engine.cache is not None:
+        cache = engine.cache
+        print(f"Fitness cache: hits={cache.hits}, misses={cache.misses}, hit rate={cache.hit_rate:.1%}")
 
-        current_best_individual, current_best_fitness = get_best_individual(population, fitness_scores)
-        avg_fitness = sum(fitness_scores) / len(fitness_scores)
+    return result.results()
 
-        best_fitness_history.append(current_best_fitness)
-        avg_fitness_history.append(avg_fitness)
-
-        if current_best_fitness > best_fitness:
-            best_fitness = current_best_fitness
-            best_solution = current_best_individual.copy()
-
-        if generation % 10 == 0 or generation == GENERATIONS - 1:
-            print(f"Generation {generation:3d}: Best={current_best_fitness:3d}, Avg={avg_fitness:6.2f}")
 
+def island_genetic_algorithm():
+    print("=== Knapsack Optimization with Island-Model Genetic Algorithm ===")
+    print(f"Islands: {NUM_ISLANDS} (migration every {MIGRATION_INTERVAL} generations)")
+    print("-" * 50)
 
-        new_population = []
+    instance = KnapsackInstance(items, KNAPSACK_CAPACITY)
+    # Alternate selection methods so the islands explore differently
+    configs = [
+        IslandConfig(
+            population_size=POPULATION_SIZE,
+            mutation_rate=MUTATION_RATE,
+            selection="tournament" if index % 2 else "roulette",
+            tournament_size=TOURNAMENT_SIZE,
+            elitism_size=ELITISM_SIZE,
+            crossover=CROSSOVER_STRATEGY,
+            crossover_rate=CROSSOVER_RATE,
+            crossover_points=CROSSOVER_POINTS,
+        )
+        for index in range(NUM_ISLANDS)
+    ]
+    result = run_islands(instance, configs, GENERATIONS, MIGRATION_INTERVAL, MIGRATION_SIZE,
+                         seed=random.getrandbits(64))
+
+    for index, island in enumerate(result.islands):
+        print(f"Island {index} ({configs[index].selection}): Best={island.best_fitness}")
+
+    return result.results()
+
+
+def exact_algorithm():
+    print(f"=== Knapsack Optimization with Exact Solver ({SOLVER_BACKEND}) ===")
+    print(f"Knapsack capacity: {KNAPSACK_CAPACITY}")
+    print("-" * 50)
 
-        # Elitism: keep best individuals
-        sorted_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)
-        for i in range(ELITISM_SIZE):
-            new_population.append(population[sorted_indices[i]].copy())
+    instance = KnapsackInstance(items, KNAPSACK_CAPACITY)
+    if SOLVER_BACKEND == "bnb":
+        result = branch_and_bound(instance, time_limit=EXACT_TIME_LIMIT)
+        best_solution, best_fitness = result.best_solution, result.best_fitness
+        print(f"Best fitness: {best_fitness} (upper bound {result.upper_bound}, gap {result.gap:.2%}, {result.nodes} nodes)")
+    else:
+        best_solution, best_fitness = dp_solve(instance)
+        print(f"Optimal fitness: {best_fitness}")
 
-        # Generate rest of population through selection, crossover, and mutation
-        while len(new_population) < POPULATION_SIZE:
-            # Selection
-            if sum(fitness_scores) > 0:
-                parent1 = roulette_selection(population, fitness_scores)
-                parent2 = roulette_selection(population, fitness_scores)
-            else:
-                # Fallback to random selection if all fitness scores are 0
-                parent1 = random.choice(population)
-                parent2 = random.choice(population)
+    # Single-point histories keep the shape display_results expects
+    return best_solution, best_fitness, [best_fitness], [best_fitness]
 
-            # Crossover
-            child1, child2 = Crossover.one_point(parent1, parent2)
 
-            # Mutation
-            child1 = Mutation.bit_flip(child1, MUTATION_RATE)
-            child2 = Mutation.bit_flip(child2, MUTATION_RATE)
+def solve():
+    if SOLVER_BACKEND in ("dp", "bnb"):
+        return exact_algorithm()
+    if SOLVER_BACKEND != "ga":
+        raise ValueError(f"Unknown solver backend '{SOLVER_BACKEND}'.")
 
-            # Add children to new population
-            new_population.extend([child1, child2])
+    results = island_genetic_algorithm() if NUM_ISLANDS > 1 else genetic_algorithm()
+    if REPORT_OPTIMALITY_GAP:
+        report_optimality_gap(results[1])
+    return results
 
-        population = new_population[:POPULATION_SIZE]
 
-    return best_solution, best_fitness, best_fitness_history, avg_fitness_history
+def report_optimality_gap(best_fitness):
+    bound = branch_and_bound(KnapsackInstance(items, KNAPSACK_CAPACITY), time_limit=EXACT_TIME_LIMIT)
+    gap = optimality_gap(best_fitness, bound.upper_bound)
+    proof = "optimal" if bound.optimal else "bound"
+    print(f"Optimality gap: {gap:.2%} (GA {best_fitness} vs {proof} {bound.upper_bound})")
+    return gap
 
 
 def display_results(best_solution, best_fitness, best_fitness_history, avg_fitness_history):
@@ -115,20 +231,21 @@ def display_results(best_solution, best_fitness, best_fitness_history, avg_fitne
     print(f"Best fitness achieved: {best_fitness}")
     print(f"Best solution: {best_solution}")
 
-    plt.figure(figsize=(10, 6))
-    plt.plot(best_fitness_history, label='Best Fitness', linewidth=2)
-    plt.plot(avg_fitness_history, label='Average Fitness', linewidth=2)
-    plt.xlabel('Generation')
-    plt.ylabel('Fitness')
-    plt.title('Genetic Algorithm Evolution - Knapsack Problem')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.show()
+    if OUTPUT_MODE == "headless":
+        paths = write_outputs(
+            OUTPUT_DIR, best_solution, best_fitness, best_fitness_history, avg_fitness_history, png=SAVE_PNG,
+            total_weight=total_weight, capacity=KNAPSACK_CAPACITY,
+        )
+        print(f"Results written to: {', '.join(paths)}")
+    elif OUTPUT_MODE == "plot":
+        show_history(best_fitness_history, avg_fitness_history)
+    else:
+        raise ValueError(f"Unknown output mode '{OUTPUT_MODE}'.")
 
 
 def main():
     try:
-        best_solution, best_fitness, best_fitness_history, avg_fitness_history = genetic_algorithm()
+        best_solution, best_fitness, best_fitness_history, avg_fitness_history = solve()
         display_results(best_solution, best_fitness, best_fitness_history, avg_fitness_history)
     except Exception as e:
         print(f"Error during execution: {e}")
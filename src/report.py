@@ -0,0 +1,78 @@
+import csv
+import json
+import os
+
+PLOT_TITLE = 'Genetic Algorithm Evolution - Knapsack Problem'
+
+
+def write_history_csv(path, best_fitness_history, avg_fitness_history):
+    """One row per generation: generation,best_fitness,avg_fitness."""
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("generation", "best_fitness", "avg_fitness"))
+        for generation, (best, avg) in enumerate(zip(best_fitness_history, avg_fitness_history)):
+            writer.writerow((generation, best, avg))
+
+
+def write_results_json(path, best_solution, best_fitness, best_fitness_history, avg_fitness_history, **extra):
+    """Best solution, its fitness and both histories as one JSON document; `extra` adds top-level fields."""
+    document = dict(
+        best_fitness=best_fitness,
+        best_solution=best_solution,
+        best_fitness_history=best_fitness_history,
+        avg_fitness_history=avg_fitness_history,
+        **extra,
+    )
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+
+
+def _draw_history(axes, best_fitness_history, avg_fitness_history):
+    axes.plot(best_fitness_history, label='Best Fitness', linewidth=2)
+    axes.plot(avg_fitness_history, label='Average Fitness', linewidth=2)
+    axes.set_xlabel('Generation')
+    axes.set_ylabel('Fitness')
+    axes.set_title(PLOT_TITLE)
+    axes.legend()
+    axes.grid(True, alpha=0.3)
+
+
+def save_history_png(path, best_fitness_history, avg_fitness_history):
+    """
+    Render the fitness curves to a PNG with matplotlib's Agg canvas. pyplot is
+    not used, so no GUI backend or display is needed; matplotlib is imported here
+    rather than at module level so runs that never plot don't pay for it.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(10, 6))
+    FigureCanvasAgg(figure)
+    _draw_history(figure.subplots(), best_fitness_history, avg_fitness_history)
+    figure.savefig(path)
+
+
+def show_history(best_fitness_history, avg_fitness_history):
+    """Plot the fitness curves in an interactive window (blocks until it is closed)."""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 6))
+    _draw_history(plt.gca(), best_fitness_history, avg_fitness_history)
+    plt.show()
+
+
+def write_outputs(directory, best_solution, best_fitness, best_fitness_history, avg_fitness_history, png=False,
+                  **extra):
+    """
+    Headless output: history.csv and results.json (plus fitness.png when `png`) in `directory`.
+    Returns:
+        list of written paths
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, "history.csv"), os.path.join(directory, "results.json")]
+    write_history_csv(paths[0], best_fitness_history, avg_fitness_history)
+    write_results_json(paths[1], best_solution, best_fitness, best_fitness_history, avg_fitness_history, **extra)
+    if png:
+        paths.append(os.path.join(directory, "fitness.png"))
+        save_history_png(paths[-1], best_fitness_history, avg_fitness_history)
+    return paths
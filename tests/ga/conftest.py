@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+from ga.fitness import Item, KnapsackInstance
+
+
+@pytest.fixture
+def make_instance():
+    """Factory for the small deterministic instance shared by the engine-level tests."""
+    def make(num_items=30, capacity=60):
+        return KnapsackInstance([Item(i * 7 % 19 + 1, i * 5 % 11 + 1) for i in range(num_items)], capacity)
+    return make
+
+
+@pytest.fixture
+def random_instance():
+    """Factory for seeded random instances whose capacity is three times the item count."""
+    def make(num_items=50, seed=0):
+        rng = np.random.default_rng(seed)
+        values, weights = rng.integers(0, 20, num_items), rng.integers(1, 15, num_items)
+        return KnapsackInstance([Item(int(v), int(w)) for v, w in zip(values, weights)], 3 * num_items)
+    return make
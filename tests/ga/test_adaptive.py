@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from ga.adaptive import MAX_MUTATION_RATE, ONE_FIFTH_FACTOR, ParameterControl
+from ga.checkpoint import load_checkpoint
+from ga.engine import GAConfig, GAEngine, GAResult
+from ga.instrumentation import StatsRecorder
+
+
+def control(**settings):
+    return ParameterControl(GAConfig(**settings), num_items=20)
+
+
+class TestParameterControl:
+
+    def test_one_fifth_rule(self):
+        rule = control(adaptive_mutation="one_fifth", mutation_rate=0.1, elitism_size=1)
+        parents = np.array([1, 2, 1, 2])
+        rule.offspring([0, 5, 5], [0], parents, 5, np.random.default_rng(0))
+
+        # Two of the four children beat their better parent (fitness 5): success rate 0.5 > 1/5
+        decisions = rule.update([9, 9, 6, 1, 2])
+
+        assert decisions == {"success_rate": 0.5, "mutation_rate": pytest.approx(0.1 / ONE_FIFTH_FACTOR)}
+        rule.offspring([0, 5, 5], [0], parents, 5, np.random.default_rng(0))
+        rule.update([9, 1, 1, 1, 1])
+        assert rule.mutation_rate == pytest.approx(0.1)
+
+    def test_rates_are_clipped(self):
+        rule = control(adaptive_mutation="one_fifth", mutation_rate=0.45, elitism_size=0)
+        for _ in range(5):
+            rule.offspring([0, 0], [], np.array([0, 1]), 2, np.random.default_rng(0))
+            rule.update([1, 1])
+
+        assert rule.mutation_rate == MAX_MUTATION_RATE
+
+    def test_self_adaptive_rates_are_inherited(self):
+        rule = control(adaptive_mutation="self_adaptive", mutation_rate=0.05, elitism_size=1)
+        rng = np.random.default_rng(1)
+        rule.initial_rates(4, rng)
+        rule.rates = np.array([0.01, 0.04, 0.09, 0.2])
+
+        child_rates = rule.offspring([4, 3, 2, 1], [3], np.array([0, 1, 1, 2]), 4, rng)
+
+        assert len(child_rates) == 4
+        assert rule.rates[0] == 0.2  # the elite keeps its rate
+        np.testing.assert_allclose(rule.rates[1:], child_rates[:3])
+        # Log-normal noise around the parents' geometric mean (0.02 and 0.06)
+        assert 0.005 < child_rates[0] < 0.08 and 0.015 < child_rates[2] < 0.24
+
+    def test_tournament_grows_as_diversity_falls(self):
+        rule = control(adaptive_tournament=True, selection="tournament", tournament_size=2, max_tournament_size=8)
+        diverse = np.array([[0, 1, 0, 1], [1, 0, 1, 0]], dtype=np.uint8)
+        converged = np.array([[0, 1, 0, 1], [0, 1, 0, 0]], dtype=np.uint8)
+
+        assert rule.update([1, 1], diverse)["tournament_size"] == 2
+        assert rule.update([1, 1], converged)["tournament_size"] == 7
+        assert rule.update([1, 1], converged[[0, 0]])["tournament_size"] == 8
+
+
+class TestAdaptiveEngine:
+
+    @pytest.mark.parametrize("settings", [
+        {"adaptive_mutation": "one_fifth"},
+        {"adaptive_mutation": "self_adaptive", "storage": "mmap", "block_bytes": 90},
+        {"adaptive_mutation": "self_adaptive", "repair": True},
+        {"adaptive_tournament": True, "selection": "tournament", "incremental": True},
+    ])
+    def test_runs_and_logs_decisions(self, settings, make_instance):
+        instance = make_instance()
+        recorder = StatsRecorder()
+
+        result = GAEngine(instance, GAConfig(population_size=20, generations=10, seed=2, **settings), [recorder]).run()
+
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        assert "success_rate" not in recorder.generations[0].adaptation
+        assert all(stats.adaptation for stats in recorder.generations[1:])
+        assert all("adaptation" in stats.timings for stats in recorder.generations)
+
+    def test_fixed_settings_are_unchanged(self, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=16, generations=10, seed=3)
+        recorder = StatsRecorder()
+
+        GAEngine(instance, config, [recorder]).run()
+
+        assert all(stats.adaptation == {} for stats in recorder.generations)
+
+    def test_resume_is_bit_for_bit(self, tmp_path, make_instance):
+        instance = make_instance()
+        path = tmp_path / "run.ckpt"
+        settings = dict(population_size=16, generations=30, seed=4, adaptive_mutation="self_adaptive",
+                        adaptive_tournament=True, selection="tournament")
+        uninterrupted = GAEngine(instance, GAConfig(**settings)).run()
+
+        config = GAConfig(checkpoint_path=str(path), checkpoint_interval=10, **settings)
+        evolve = GAEngine(instance, config).evolve(GAResult(None, 0))
+        for generation, _ in evolve:
+            if generation == 14:
+                break
+        evolve.close()
+        assert len(load_checkpoint(path).mutation_rates) == 16
+
+        assert GAEngine(instance, config).run(resume_from=path) == uninterrupted
+
+    def test_invalid_settings(self):
+        for settings in ({"adaptive_mutation": "annealed"}, {"adaptive_mutation": "self_adaptive", "incremental": True},
+                         {"adaptive_tournament": True, "selection": "tournament", "tournament_size": 6,
+                          "max_tournament_size": 4},
+                         {"adaptive_tournament": True, "selection": "roulette"}):
+            with pytest.raises(ValueError):
+                GAConfig(**settings)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from ga.cache import FitnessCache, ENTRY_OVERHEAD_BYTES
+from ga.fitness import Item, KnapsackInstance
+from ga.genome import pack_population
+
+
+class TestFitnessCache:
+    def test_key_is_compact_and_stable(self):
+        key1 = FitnessCache.key([1, 0, 1] * 1000)
+        key2 = FitnessCache.key(np.array([1, 0, 1] * 1000, dtype=np.uint8))
+
+        assert key1 == key2
+        assert len(key1) == 16
+        assert FitnessCache.key([1, 0, 0]) != FitnessCache.key([0, 0, 1])
+
+    def test_packed_key_matches_unpacked_key(self):
+        genomes = [[1, 0, 1, 0, 0, 0, 0, 0, 1], [1, 1, 0, 0, 0, 0, 0, 0, 1]]
+        packed = pack_population(genomes)
+
+        assert [FitnessCache.packed_key(row) for row in packed] == [FitnessCache.key(g) for g in genomes]
+        assert FitnessCache.packed_key(packed[0]) != FitnessCache.packed_key(packed[1])
+
+    def test_get_put_counts_hits_and_misses(self):
+        cache = FitnessCache(max_entries=10)
+        key = FitnessCache.key([1, 0])
+
+        assert cache.get(key) is None
+        cache.put(key, 42)
+        assert cache.get(key) == 42
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        cache = FitnessCache(max_entries=2)
+        a, b, c = (FitnessCache.key(g) for g in ([1, 0], [0, 1], [1, 1]))
+
+        cache.put(a, 1)
+        cache.put(b, 2)
+        cache.get(a)  # a becomes most recently used
+        cache.put(c, 3)
+
+        assert len(cache) == 2
+        assert cache.get(b) is None
+        assert cache.get(a) == 1
+        assert cache.get(c) == 3
+
+    def test_memory_limit(self):
+        cache = FitnessCache(max_entries=1000, max_bytes=ENTRY_OVERHEAD_BYTES * 5)
+        assert cache.max_entries == 5
+
+        with pytest.raises(ValueError):
+            FitnessCache(max_bytes=1)
+
+    def test_evaluate_population_only_evaluates_new_genomes(self):
+        instance = KnapsackInstance([Item(10, 2), Item(20, 5), Item(15, 3)], 6)
+        population = np.array([[1, 0, 1], [0, 1, 0], [1, 0, 1], [1, 1, 1]], dtype=np.uint8)
+        evaluated_rows = []
+
+        def evaluate(rows):
+            evaluated_rows.append(len(rows))
+            return instance.evaluate_population(rows)
+
+        cache = FitnessCache()
+        first = cache.evaluate_population(population, evaluate)
+        second = cache.evaluate_population(population, evaluate)
+
+        assert first == second == instance.evaluate_population(population).tolist()
+        assert evaluated_rows == [3]
+        assert cache.misses == 3
+        assert cache.hits == 5
+
+    def test_clear(self):
+        cache = FitnessCache()
+        cache.put(FitnessCache.key([1]), 1)
+        cache.get(FitnessCache.key([1]))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
@@ -0,0 +1,117 @@
+import os
+import random
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from ga.checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from ga.engine import GAConfig, GAEngine, GAResult
+from ga.instrumentation import StatsRecorder
+
+
+def interrupted_run(instance, config, stop_after):
+    """Abandon a checkpointing run after generation `stop_after`, as a preempted process would."""
+    evolve = GAEngine(instance, config).evolve(GAResult(None, 0))
+    for generation, _ in evolve:
+        if generation == stop_after:
+            break
+    evolve.close()
+
+
+class TestCheckpointFile:
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "run.ckpt"
+        rng = np.random.default_rng(1)
+        checkpoint = Checkpoint(
+            generation=4,
+            population=rng.integers(0, 2, (6, 13), dtype=np.uint8),
+            fitness_scores=[1, 2, 3, 4, 5, 6],
+            best_solution=[1, 0] * 6 + [1],
+            best_fitness=9,
+            best_fitness_history=[1, 5, 7, 9, 9],
+            avg_fitness_history=[0.5, 1.5, 2.0, 3.25, 3.5],
+            rng_state=rng.bit_generator.state,
+            random_state=random.Random(3).getstate(),
+            stopping_state={"best_fitness": 9, "stalled": 1, "elapsed": 0.25},
+        )
+
+        save_checkpoint(path, checkpoint)
+        loaded = load_checkpoint(path)
+
+        assert np.array_equal(loaded.population, checkpoint.population)
+        for name in ("generation", "fitness_scores", "best_solution", "best_fitness", "best_fitness_history",
+                     "avg_fitness_history", "rng_state", "random_state", "stopping_state"):
+            assert getattr(loaded, name) == getattr(checkpoint, name), name
+
+    def test_population_is_stored_packed(self, tmp_path):
+        population = np.ones((64, 8000), dtype=np.uint8)
+        checkpoint = Checkpoint(0, population, [0] * 64, None, 0, [0], [0.0],
+                                np.random.default_rng().bit_generator.state, random.getstate(), {})
+
+        save_checkpoint(tmp_path / "run.ckpt", checkpoint)
+
+        assert os.path.getsize(tmp_path / "run.ckpt") < population.nbytes / 6
+        assert load_checkpoint(tmp_path / "run.ckpt").best_solution is None
+
+    def test_failed_write_keeps_previous_checkpoint(self, tmp_path, make_instance):
+        path = tmp_path / "run.ckpt"
+        instance = make_instance()
+        GAEngine(instance, GAConfig(population_size=10, generations=5, checkpoint_path=str(path),
+                                    checkpoint_interval=2, seed=1)).run()
+        previous = path.read_bytes()
+
+        with patch("ga.checkpoint.np.savez", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                GAEngine(instance, GAConfig(population_size=10, generations=5, checkpoint_path=str(path),
+                                            checkpoint_interval=2, seed=2)).run()
+
+        assert path.read_bytes() == previous
+
+
+class TestResume:
+
+    @pytest.mark.parametrize("settings", [
+        {},
+        {"selection": "tournament", "crossover": "uniform", "seeding": "randomized_greedy"},
+        {"incremental": True},
+        {"repair": True, "penalty_fitness": True, "fitness_cache_size": 50},
+        {"stall_generations": 15},
+    ])
+    def test_resume_is_bit_for_bit(self, tmp_path, settings, make_instance):
+        instance = make_instance()
+        path = tmp_path / "run.ckpt"
+        config = GAConfig(population_size=16, generations=40, seed=11, **settings)
+        uninterrupted = GAEngine(instance, config).run()
+
+        checkpointed = GAConfig(population_size=16, generations=40, seed=11, checkpoint_path=str(path),
+                                checkpoint_interval=10, **settings)
+        interrupted_run(instance, checkpointed, stop_after=24)
+        assert load_checkpoint(path).generation == 19
+
+        resumed = GAEngine(instance, checkpointed).run(resume_from=path)
+
+        assert resumed == uninterrupted
+
+    def test_resumed_generations_are_reported(self, tmp_path, make_instance):
+        instance = make_instance()
+        path = tmp_path / "run.ckpt"
+        config = GAConfig(population_size=10, generations=12, seed=3, checkpoint_path=str(path), checkpoint_interval=5)
+        interrupted_run(instance, config, stop_after=7)
+        recorder = StatsRecorder()
+
+        GAEngine(instance, config, [recorder]).run(resume_from=load_checkpoint(path))
+
+        assert [stats.generation for stats in recorder.generations] == list(range(5, 12))
+
+    def test_mismatched_checkpoint(self, tmp_path, make_instance):
+        path = tmp_path / "run.ckpt"
+        GAEngine(make_instance(), GAConfig(population_size=10, generations=2, checkpoint_path=str(path),
+                                           checkpoint_interval=1)).run()
+
+        with pytest.raises(ValueError, match="does not match"):
+            GAEngine(make_instance(num_items=31), GAConfig(population_size=10)).run(resume_from=path)
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            GAConfig(checkpoint_interval=0)
@@ -1,5 +1,9 @@
+import random
+
+import numpy as np
 import pytest
 from ga.crossover import Crossover
+from ga.genome import pack_population, unpack_population
 
 
 class TestCrossover:
@@ -91,3 +95,116 @@ class TestCrossover:
         assert len(child2) == len(parent2)
         assert all(gene in [0, 1] for gene in child1)
         assert all(gene in [0, 1] for gene in child2)
+
+
+
+class TestListCrossover:
+    def test_k_point_alternates_segments(self):
+        random.seed(0)
+        for points in (1, 2, 5, 20):
+            child1, child2 = Crossover.k_point([1] * 12, [0] * 12, points)
+
+            assert child1[0] == 1 and [1 - gene for gene in child1] == child2
+            assert int(np.count_nonzero(np.diff(child1))) == min(points, 11)
+
+    def test_uniform_keeps_gene_pool(self):
+        parent1, parent2 = [1, 0, 1, 1, 0, 0, 1, 0], [0, 0, 1, 0, 1, 1, 0, 1]
+
+        child1, child2 = Crossover.uniform(parent1, parent2)
+
+        assert [a + b for a, b in zip(child1, child2)] == [a + b for a, b in zip(parent1, parent2)]
+
+    def test_pair_dispatch_and_rate(self):
+        assert Crossover.pair("two_point", [1] * 6, [0] * 6, crossover_rate=0.0) == ([1] * 6, [0] * 6)
+        child1, _ = Crossover.pair("two_point", [1] * 6, [0] * 6)
+        assert child1[0] == child1[-1] == 1
+        with pytest.raises(ValueError):
+            Crossover.pair("three_parent", [1], [0])
+
+
+def count_switches(child):
+    return int(np.count_nonzero(np.diff(child)))
+
+
+class TestBatchCrossover:
+    def setup_method(self):
+        self.parents1 = np.ones((50, 20), dtype=np.uint8)
+        self.parents2 = np.zeros((50, 20), dtype=np.uint8)
+
+    def test_one_point_batch(self):
+        children1, children2 = Crossover.one_point_batch(self.parents1, self.parents2)
+
+        assert children1.shape == children2.shape == (50, 20)
+        assert ((children1 ^ children2) == 1).all()
+        for child in children1:
+            assert child[0] == 1 and child[-1] == 0
+            assert count_switches(child) == 1
+
+    def test_two_point_batch(self):
+        children1, _ = Crossover.two_point_batch(self.parents1, self.parents2)
+
+        for child in children1:
+            assert child[0] == 1 and child[-1] == 1
+            assert count_switches(child) == 2
+
+    def test_k_point_batch(self):
+        children1, _ = Crossover.k_point_batch(self.parents1, self.parents2, 5)
+
+        assert all(count_switches(child) == 5 for child in children1)
+
+    def test_k_point_batch_dense_cuts_are_distinct(self):
+        children1, _ = Crossover.k_point_batch(np.ones((50, 6)), np.zeros((50, 6)), 5, np.random.default_rng(2))
+
+        assert children1.tolist() == [[1, 0, 1, 0, 1, 0]] * 50
+
+    def test_uniform_batch(self):
+        children1, children2 = Crossover.uniform_batch(self.parents1, self.parents2, np.random.default_rng(0))
+
+        assert ((children1 ^ children2) == 1).all()
+        assert 0.4 < children1.mean() < 0.6
+
+    def test_batch_preserves_gene_pool(self):
+        rng = np.random.default_rng(1)
+        parents1 = rng.integers(0, 2, (30, 15), dtype=np.uint8)
+        parents2 = rng.integers(0, 2, (30, 15), dtype=np.uint8)
+
+        for strategy in ("one_point", "two_point", "k_point", "uniform"):
+            children1, children2 = Crossover.batch(strategy, parents1, parents2, rng=rng)
+            assert (children1.astype(int) + children2 == parents1.astype(int) + parents2).all()
+
+    def test_batch_crossover_rate(self):
+        children1, children2 = Crossover.batch("uniform", self.parents1, self.parents2, crossover_rate=0.0)
+
+        assert (children1 == self.parents1).all()
+        assert (children2 == self.parents2).all()
+
+    def test_batch_single_gene_copies_parents(self):
+        children1, _ = Crossover.one_point_batch(np.ones((3, 1)), np.zeros((3, 1)))
+        assert children1.tolist() == [[1], [1], [1]]
+
+    @pytest.mark.parametrize("strategy", ["one_point", "two_point", "k_point"])
+    def test_batch_packed_matches_unpacked(self, strategy):
+        rng = np.random.default_rng(4)
+        parents1 = rng.integers(0, 2, (30, 21), dtype=np.uint8)
+        parents2 = rng.integers(0, 2, (30, 21), dtype=np.uint8)
+
+        expected = Crossover.batch(strategy, parents1, parents2, 0.7, rng=np.random.default_rng(5))
+        packed = Crossover.batch_packed(strategy, pack_population(parents1), pack_population(parents2), 21, 0.7,
+                                        rng=np.random.default_rng(5))
+
+        for child, packed_child in zip(expected, packed):
+            assert np.array_equal(unpack_population(packed_child, 21), child)
+
+    def test_batch_packed_uniform_and_dense_cuts(self):
+        parents1 = pack_population(np.ones((40, 13), dtype=np.uint8))
+        parents2 = pack_population(np.zeros((40, 13), dtype=np.uint8))
+
+        children1, children2 = Crossover.batch_packed("uniform", parents1, parents2, 13)
+        dense, _ = Crossover.batch_packed("k_point", parents1, parents2, 13, points=12)
+
+        assert (children1 ^ children2).tolist() == parents1.tolist()  # genes swapped, padding untouched
+        assert unpack_population(dense, 13).tolist() == [[1, 0] * 6 + [1]] * 40
+
+    def test_batch_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            Crossover.batch("three_parent", self.parents1, self.parents2)
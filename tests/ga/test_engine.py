@@ -0,0 +1,234 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from ga.engine import GAConfig, GAEngine, GAResult
+from ga.fitness import Item, KnapsackInstance
+
+
+class TestGAConfig:
+    def test_defaults(self):
+        config = GAConfig()
+
+        assert config.population_size == 100
+        assert config.generations == 200
+        assert config.selection == "roulette"
+
+    def test_invalid_settings(self):
+        for settings in ({"selection": "rank"}, {"crossover": "three_parent"}, {"seeding": "sorted"},
+                         {"population_size": 0}, {"incremental": True, "crossover": "uniform"},
+                         {"incremental": True, "repair": True}, {"incremental": True, "fitness_cache_size": 100},
+                         {"incremental": True, "parallel_workers": 2}):
+            with pytest.raises(ValueError):
+                GAConfig(**settings)
+
+
+class TestGAEngine:
+    def test_run_result(self, make_instance):
+        instance = make_instance()
+        result = GAEngine(instance, GAConfig(population_size=20, generations=15, seed=1)).run()
+
+        assert isinstance(result, GAResult)
+        assert len(result.best_fitness_history) == len(result.avg_fitness_history) == 15
+        assert isinstance(result.best_solution, list)
+        assert isinstance(result.best_fitness, int)
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        assert result.results() == (result.best_solution, result.best_fitness,
+                                    result.best_fitness_history, result.avg_fitness_history)
+
+    def test_population_size_is_honoured(self, make_instance):
+        engine = GAEngine(make_instance(), GAConfig(population_size=37, seed=2))
+        population = engine.initial_population()
+
+        assert population.shape == (37, 30)
+        assert len(engine.next_generation(population, engine.evaluate(population))) == 37
+
+    def test_seeded_runs_are_reproducible(self, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=20, generations=10, seed=3)
+
+        assert GAEngine(instance, config).run() == GAEngine(instance, config).run()
+
+    def test_run_does_not_touch_global_random_state(self, make_instance):
+        random.seed(5)
+        np.random.seed(5)
+        expected = (random.random(), np.random.random())
+        random.seed(5)
+        np.random.seed(5)
+
+        GAEngine(make_instance(), GAConfig(population_size=10, generations=3, seeding="randomized_greedy")).run()
+
+        assert (random.random(), np.random.random()) == expected
+
+    def test_engines_run_side_by_side_in_threads(self, make_instance):
+        instance = make_instance()
+        configs = [GAConfig(population_size=20, generations=10, seed=seed, selection=selection)
+                   for seed in range(4) for selection in ("roulette", "tournament")]
+
+        sequential = [GAEngine(instance, config).run() for config in configs]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = list(executor.map(lambda config: GAEngine(instance, config).run(), configs))
+
+        assert threaded == sequential
+
+    def test_feature_combinations(self, make_instance):
+        instance = make_instance()
+        for settings in ({"incremental": True}, {"fitness_cache_size": 100}, {"repair": True, "seeding": "greedy"},
+                         {"penalty_fitness": True, "crossover": "uniform"}, {"seed_with_exact": True}):
+            result = GAEngine(instance, GAConfig(population_size=16, generations=5, seed=4, **settings)).run()
+            assert instance.evaluate(result.best_solution) == result.best_fitness
+
+    def test_incremental_run_honours_crossover_rate(self, make_instance):
+        instance = make_instance()
+        runs = [GAEngine(instance, GAConfig(population_size=16, generations=8, seed=4, incremental=True,
+                                            crossover_rate=rate)).run() for rate in (1.0, 0.0)]
+
+        assert runs[0] != runs[1]
+        assert instance.evaluate(runs[1].best_solution) == runs[1].best_fitness
+
+    def test_incremental_pairs_without_crossover_copy_their_parents(self, make_instance):
+        engine = GAEngine(make_instance(), GAConfig(population_size=10, elitism_size=0, mutation_rate=0.0, seed=2,
+                                                    incremental=True, crossover_rate=0.0))
+        population = engine.initial_population()
+        parents = {tuple(individual.genes) for individual in population}
+
+        children = engine.next_generation(population, engine.evaluate(population))
+
+        assert {tuple(child.genes) for child in children} <= parents
+        assert engine.evaluate(children) == engine.instance.evaluate_population(engine.genes(children)).tolist()
+
+    def test_exact_seed_is_kept_by_elitism(self, make_instance):
+        instance = make_instance()
+        result = GAEngine(instance, GAConfig(population_size=10, generations=5, seed=6, seed_with_exact=True)).run()
+
+        assert result.best_fitness_history == [result.best_fitness] * 5
+
+
+class TestMultiConstraintEngine:
+    def make_instance(self):
+        items = [Item(i * 7 % 19 + 1, i * 5 % 11 + 1, (i * 3 % 7, i % 2)) for i in range(30)]
+        return KnapsackInstance(items, [60, 40, 8])
+
+    @pytest.mark.parametrize("storage", ["memory", "mmap"])
+    def test_run_stays_feasible(self, storage):
+        instance = self.make_instance()
+        config = GAConfig(population_size=20, generations=10, seeding="greedy", repair=True, storage=storage, seed=4)
+
+        result = GAEngine(instance, config).run()
+
+        assert result.best_fitness > 0
+        assert instance.count_infeasible(np.array([result.best_solution])) == 0
+
+    def test_single_constraint_features_are_rejected(self):
+        with pytest.raises(ValueError, match="single-constraint"):
+            GAEngine(self.make_instance(), GAConfig(incremental=True, crossover="one_point"))
+
+
+class TestEarlyStoppingInEngine:
+    def test_full_run_reports_generations(self, make_instance):
+        result = GAEngine(make_instance(), GAConfig(population_size=10, generations=7, seed=1)).run()
+
+        assert result.stop_reason == "generations"
+        assert result.generations_run == 7
+
+    def test_stall_ends_converged_run(self, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=10, generations=500, seed=6, seed_with_exact=True, stall_generations=20)
+
+        result = GAEngine(instance, config).run()
+
+        # The optimum is there from generation 0, so nothing improves afterwards
+        assert result.stop_reason == "stall"
+        assert result.generations_run == 21
+
+    def test_target_fitness(self, make_instance):
+        instance = make_instance()
+        optimum = GAEngine(instance, GAConfig(population_size=10, generations=1, seed_with_exact=True)).run()
+        config = GAConfig(population_size=10, generations=500, seed=6, seed_with_exact=True,
+                          target_fitness=optimum.best_fitness)
+
+        result = GAEngine(instance, config).run()
+
+        assert result.stop_reason == "target"
+        assert result.generations_run == 1
+
+    def test_diversity_collapse(self, make_instance):
+        config = GAConfig(population_size=20, generations=500, seed=2, mutation_rate=0.0, selection="tournament",
+                          min_diversity=0.01)
+
+        result = GAEngine(make_instance(), config).run()
+
+        assert result.stop_reason == "diversity"
+        assert result.generations_run < 500
+
+    def test_time_budget(self, make_instance):
+        result = GAEngine(make_instance(), GAConfig(population_size=10, generations=10_000, time_budget=0.0)).run()
+
+        assert result.stop_reason == "time_budget"
+        assert result.generations_run == 1
+
+
+class TestAnytime:
+    def test_yields_each_improvement_of_run(self, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=20, generations=30, seed=8)
+        result = GAResult(None, 0)
+
+        improvements = list(GAEngine(instance, config).anytime(result))
+
+        assert result == GAEngine(instance, config).run()
+        assert [i.best_fitness for i in improvements] == sorted(set(result.best_fitness_history))
+        assert all(a.best_fitness < b.best_fitness and a.elapsed <= b.elapsed
+                   for a, b in zip(improvements, improvements[1:]))
+        generation, best_solution, best_fitness, _ = improvements[-1]
+        assert (best_solution, best_fitness) == (result.best_solution, result.best_fitness)
+        assert result.best_fitness_history[generation] == best_fitness
+
+    def test_consumer_can_stop_early(self, make_instance):
+        result = GAResult(None, 0)
+        anytime = GAEngine(make_instance(), GAConfig(population_size=20, generations=1000, seed=8)).anytime(result)
+
+        first = next(anytime)
+        anytime.close()
+
+        assert first.generation == 0
+        assert result.generations_run == 1
+
+    def test_deadline_ends_the_run_without_an_improvement(self, make_instance):
+        result = GAResult(None, 0)
+        engine = GAEngine(make_instance(), GAConfig(population_size=20, generations=1000, seed=8))
+
+        improvements = list(engine.anytime(result, deadline=0.0))
+
+        assert [i.generation for i in improvements] == [0]
+        assert result.generations_run == 1
+        assert result.stop_reason == "deadline"
+
+    def test_deadline_after_the_run_keeps_its_stop_reason(self, make_instance):
+        result = GAResult(None, 0)
+
+        list(GAEngine(make_instance(), GAConfig(population_size=10, generations=5, seed=1)).anytime(result, deadline=60))
+
+        assert result.generations_run == 5 and result.stop_reason == "generations"
+
+    def test_closing_releases_the_pool(self, make_instance):
+        closed = []
+
+        class FakePool:
+            def __init__(self, instance, workers):
+                self.instance = instance
+
+            def evaluate_population(self, population, capacity=None):
+                return self.instance.evaluate_population(population, capacity)
+
+            def close(self):
+                closed.append(True)
+
+        with patch("ga.engine.ParallelEvaluator", FakePool):
+            anytime = GAEngine(make_instance(), GAConfig(population_size=10, parallel_workers=2, seed=1)).anytime()
+            next(anytime)
+            anytime.close()
+
+        assert closed == [True]
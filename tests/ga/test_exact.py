@@ -0,0 +1,118 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+from ga.exact import branch_and_bound, dantzig_bound, dp_solve, optimality_gap
+from ga.fitness import evaluate_fitness, INVALID_SOLUTION_SCORE, Item, KnapsackInstance
+
+
+def brute_force_value(items, capacity):
+    return max(evaluate_fitness(list(s), items, capacity) for s in itertools.product([0, 1], repeat=len(items)))
+
+
+class TestDynamicProgramming:
+    def test_small_instance(self):
+        items = [Item(10, 5), Item(20, 10), Item(15, 8)]
+        solution, value = dp_solve(KnapsackInstance(items, 15))
+
+        assert value == 30
+        assert solution == [1, 1, 0]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            items = [Item(rng.randint(0, 20), rng.randint(0, 15)) for _ in range(rng.randint(1, 10))]
+            capacity = rng.randint(0, 50)
+
+            solution, value = dp_solve(KnapsackInstance(items, capacity))
+
+            assert value == brute_force_value(items, capacity)
+            assert evaluate_fitness(solution, items, capacity) == value
+
+    def test_divide_and_conquer_matches_bitset(self):
+        rng = np.random.default_rng(1)
+        items = [Item(int(v), int(w)) for v, w in zip(rng.integers(1, 100, 60), rng.integers(1, 50, 60))]
+        instance = KnapsackInstance(items, 600)
+
+        bitset_solution, bitset_value = dp_solve(instance)
+        divided_solution, divided_value = dp_solve(instance, memory_limit=64)
+
+        assert bitset_value == divided_value
+        assert instance.evaluate(divided_solution) == divided_value
+
+    def test_nothing_fits(self):
+        solution, value = dp_solve(KnapsackInstance([Item(10, 5), Item(5, 7)], 4))
+
+        assert solution == [0, 0]
+        assert value == INVALID_SOLUTION_SCORE
+
+    def test_capacity_override(self):
+        instance = KnapsackInstance([Item(10, 5), Item(20, 10)], 15)
+
+        assert dp_solve(instance, capacity=9)[1] == 10
+        assert dp_solve(instance, capacity=-1)[1] == INVALID_SOLUTION_SCORE
+
+    def test_requires_integer_weights(self):
+        with pytest.raises(ValueError):
+            dp_solve(KnapsackInstance([Item(10, 2.5)], 5))
+
+
+class TestBranchAndBound:
+    def test_small_instance(self):
+        items = [Item(10, 5), Item(20, 10), Item(15, 8)]
+        result = branch_and_bound(KnapsackInstance(items, 15))
+
+        assert result.best_fitness == 30
+        assert result.best_solution == [1, 1, 0]
+        assert result.optimal
+        assert result.gap == 0
+        assert result.upper_bound == 30
+
+    def test_matches_dynamic_programming(self):
+        rng = random.Random(2)
+        for _ in range(50):
+            items = [Item(rng.randint(0, 30), rng.randint(0, 20)) for _ in range(rng.randint(1, 15))]
+            instance = KnapsackInstance(items, rng.randint(0, 80))
+
+            result = branch_and_bound(instance)
+
+            assert result.optimal
+            assert result.best_fitness == dp_solve(instance)[1]
+            assert instance.evaluate(result.best_solution) == result.best_fitness
+
+    def test_large_capacity_and_weights(self):
+        rng = np.random.default_rng(3)
+        items = [Item(int(v), int(w)) for v, w in zip(rng.integers(1, 10**6, 300), rng.integers(1, 10**6, 300))]
+        instance = KnapsackInstance(items, 5 * 10**7)
+
+        result = branch_and_bound(instance, time_limit=5)
+
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        assert result.best_fitness <= result.upper_bound <= dantzig_bound(instance)
+
+    def test_time_limit_returns_incumbent_and_proven_gap(self):
+        # Strongly correlated items make the bound weak, so the search needs many nodes
+        rng = np.random.default_rng(4)
+        weights = rng.integers(1000, 2000, 200)
+        items = [Item(int(w) + 100, int(w)) for w in weights]
+        instance = KnapsackInstance(items, int(weights.sum() // 2))
+
+        result = branch_and_bound(instance, time_limit=0)
+
+        assert not result.optimal
+        assert result.best_fitness > 0
+        assert result.upper_bound >= result.best_fitness
+        assert result.gap == optimality_gap(result.best_fitness, result.upper_bound) > 0
+
+    def test_dantzig_bound(self):
+        instance = KnapsackInstance([Item(10, 5), Item(20, 10), Item(15, 8)], 15)
+
+        assert dantzig_bound(instance) == 30
+        assert dantzig_bound(instance, capacity=12) == 24  # 10 + 7/10 of item 2's value
+        assert dantzig_bound(instance, capacity=-1) == 0
+
+    def test_optimality_gap(self):
+        assert optimality_gap(90, 100) == 0.1
+        assert optimality_gap(100, 100) == 0
+        assert optimality_gap(5, 0) == 0
@@ -1,5 +1,14 @@
+import numpy as np
 import pytest
-from ga.fitness import evaluate_fitness, INVALID_SOLUTION_SCORE, Item
+from ga.fitness import (
+    evaluate_fitness,
+    evaluate_packed_fitness,
+    evaluate_population_fitness,
+    INVALID_SOLUTION_SCORE,
+    Item,
+    KnapsackInstance,
+)
+from ga.genome import pack_population
 
 
 class TestFitness:
@@ -113,3 +122,206 @@ class TestFitness:
         items = [Item(10, 2), Item(5, 8), Item(20, 4), Item(15, 6), Item(8, 3)]
         capacity = 12
         assert evaluate_fitness(individual, items, capacity) == 38
+
+
+class TestPopulationFitness:
+    def test_matches_evaluate_fitness(self):
+        items = [Item(10, 2), Item(5, 8), Item(20, 4), Item(15, 6), Item(8, 3)]
+        values = [item.value for item in items]
+        weights = [item.weight for item in items]
+        population = [[1, 0, 1, 0, 1], [1, 1, 1, 1, 1], [0, 0, 0, 0, 0], [0, 1, 0, 1, 0]]
+        capacity = 12
+
+        scores = evaluate_population_fitness(np.array(population, dtype=np.uint8), values, weights, capacity)
+
+        expected = [evaluate_fitness(individual, items, capacity) for individual in population]
+        assert scores.tolist() == expected
+
+    def test_accepts_bool_matrix(self):
+        population = np.array([[True, False, True], [True, True, True]])
+        scores = evaluate_population_fitness(population, [10, 20, 15], [2, 5, 3], 6)
+        assert scores.tolist() == [25, INVALID_SOLUTION_SCORE]
+
+    def test_negative_items_invalidate_everyone(self):
+        population = np.array([[1, 0], [0, 1]], dtype=np.uint8)
+        scores = evaluate_population_fitness(population, [-5, 10], [2, 3], 10)
+        assert scores.tolist() == [INVALID_SOLUTION_SCORE, INVALID_SOLUTION_SCORE]
+
+    def test_empty_population(self):
+        scores = evaluate_population_fitness(np.zeros((0, 3), dtype=np.uint8), [1, 2, 3], [1, 1, 1], 5)
+        assert scores.tolist() == []
+
+    def test_inconsistent_lengths(self):
+        population = np.array([[1, 0]], dtype=np.uint8)
+        with pytest.raises(ValueError):
+            evaluate_population_fitness(population, [10], [2], 10)
+
+    def test_random_population_matches_scalar_path(self):
+        rng = np.random.default_rng(42)
+        items = [Item(int(v), int(w)) for v, w in zip(rng.integers(0, 20, 40), rng.integers(1, 15, 40))]
+        population = rng.integers(0, 2, size=(200, 40), dtype=np.uint8)
+
+        scores = evaluate_population_fitness(
+            population, [item.value for item in items], [item.weight for item in items], 150
+        )
+
+        expected = [evaluate_fitness(row.tolist(), items, 150) for row in population]
+        assert scores.tolist() == expected
+
+    def test_packed_fitness_matches_unpacked(self):
+        rng = np.random.default_rng(11)
+        values = rng.integers(0, 20, 30)
+        weights = rng.integers(1, 15, 30)
+        population = rng.integers(0, 2, size=(100, 30), dtype=np.uint8)
+
+        packed_scores = evaluate_packed_fitness(pack_population(population), values, weights, 120)
+
+        expected = evaluate_population_fitness(population, values, weights, 120)
+        assert packed_scores.tolist() == expected.tolist()
+
+    def test_packed_fitness_single_row_and_invalid(self):
+        packed = pack_population([[1, 0, 1]])[0]
+        assert evaluate_packed_fitness(packed, [10, 20, 15], [2, 5, 3], 6).tolist() == [25]
+        assert evaluate_packed_fitness(packed, [10, 20, 15], [2, 5, 3], 4).tolist() == [INVALID_SOLUTION_SCORE]
+        with pytest.raises(ValueError):
+            evaluate_packed_fitness(packed, [10] * 9, [1] * 9, 6)
+
+
+class TestKnapsackInstance:
+    def test_arrays_and_totals(self):
+        instance = KnapsackInstance([Item(10, 2), Item(20, 5), Item(15, 3)], 6)
+
+        assert len(instance) == 3
+        assert instance.values.tolist() == [10, 20, 15]
+        assert instance.weights.tolist() == [2, 5, 3]
+        assert instance.total_value == 45
+        assert instance.total_weight == 10
+        assert instance.ratios.tolist() == [5.0, 4.0, 5.0]
+        assert instance.ratio_order.tolist() == [0, 2, 1]
+
+    def test_rejects_negative_items(self):
+        with pytest.raises(ValueError):
+            KnapsackInstance([Item(-5, 2), Item(10, 3)], 10)
+        with pytest.raises(ValueError):
+            KnapsackInstance([Item(10, -2)], 10)
+
+    def test_zero_weight_ratio(self):
+        instance = KnapsackInstance([Item(5, 0), Item(4, 2)], 10)
+        assert instance.ratio_order.tolist() == [0, 1]
+
+    def test_arrays_are_read_only(self):
+        instance = KnapsackInstance([Item(10, 2)], 5)
+        with pytest.raises(ValueError):
+            instance.values[0] = 1
+
+    def test_behaves_like_item_list(self):
+        items = [Item(10, 2), Item(20, 5)]
+        instance = KnapsackInstance(items, 6)
+
+        assert instance[1] is items[1]
+        assert list(instance) == items
+
+    def test_evaluate_matches_evaluate_fitness(self):
+        items = [Item(10, 2), Item(5, 8), Item(20, 4), Item(15, 6), Item(8, 3)]
+        instance = KnapsackInstance(items, 12)
+        population = [[1, 0, 1, 0, 1], [1, 1, 1, 1, 1], [0, 0, 0, 0, 0], [0, 1, 0, 1, 0]]
+
+        expected = [evaluate_fitness(individual, items, 12) for individual in population]
+
+        assert [instance.evaluate(individual) for individual in population] == expected
+        assert [evaluate_fitness(individual, instance, 12) for individual in population] == expected
+        assert instance.evaluate_population(np.array(population)).tolist() == expected
+        assert instance.evaluate_packed(pack_population(population)).tolist() == expected
+
+    def test_capacity_override(self):
+        instance = KnapsackInstance([Item(10, 2), Item(20, 5)], 6)
+        assert instance.evaluate([1, 1]) == INVALID_SOLUTION_SCORE
+        assert instance.evaluate([1, 1], capacity=7) == 30
+
+    def test_evaluate_inconsistent_lengths(self):
+        instance = KnapsackInstance([Item(10, 2)], 10)
+        with pytest.raises(ValueError):
+            instance.evaluate([1, 0])
+        with pytest.raises(ValueError):
+            instance.evaluate_population(np.array([[1, 0]]))
+
+    def test_non_numeric_items_are_rejected(self):
+        with pytest.raises(ValueError, match="numbers"):
+            KnapsackInstance([Item("x", 2)], 5)
+
+    def test_item_has_slots(self):
+        item = Item(1, 2)
+        assert not hasattr(item, "__dict__")
+
+    def test_penalized_fitness(self):
+        instance = KnapsackInstance([Item(10, 2), Item(20, 5), Item(15, 3)], 6)
+        population = np.array([[1, 0, 1], [1, 1, 1], [0, 0, 0]])
+
+        scores = instance.evaluate_population_penalized(population, penalty=2)
+
+        assert scores.tolist() == [25, 45 - 2 * 4, 0]
+        assert instance.evaluate_population_penalized(population, penalty=100).tolist() == [25, 0, 0]
+        assert instance.default_penalty == 5.0
+
+
+class TestMultiConstraint:
+
+    def setup_method(self):
+        # Weight, volume and pallet slots
+        self.items = [Item(10, 2, (3, 1)), Item(5, 8, (1, 0)), Item(20, 4, (6, 1)), Item(15, 6, (2, 2))]
+        self.instance = KnapsackInstance(self.items, [12, 8, 2])
+
+    def brute_force(self, individual):
+        totals = np.array([item.demand for item, gene in zip(self.items, individual) if gene]).sum(axis=0)
+        value = sum(item.value for item, gene in zip(self.items, individual) if gene)
+        return value if value > 0 and (totals <= [12, 8, 2]).all() else INVALID_SOLUTION_SCORE
+
+    def test_item_demand(self):
+        assert self.items[0].demand == (2, 3, 1)
+        assert Item(1, 2).demand == (2,)
+        assert repr(self.items[0]) == "Item(value=10, weight=2, resources=(3, 1))"
+
+    def test_instance_shape(self):
+        assert self.instance.dimensions == 3
+        assert self.instance.capacity == 12
+        assert self.instance.capacities.tolist() == [12, 8, 2]
+        assert self.instance.demands.shape == (4, 3)
+        assert KnapsackInstance([Item(1, 2)], 5).dimensions == 1
+
+    def test_evaluate_checks_every_constraint(self):
+        population = np.array(list(np.ndindex(2, 2, 2, 2)), dtype=np.uint8)
+        expected = [self.brute_force(individual) for individual in population]
+
+        assert self.instance.evaluate_population(population).tolist() == expected
+        assert [self.instance.evaluate(individual) for individual in population] == expected
+        assert self.instance.evaluate([1, 0, 0, 1]) == INVALID_SOLUTION_SCORE  # fits weight, not pallet slots
+        assert self.instance.evaluate([1, 0, 0, 1], capacity=[12, 8, 3]) == 25
+
+    def test_count_infeasible_and_excess(self):
+        population = np.array([[1, 0, 0, 1], [0, 1, 0, 0], [1, 1, 1, 1]], dtype=np.uint8)
+
+        assert self.instance.excess(population).tolist() == [[0, 0, 1], [0, 0, 0], [8, 4, 2]]
+        assert self.instance.count_infeasible(population) == 2
+
+    def test_penalized_fitness_sums_capacity_shares(self):
+        population = np.array([[0, 1, 0, 0], [1, 0, 1, 0]], dtype=np.uint8)
+
+        scores = self.instance.evaluate_population_penalized(population, penalty=10)
+
+        assert scores.tolist() == [5, 30 - 10 * (1 / 8 + 0 / 2)]
+
+    def test_ratios_use_capacity_shares(self):
+        expected = 10 / (2 / 12 + 3 / 8 + 1 / 2)
+        assert self.instance.ratios[0] == pytest.approx(expected)
+
+    def test_invalid_resources(self):
+        with pytest.raises(ValueError, match="resources"):
+            KnapsackInstance([Item(1, 1, (2,)), Item(1, 1)], [5, 5])
+        with pytest.raises(ValueError):
+            KnapsackInstance([Item(1, 1, (-2,))], [5, 5])
+        with pytest.raises(ValueError):
+            self.instance.evaluate([1, 0, 0, 0], capacity=12)
+
+    def test_packed_evaluation_is_single_constraint(self):
+        with pytest.raises(ValueError, match="single-constraint"):
+            self.instance.evaluate_packed(pack_population([[1, 0, 0, 0]]))
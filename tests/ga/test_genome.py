@@ -0,0 +1,67 @@
+import numpy as np
+from ga.genome import (
+    byte_lookup_table,
+    flip_genes,
+    gene_mask,
+    pack_individual,
+    pack_population,
+    packed_length,
+    packed_sum,
+    suffix_masks,
+    unpack_individual,
+    unpack_population,
+)
+
+
+class TestGenome:
+    def test_packed_length(self):
+        assert packed_length(0) == 0
+        assert packed_length(1) == 1
+        assert packed_length(8) == 1
+        assert packed_length(9) == 2
+
+    def test_pack_unpack_individual_roundtrip(self):
+        individual = [1, 0, 1, 1, 0, 0, 1, 0, 1, 1]
+        packed = pack_individual(individual)
+
+        assert packed.dtype == np.uint8
+        assert len(packed) == 2
+        assert unpack_individual(packed, len(individual)) == individual
+
+    def test_pack_unpack_population_roundtrip(self):
+        population = [[1, 0, 1, 1, 0, 0, 1, 0, 1], [0, 1, 0, 0, 1, 1, 0, 1, 0]]
+        packed = pack_population(population)
+
+        assert packed.shape == (2, 2)
+        assert unpack_population(packed, 9).tolist() == population
+
+    def test_gene_mask_clears_padding(self):
+        assert unpack_individual(gene_mask(10), 16) == [1] * 10 + [0] * 6
+        assert gene_mask(16).tolist() == [255, 255]
+
+    def test_suffix_masks(self):
+        masks = suffix_masks([3, 0, 10, 8], 10)
+
+        assert unpack_population(masks, 10).tolist() == [
+            [0, 0, 0, 1, 1, 1, 1, 1, 1, 1], [1] * 10, [0] * 10, [0] * 8 + [1, 1],
+        ]
+        assert (masks[:, -1] >> 2 == 0).all()  # padding bits stay clear
+
+    def test_flip_genes_combines_flips_in_one_byte(self):
+        population = np.zeros((2, 12), dtype=np.uint8)
+        packed = pack_population(population)
+
+        flip_genes(packed, [0, 0, 0, 1], [1, 2, 9, 11])
+
+        population[0, [1, 2, 9]] = 1
+        population[1, 11] = 1
+        assert unpack_population(packed, 12).tolist() == population.tolist()
+
+    def test_packed_sum_matches_dot_product(self):
+        rng = np.random.default_rng(3)
+        values = rng.integers(0, 50, 37)
+        population = rng.integers(0, 2, size=(20, 37), dtype=np.uint8)
+
+        totals = packed_sum(pack_population(population), byte_lookup_table(values))
+
+        assert totals.tolist() == (population @ values).tolist()
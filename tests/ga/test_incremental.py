@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from ga.incremental import IncrementalEvaluator
+
+
+def assert_totals_match(evaluator, individual):
+    fresh = evaluator.track(individual.genes)
+    assert individual.value == fresh.value
+    assert individual.weight == fresh.weight
+    assert individual.block_values.tolist() == fresh.block_values.tolist()
+    assert individual.block_weights.tolist() == fresh.block_weights.tolist()
+
+
+class TestIncrementalEvaluator:
+    def test_track_and_fitness_match_full_evaluation(self, random_instance):
+        instance = random_instance()
+        evaluator = IncrementalEvaluator(instance)
+        rng = np.random.default_rng(1)
+
+        for _ in range(20):
+            genes = rng.integers(0, 2, len(instance), dtype=np.uint8)
+            assert evaluator.fitness(evaluator.track(genes)) == instance.evaluate(genes)
+
+    def test_track_rejects_wrong_length(self, random_instance):
+        evaluator = IncrementalEvaluator(random_instance(num_items=5))
+        with pytest.raises(ValueError):
+            evaluator.track([1, 0])
+
+    def test_bit_flip_updates_totals(self, random_instance):
+        instance = random_instance()
+        evaluator = IncrementalEvaluator(instance, block_size=7)
+        rng = np.random.default_rng(2)
+        individual = evaluator.track(rng.integers(0, 2, len(instance)))
+
+        for rate in (0.0, 0.05, 0.5, 1.0):
+            mutated = evaluator.bit_flip(individual, rate, rng)
+            assert_totals_match(evaluator, mutated)
+
+        assert evaluator.bit_flip(individual, 1.0, rng).genes.tolist() == (1 - individual.genes).tolist()
+
+    def test_bit_flip_preserves_parent(self, random_instance):
+        evaluator = IncrementalEvaluator(random_instance())
+        individual = evaluator.track([1, 0] * 25)
+        evaluator.bit_flip(individual, 1.0)
+
+        assert individual.genes.tolist() == [1, 0] * 25
+        assert_totals_match(evaluator, individual)
+
+    def test_one_point_children_totals(self, random_instance):
+        instance = random_instance(num_items=53)
+        evaluator = IncrementalEvaluator(instance, block_size=8)
+        rng = np.random.default_rng(3)
+        parent1 = evaluator.track(rng.integers(0, 2, 53))
+        parent2 = evaluator.track(rng.integers(0, 2, 53))
+
+        for point in (1, 7, 8, 9, 40, 52, 53):
+            child1, child2 = evaluator.one_point(parent1, parent2, point)
+
+            assert child1.genes.tolist() == parent1.genes[:point].tolist() + parent2.genes[point:].tolist()
+            assert child2.genes.tolist() == parent2.genes[:point].tolist() + parent1.genes[point:].tolist()
+            assert_totals_match(evaluator, child1)
+            assert_totals_match(evaluator, child2)
+
+    def test_copy_is_independent(self, random_instance):
+        evaluator = IncrementalEvaluator(random_instance(num_items=10))
+        individual = evaluator.track([1] * 10)
+        clone = individual.copy()
+        clone.genes[0] = 0
+        clone.block_values[0] = -1
+
+        assert individual.genes[0] == 1
+        assert individual.block_values[0] != -1
@@ -0,0 +1,153 @@
+import io
+import json
+from unittest.mock import patch
+
+import numpy as np
+from ga.engine import GAConfig, GAEngine
+from ga.fitness import Item, KnapsackInstance
+from ga.instrumentation import (
+    count_unique,
+    EventSink,
+    JsonLinesWriter,
+    NULL_TIMER,
+    PHASES,
+    PhaseTimer,
+    ProgressPrinter,
+    StatsRecorder,
+)
+
+
+class TestHelpers:
+
+    def test_phase_timer_accumulates_laps(self):
+        times = iter([0.0, 1.0, 3.0, 3.5, 4.0])
+        with patch("ga.instrumentation.time.perf_counter", side_effect=lambda: next(times)):
+            timer = PhaseTimer()
+            timer.lap("selection")
+            timer.lap("mutation")
+            timer.start()
+            timer.lap("selection")
+
+        assert timer.reset() == {"selection": 1.5, "mutation": 2.0}
+        assert timer.timings == {}
+
+    def test_null_timer_never_reads_the_clock(self):
+        with patch("ga.instrumentation.time.perf_counter") as clock:
+            NULL_TIMER.start()
+            NULL_TIMER.lap("evaluation")
+
+        clock.assert_not_called()
+
+    def test_count_unique(self):
+        genes = np.array([[0, 1, 1], [0, 1, 1], [1, 0, 0]], dtype=np.uint8)
+
+        assert count_unique(genes) == 2
+        assert count_unique(np.zeros((0, 3), dtype=np.uint8)) == 0
+
+
+class TestEngineEvents:
+
+    def test_stats_per_generation(self, make_instance):
+        instance = make_instance()
+        recorder = StatsRecorder()
+
+        result = GAEngine(instance, GAConfig(population_size=12, generations=6, seed=1, repair=True), [recorder]).run()
+
+        assert [stats.generation for stats in recorder.generations] == list(range(6))
+        assert recorder.result is result
+        for stats, best, avg in zip(recorder.generations, result.best_fitness_history, result.avg_fitness_history):
+            assert (stats.best_fitness, stats.avg_fitness) == (best, avg)
+            assert stats.evaluations == 12
+            assert 1 <= stats.unique_genomes <= 12
+        # Generation 0 is created, not bred, so it only has an evaluation phase
+        assert set(recorder.generations[0].timings) == {"evaluation"}
+        assert set(recorder.generations[-1].timings) == set(PHASES) - {"adaptation"}
+
+    def test_counts_infeasible_individuals(self, make_instance):
+        instance = make_instance(capacity=0)
+        recorder = StatsRecorder()
+
+        GAEngine(instance, GAConfig(population_size=10, generations=1, seed=2), [recorder]).run()
+
+        # With no capacity every non-empty knapsack is over weight
+        assert recorder.generations[0].infeasible == 10
+
+    def test_cache_counts(self, make_instance):
+        recorder = StatsRecorder()
+        config = GAConfig(population_size=20, generations=10, seed=3, fitness_cache_size=1000)
+
+        engine = GAEngine(make_instance(), config, [recorder])
+        engine.run()
+
+        assert sum(s.cache_hits for s in recorder.generations) == engine.cache.hits
+        assert sum(s.evaluations for s in recorder.generations) == engine.cache.misses
+        assert all(s.cache_hits + s.evaluations == 20 for s in recorder.generations)
+
+    def test_sinks_do_not_change_the_run(self, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=16, generations=8, seed=4, incremental=True)
+
+        assert GAEngine(instance, config, [StatsRecorder()]).run() == GAEngine(instance, config).run()
+
+    def test_no_sinks_gathers_nothing(self, make_instance):
+        with patch.object(GAEngine, "generation_stats") as generation_stats:
+            GAEngine(make_instance(), GAConfig(population_size=10, generations=3)).run()
+
+        generation_stats.assert_not_called()
+
+    def test_finish_runs_when_generator_is_closed(self, make_instance):
+        finished = []
+
+        class Sink(EventSink):
+            def on_finish(self, result):
+                finished.append(result.generations_run)
+
+        anytime = GAEngine(make_instance(), GAConfig(population_size=10, generations=50, seed=1), [Sink()]).anytime()
+        first = next(anytime)
+        anytime.close()
+
+        assert finished == [first.generation + 1]
+
+
+class TestSinks:
+
+    def test_json_lines_writer(self, make_instance):
+        output = io.StringIO()
+
+        GAEngine(make_instance(), GAConfig(population_size=10, generations=3, seed=5), [JsonLinesWriter(output)]).run()
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["event"] for r in records] == ["generation"] * 3 + ["finish"]
+        assert records[0]["generation"] == 0 and "evaluation" in records[0]["timings"]
+        assert records[-1]["stop_reason"] == "generations"
+
+    def test_json_lines_writer_owns_path(self, tmp_path, make_instance):
+        path = tmp_path / "events.jsonl"
+        writer = JsonLinesWriter(path)
+
+        GAEngine(make_instance(), GAConfig(population_size=10, generations=2, seed=5), [writer]).run()
+
+        assert writer.file.closed
+        assert len(path.read_text().splitlines()) == 3
+
+    def test_progress_printer(self, capsys, make_instance):
+        config = GAConfig(population_size=10, generations=12, seed=6, verbose=True)
+
+        GAEngine(make_instance(), config).run()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [line.split(":")[0] for line in lines] == ["Generation   0", "Generation  10", "Generation  11"]
+
+    def test_progress_printer_formats_float_fitness(self, capsys):
+        instance = KnapsackInstance([Item(1.5, 1), Item(2.5, 2)], 5)
+
+        GAEngine(instance, GAConfig(population_size=4, generations=1, seed=1, verbose=True)).run()
+
+        assert capsys.readouterr().out.startswith("Generation   0: Best=4.0, Avg=")
+
+    def test_progress_printer_reports_stop_reason(self, capsys, make_instance):
+        config = GAConfig(population_size=10, generations=100, seed=6, time_budget=0.0)
+
+        GAEngine(make_instance(), config, [ProgressPrinter(interval=5)]).run()
+
+        assert capsys.readouterr().out.splitlines()[-1] == "Stopped at generation 0 (time_budget)"
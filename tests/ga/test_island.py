@@ -0,0 +1,81 @@
+import random
+from unittest.mock import patch
+
+import pytest
+from ga.crossover import Crossover
+from ga.fitness import Item, KnapsackInstance
+from ga.island import IslandConfig, IslandState, evolve_island, migrate, run_islands
+
+
+def make_instance():
+    return KnapsackInstance([Item(i * 2, i) for i in range(1, 13)], 30)
+
+
+class TestIslands:
+    def test_run_islands_result_shape(self):
+        instance = make_instance()
+        configs = [IslandConfig(population_size=12, selection="roulette"),
+                   IslandConfig(population_size=8, selection="tournament", tournament_size=3)]
+
+        result = run_islands(instance, configs, generations=15, migration_interval=5, workers=1, seed=3)
+
+        assert len(result.islands) == 2
+        assert len(result.best_fitness_history) == 15
+        assert len(result.avg_fitness_history) == 15
+        assert all(len(island.best_fitness_history) == 15 for island in result.islands)
+        assert result.best_fitness == max(island.best_fitness for island in result.islands)
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        assert result.best_fitness_history == [max(pair) for pair in zip(*(i.best_fitness_history for i in result.islands))]
+        assert len(result.results()) == 4
+
+    def test_seeded_runs_match_across_process_pool(self):
+        instance = make_instance()
+        configs = [IslandConfig(population_size=10), IslandConfig(population_size=10, selection="tournament")]
+
+        serial = run_islands(instance, configs, generations=12, migration_interval=4, workers=1, seed=7)
+        parallel = run_islands(instance, configs, generations=12, migration_interval=4, workers=2, seed=7)
+
+        assert serial.results() == parallel.results()
+
+    def test_evolve_island_restores_global_random_state(self):
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+
+        evolve_island(IslandConfig(population_size=6), IslandState(random.Random(1).getstate()), 3, make_instance())
+
+        assert random.random() == expected
+
+    def test_migrate_ring_replaces_worst(self):
+        instance = KnapsackInstance([Item(10, 1), Item(5, 1)], 2)
+        strong = IslandState(None, population=[[1, 1], [1, 0]])
+        weak = IslandState(None, population=[[0, 0], [0, 1]])
+
+        migrate(instance, [strong, weak], migration_size=1, topology="ring")
+
+        assert [1, 1] in weak.population
+        assert [0, 0] not in weak.population
+        assert [0, 1] in strong.population  # weak island's best reached the strong island
+
+    def test_islands_use_their_own_crossover(self):
+        instance = make_instance()
+        configs = [IslandConfig(population_size=10, crossover="uniform"),
+                   IslandConfig(population_size=10, crossover="k_point", crossover_points=4, crossover_rate=0.5)]
+
+        result = run_islands(instance, configs, generations=8, migration_interval=4, workers=1, seed=1)
+
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        with patch("ga.island.Crossover.pair", wraps=Crossover.pair) as pair:
+            evolve_island(configs[1], IslandState(random.Random(0).getstate()), 1, instance)
+        assert {call.args[0] for call in pair.call_args_list} == {"k_point"}
+        assert all(call.args[3:] == (0.5, 4) for call in pair.call_args_list)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            run_islands(make_instance(), [], generations=5)
+        with pytest.raises(ValueError):
+            IslandConfig(crossover="three_parent")
+        with pytest.raises(ValueError):
+            IslandConfig(selection="rank")
+        with pytest.raises(ValueError):
+            run_islands(make_instance(), [IslandConfig()], generations=5, topology="star")
@@ -0,0 +1,126 @@
+import os
+
+import numpy as np
+import pytest
+from ga.engine import GAConfig, GAEngine
+from ga.instrumentation import StatsRecorder
+from ga.mapped import block_rows, MappedPopulation, MappedStorage, PackedPopulation
+from ga.stopping import population_diversity
+
+
+class TestBlockRows:
+
+    def test_even_and_bounded(self):
+        assert block_rows(1000, 10_000) == 10
+        assert block_rows(1000, 15_000) == 14
+        assert block_rows(10**7, 10) == 2
+
+
+class TestMappedPopulation:
+
+    def test_round_trip_in_blocks(self, tmp_path):
+        genes = np.random.default_rng(0).integers(0, 2, (7, 13), dtype=np.uint8)
+        population = MappedPopulation(str(tmp_path / "p.npy"), 7, 13, rows=2)
+
+        for start, stop in population.blocks():
+            population.write(start, genes[start:stop])
+
+        assert list(population.blocks()) == [(0, 2), (2, 4), (4, 6), (6, 7)]
+        assert population.array.shape == (7, 2)
+        assert np.array_equal(population.read(0, 7), genes)
+        assert np.array_equal(population.take([5, 1]), genes[[5, 1]])
+        assert population[3].tolist() == genes[3].tolist()
+
+    def test_population_measures_match_in_memory(self, tmp_path, make_instance):
+        instance = make_instance()
+        genes = np.random.default_rng(1).integers(0, 2, (9, 30), dtype=np.uint8)
+        genes[4] = genes[2]
+        population = MappedPopulation(str(tmp_path / "p.npy"), 9, 30, rows=4)
+        population.write(0, genes)
+
+        assert population.evaluate(instance) == instance.evaluate_population(genes).tolist()
+        assert population.evaluate(instance, penalized=True) == instance.evaluate_population_penalized(genes).tolist()
+        assert population_diversity(population) == population_diversity(genes)
+        assert population.count_infeasible(instance) == int(np.count_nonzero(genes @ instance.weights > 60))
+        assert population.count_unique() == 8
+
+    def test_storage_swaps_and_cleans_up(self):
+        storage = MappedStorage(4, 10, block_bytes=20)
+        directory = storage.directory
+        first = storage.current
+
+        assert storage.swap() is not first and storage.spare is first
+        storage.close()
+
+        assert not os.path.exists(directory)
+
+    def test_storage_directory_is_kept(self, tmp_path):
+        storage = MappedStorage(4, 10, directory=str(tmp_path))
+        storage.close()
+
+        assert sorted(os.listdir(tmp_path)) == ["population_a.npy", "population_b.npy"]
+
+
+class TestMappedEngine:
+
+    @pytest.mark.parametrize("storage", ["packed", "mmap"])
+    def test_single_block_matches_memory_storage(self, storage, make_instance):
+        instance = make_instance()
+        settings = dict(population_size=20, generations=15, seed=5, selection="tournament", crossover="two_point")
+
+        in_memory = GAEngine(instance, GAConfig(**settings)).run()
+        packed = GAEngine(instance, GAConfig(storage=storage, **settings)).run()
+
+        assert packed == in_memory
+
+    def test_packed_storage_keeps_one_bit_per_gene(self, make_instance):
+        engine = GAEngine(make_instance(), GAConfig(population_size=20, storage="packed", block_bytes=30 * 4, seed=2))
+        population = engine.initial_population()
+        fitness_scores = engine.evaluate(population)
+
+        assert isinstance(population, PackedPopulation) and population.array.shape == (20, 4)
+        assert fitness_scores == make_instance().evaluate_population(population.read(0, 20)).tolist()
+        assert engine.next_generation(population, fitness_scores).array.shape == (20, 4)
+
+    @pytest.mark.parametrize("settings", [
+        {}, {"repair": True, "seeding": "greedy"}, {"penalty_fitness": True}, {"min_diversity": 0.01},
+        {"seed_with_exact": True}, {"crossover": "uniform", "crossover_rate": 0.8},
+        {"adaptive_mutation": "self_adaptive"},
+    ])
+    def test_small_blocks(self, tmp_path, settings, make_instance):
+        instance = make_instance()
+        config = GAConfig(population_size=21, generations=10, seed=3, storage="mmap", storage_dir=str(tmp_path),
+                          block_bytes=30 * 4, **settings)
+
+        result = GAEngine(instance, config).run()
+
+        assert instance.evaluate(result.best_solution) == result.best_fitness
+        assert result.best_fitness_history == sorted(result.best_fitness_history)
+        assert np.load(tmp_path / "population_a.npy").shape == (21, 4)
+
+    @pytest.mark.parametrize("seeding", ["greedy", "randomized_greedy"])
+    def test_seeded_blocks_match_memory_storage(self, seeding, make_instance):
+        instance = make_instance()
+        settings = dict(population_size=9, seeding=seeding, seed=4)
+
+        expected = GAEngine(instance, GAConfig(**settings)).initial_population()
+        engine = GAEngine(instance, GAConfig(storage="packed", block_bytes=30 * 2, **settings))
+        population = engine.initial_population()
+
+        assert population.rows == 2
+        assert np.array_equal(population.read(0, 9), expected)
+
+    def test_stats(self, make_instance):
+        recorder = StatsRecorder()
+        config = GAConfig(population_size=10, generations=3, seed=1, storage="mmap", block_bytes=90)
+
+        GAEngine(make_instance(), config, [recorder]).run()
+
+        assert all(1 <= stats.unique_genomes <= 10 for stats in recorder.generations)
+
+    def test_invalid_combinations(self):
+        for settings in ({"storage": "disk"}, {"storage": "mmap", "incremental": True},
+                         {"storage": "packed", "parallel_workers": 2},
+                         {"storage": "mmap", "fitness_cache_size": 10}, {"storage": "mmap", "checkpoint_path": "x"}):
+            with pytest.raises(ValueError):
+                GAConfig(**settings)
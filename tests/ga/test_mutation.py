@@ -1,4 +1,6 @@
-from ga.mutation import Mutation
+from ga.genome import pack_population, unpack_population
+import numpy as np
+from ga.mutation import Mutation, flip_positions
 
 
 class TestMutation:
@@ -60,3 +62,73 @@ class TestMutation:
 
         unique_results = set(results)
         assert len(unique_results) > 1
+
+    def test_packed_population_bit_flip_matches_unpacked(self):
+        population = np.random.default_rng(0).integers(0, 2, (9, 19), dtype=np.uint8)
+        packed = pack_population(population)
+
+        expected = Mutation.population_bit_flip(population, 0.2, np.random.default_rng(1))
+        mutated = Mutation.packed_population_bit_flip(packed, 0.2, 19, np.random.default_rng(1))
+        expected_rows = Mutation.population_bit_flip_rows(population, [0.0, 0.5] * 4 + [1.0], np.random.default_rng(2))
+        mutated_rows = Mutation.packed_population_bit_flip_rows(packed, [0.0, 0.5] * 4 + [1.0], 19,
+                                                                np.random.default_rng(2))
+
+        assert np.array_equal(unpack_population(mutated, 19), expected)
+        assert np.array_equal(unpack_population(mutated_rows, 19), expected_rows)
+        assert np.array_equal(unpack_population(packed, 19), population)
+
+    def test_flip_positions_extremes(self):
+        assert flip_positions(10, 0.0).tolist() == []
+        assert flip_positions(10, 1.0).tolist() == list(range(10))
+        assert flip_positions(0, 0.5).tolist() == []
+
+    def test_flip_positions_sorted_unique_in_range(self):
+        positions = flip_positions(1000, 0.3, np.random.default_rng(0))
+
+        assert positions.tolist() == sorted(set(positions.tolist()))
+        assert all(0 <= p < 1000 for p in positions)
+
+    def test_flip_positions_rate(self):
+        rng = np.random.default_rng(1)
+        flips = sum(len(flip_positions(10_000, 0.05, rng)) for _ in range(20))
+
+        assert 0.045 <= flips / 200_000 <= 0.055
+
+    def test_mutation_class_geometric_bit_flip(self):
+        individual = [1, 0, 1, 0, 1]
+
+        assert Mutation.geometric_bit_flip(individual, 1.0) == [0, 1, 0, 1, 0]
+        assert Mutation.geometric_bit_flip(individual, 0.0) == individual
+        assert Mutation.geometric_bit_flip(individual, 0.0) is not individual
+        assert individual == [1, 0, 1, 0, 1]
+
+    def test_mutation_class_geometric_bit_flip_variation(self):
+        individual = [1, 0, 1, 0, 1, 0, 1, 0]
+        results = {tuple(Mutation.geometric_bit_flip(individual, 0.3)) for _ in range(20)}
+        assert len(results) > 1
+
+    def test_mutation_class_population_bit_flip(self):
+        population = np.array([[1, 0, 1], [0, 0, 0]], dtype=np.uint8)
+
+        assert Mutation.population_bit_flip(population, 1.0).tolist() == [[0, 1, 0], [1, 1, 1]]
+        assert Mutation.population_bit_flip(population, 0.0).tolist() == population.tolist()
+        assert population.tolist() == [[1, 0, 1], [0, 0, 0]]
+
+    def test_mutation_class_population_bit_flip_rate(self):
+        population = np.zeros((200, 500), dtype=np.uint8)
+        mutated = Mutation.population_bit_flip(population, 0.05, np.random.default_rng(2))
+
+        assert 0.045 <= mutated.mean() <= 0.055
+
+
+class TestPopulationBitFlipRows:
+
+    def test_rates_per_row(self):
+        population = np.zeros((3, 1000), dtype=np.uint8)
+
+        mutated = Mutation.population_bit_flip_rows(population, [0.0, 1.0, 0.1], np.random.default_rng(0))
+
+        assert mutated[0].sum() == 0
+        assert mutated[1].sum() == 1000
+        assert 50 < mutated[2].sum() < 150
+        assert population.sum() == 0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from ga.parallel import ParallelEvaluator
+
+
+class TestParallelEvaluator:
+    def test_matches_serial_scores(self, random_instance):
+        instance = random_instance(num_items=64)
+        population = np.random.default_rng(1).integers(0, 2, size=(101, 64), dtype=np.uint8)
+
+        with ParallelEvaluator(instance, workers=3, threshold=0) as evaluator:
+            scores = evaluator.evaluate_population(population)
+            assert evaluator._executor is not None
+            # A second, larger generation reuses the pool with a regrown buffer
+            bigger = np.vstack([population, population])
+            bigger_scores = evaluator.evaluate_population(bigger)
+
+        expected = instance.evaluate_population(population)
+        assert scores.tolist() == expected.tolist()
+        assert bigger_scores.tolist() == expected.tolist() * 2
+
+    def test_capacity_override(self, random_instance):
+        instance = random_instance(num_items=64)
+        population = np.random.default_rng(2).integers(0, 2, size=(40, 64), dtype=np.uint8)
+
+        with ParallelEvaluator(instance, workers=2, threshold=0) as evaluator:
+            scores = evaluator.evaluate_population(population, capacity=50)
+
+        assert scores.tolist() == instance.evaluate_population(population, 50).tolist()
+
+    def test_small_problems_skip_the_pool(self, random_instance):
+        instance = random_instance(num_items=50)
+        population = np.random.default_rng(3).integers(0, 2, size=(100, 50), dtype=np.uint8)
+
+        with ParallelEvaluator(instance, workers=4) as evaluator:
+            scores = evaluator.evaluate_population(population)
+            assert evaluator._executor is None
+
+        assert scores.tolist() == instance.evaluate_population(population).tolist()
+
+    def test_inconsistent_lengths(self, random_instance):
+        with ParallelEvaluator(random_instance(num_items=64), workers=2, threshold=0) as evaluator:
+            with pytest.raises(ValueError):
+                evaluator.evaluate_population(np.zeros((4, 3), dtype=np.uint8))
@@ -1,6 +1,6 @@
 import pytest
-from ga.population import create_population, create_individual, POPULATION_SIZE
-from ga.fitness import Item
+from ga.population import create_population, create_individual, create_greedy_individual, POPULATION_SIZE
+from ga.fitness import Item, KnapsackInstance
 
 
 class TestPopulation:
@@ -100,3 +100,58 @@ class TestPopulation:
         assert pop1 is not pop2
         for i in range(len(pop1)):
             assert pop1[i] is not pop2[i]
+
+    def test_create_population_from_instance(self):
+        instance = KnapsackInstance([Item(10, 5), Item(20, 10), Item(15, 8)], 10)
+        population = create_population(instance)
+
+        assert len(population) == POPULATION_SIZE
+        assert all(len(individual) == 3 for individual in population)
+
+    def test_create_greedy_individual(self):
+        instance = KnapsackInstance([Item(10, 5), Item(40, 4), Item(30, 6), Item(50, 3)], 10)
+
+        assert create_greedy_individual(instance) == [0, 1, 0, 1]
+
+    def test_create_randomized_greedy_individual_is_feasible(self):
+        instance = KnapsackInstance([Item(i % 7 + 1, i % 5 + 1) for i in range(40)], 30)
+
+        individuals = [create_greedy_individual(instance, noise=0.5) for _ in range(20)]
+
+        assert all(instance.evaluate(individual) > 0 for individual in individuals)
+        assert len(set(tuple(individual) for individual in individuals)) > 1
+
+    def test_create_population_greedy_seeding(self):
+        instance = KnapsackInstance([Item(i % 7 + 1, i % 5 + 1) for i in range(40)], 30)
+
+        population = create_population(instance, seeding="greedy")
+
+        assert len(population) == POPULATION_SIZE
+        assert population[0] == create_greedy_individual(instance)
+
+    def test_create_population_randomized_greedy_is_feasible(self):
+        instance = KnapsackInstance([Item(i % 7 + 1, i % 5 + 1) for i in range(40)], 30)
+
+        population = create_population(instance, seeding="randomized_greedy")
+
+        assert len(population) == POPULATION_SIZE
+        assert all(instance.evaluate(individual) > 0 for individual in population)
+
+    def test_greedy_seeding_requires_an_instance(self):
+        for seeding in ("greedy", "randomized_greedy"):
+            with pytest.raises(ValueError, match="KnapsackInstance"):
+                create_population([Item(1, 2)], seeding=seeding)
+
+    def test_create_population_unknown_seeding(self):
+        with pytest.raises(ValueError):
+            create_population([Item(1, 1)], seeding="sorted")
+
+    def test_greedy_individual_respects_every_constraint(self):
+        items = [Item(i % 7 + 1, i % 5 + 1, (i % 3, 1)) for i in range(40)]
+        instance = KnapsackInstance(items, [60, 20, 6])
+
+        greedy = create_greedy_individual(instance)
+        randomized = [create_greedy_individual(instance, noise=0.5) for _ in range(10)]
+
+        assert sum(greedy) == 6  # pallet slots bind first
+        assert all(instance.evaluate(individual) > 0 for individual in [greedy] + randomized)
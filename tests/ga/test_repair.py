@@ -0,0 +1,59 @@
+import numpy as np
+from ga.fitness import Item, KnapsackInstance
+from ga.repair import repair_individual, repair_population
+
+
+class TestRepair:
+    def test_removes_lowest_ratio_items_first(self):
+        instance = KnapsackInstance([Item(10, 5), Item(1, 5), Item(20, 5), Item(3, 5)], 10)
+
+        assert repair_individual([1, 1, 1, 1], instance) == [1, 0, 1, 0]
+
+    def test_feasible_individuals_untouched(self):
+        instance = KnapsackInstance([Item(10, 5), Item(1, 5), Item(20, 5)], 10)
+        population = [[1, 0, 0], [0, 1, 1], [0, 0, 0]]
+
+        assert repair_population(population, instance).tolist() == population
+
+    def test_repaired_population_is_feasible(self):
+        rng = np.random.default_rng(0)
+        items = [Item(int(v), int(w)) for v, w in zip(rng.integers(1, 20, 50), rng.integers(1, 15, 50))]
+        instance = KnapsackInstance(items, 100)
+        population = rng.integers(0, 2, (100, 50), dtype=np.uint8)
+
+        repaired = repair_population(population, instance)
+
+        assert (repaired @ instance.weights <= 100).all()
+        assert (repaired <= population).all()  # only removes items
+
+    def test_only_removes_what_is_needed(self):
+        instance = KnapsackInstance([Item(10, 4), Item(2, 1), Item(3, 1)], 5)
+
+        # Dropping the worst-ratio item (weight 1) is enough
+        assert repair_individual([1, 1, 1], instance) == [1, 0, 1]
+
+    def test_does_not_modify_input(self):
+        instance = KnapsackInstance([Item(10, 5), Item(1, 5)], 5)
+        population = np.array([[1, 1]], dtype=np.uint8)
+
+        repair_population(population, instance)
+
+        assert population.tolist() == [[1, 1]]
+
+    def test_multi_constraint_repair_is_feasible(self):
+        rng = np.random.default_rng(1)
+        items = [Item(int(v), int(w), (int(r),)) for v, w, r in
+                 zip(rng.integers(1, 20, 40), rng.integers(1, 15, 40), rng.integers(0, 10, 40))]
+        instance = KnapsackInstance(items, [100, 30])
+        population = rng.integers(0, 2, (60, 40), dtype=np.uint8)
+
+        repaired = repair_population(population, instance)
+
+        assert instance.count_infeasible(repaired) == 0
+        assert (repaired <= population).all()
+
+    def test_multi_constraint_repair_fixes_the_violated_resource(self):
+        # Weight fits; the second resource is over by 1, so only the worst-ratio item goes
+        instance = KnapsackInstance([Item(10, 1, (4,)), Item(2, 1, (1,)), Item(3, 1, (1,))], [10, 5])
+
+        assert repair_individual([1, 1, 1], instance) == [1, 0, 1]
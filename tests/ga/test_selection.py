@@ -1,5 +1,6 @@
+import numpy as np
 import pytest
-from ga.selection import tournament_selection, roulette_selection
+from ga.selection import tournament_selection, roulette_selection, roulette_selection_indices, tournament_selection_indices
 from ga.fitness import Item
 
 
@@ -147,3 +148,64 @@ class TestSelection:
 
         selected = tournament_selection(population, fitness_scores, 2)
         assert selected in population[:2]
+
+    def test_roulette_selection_indices_basic(self):
+        indices = roulette_selection_indices([10, 15, 20, 5], 50)
+
+        assert len(indices) == 50
+        assert all(0 <= index < 4 for index in indices)
+
+    def test_roulette_selection_indices_bias_toward_higher_fitness(self):
+        indices = roulette_selection_indices([1, 99], 1000, np.random.default_rng(0))
+
+        assert (indices == 1).sum() > 950
+
+    def test_roulette_selection_indices_skips_zero_fitness(self):
+        indices = roulette_selection_indices([0, 5, 0, 5, 0], 200, np.random.default_rng(1))
+
+        assert set(indices.tolist()) == {1, 3}
+
+    def test_roulette_selection_indices_reproducible(self):
+        first = roulette_selection_indices([3, 1, 4, 1, 5], 20, np.random.default_rng(5))
+        second = roulette_selection_indices([3, 1, 4, 1, 5], 20, np.random.default_rng(5))
+
+        assert first.tolist() == second.tolist()
+
+    def test_roulette_selection_indices_invalid_fitness(self):
+        with pytest.raises(ValueError, match="O fitness total deve ser positivo"):
+            roulette_selection_indices([0, 0], 2)
+        with pytest.raises(ValueError):
+            roulette_selection_indices([-5, 10], 2)
+        with pytest.raises(ValueError):
+            roulette_selection_indices([], 2)
+
+    def test_tournament_selection_indices_shape(self):
+        indices = tournament_selection_indices([10, 15, 20, 5], 30, 2)
+
+        assert len(indices) == 30
+        assert all(0 <= index < 4 for index in indices)
+
+    def test_tournament_selection_indices_bias_toward_higher_fitness(self):
+        indices = tournament_selection_indices([1, 100], 1000, 2, np.random.default_rng(0))
+
+        # The weaker individual only wins when it meets itself (probability 1/4)
+        assert (indices == 1).sum() > 700
+
+    def test_tournament_selection_indices_winner_is_best_competitor(self):
+        fitness_scores = np.array([5, 1, 9, 3, 7, 2])
+        rng = np.random.default_rng(4)
+        competitors = np.random.default_rng(4).integers(0, 6, size=(50, 3))
+
+        indices = tournament_selection_indices(fitness_scores, 50, 3, rng)
+
+        assert indices.tolist() == [row[fitness_scores[row].argmax()] for row in competitors]
+
+    def test_tournament_selection_indices_zero_fitness(self):
+        indices = tournament_selection_indices([0, 0, 0], 10, 2)
+        assert len(indices) == 10
+
+    def test_tournament_selection_indices_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            tournament_selection_indices([1, 2], 4, 0)
+        with pytest.raises(ValueError):
+            tournament_selection_indices([], 4, 2)
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from ga.fitness import Item, KnapsackInstance
+from ga.stopping import EarlyStopping, population_diversity
+
+
+class TestPopulationDiversity:
+
+    def test_identical_population(self):
+        assert population_diversity(np.ones((5, 8), dtype=np.uint8)) == 0.0
+
+    def test_matches_mean_pairwise_hamming_distance(self):
+        population = np.random.default_rng(0).integers(0, 2, (12, 20), dtype=np.uint8)
+        distances = [np.count_nonzero(a != b) for i, a in enumerate(population) for b in population[i + 1:]]
+
+        assert population_diversity(population) == pytest.approx(np.mean(distances) / 20)
+
+    def test_complementary_pair(self):
+        assert population_diversity([[0, 1, 0], [1, 0, 1]]) == 1.0
+
+    def test_degenerate_shapes(self):
+        assert population_diversity(np.zeros((1, 4), dtype=np.uint8)) == 0.0
+        assert population_diversity(np.zeros((3, 0), dtype=np.uint8)) == 0.0
+
+
+class TestEarlyStopping:
+
+    def test_disabled_by_default(self):
+        stopping = EarlyStopping()
+
+        assert all(stopping.check(10) is None for _ in range(100))
+
+    def test_stall(self):
+        stopping = EarlyStopping(stall_generations=3)
+
+        reasons = [stopping.check(fitness) for fitness in (1, 2, 2, 2, 3, 3, 3, 3)]
+
+        assert reasons == [None] * 7 + ["stall"]
+
+    def test_target(self):
+        stopping = EarlyStopping(target_fitness=5)
+
+        assert stopping.check(4) is None
+        assert stopping.check(5) == "target"
+
+    def test_diversity_only_reads_population_when_enabled(self):
+        converged = np.zeros((4, 6), dtype=np.uint8)
+
+        assert EarlyStopping().check(1, converged) is None
+        assert EarlyStopping(min_diversity=0.1).check(1, converged) == "diversity"
+
+    def test_time_budget(self):
+        stopping = EarlyStopping(time_budget=1.0)
+
+        with patch("ga.stopping.time.perf_counter", return_value=stopping.start + 0.5):
+            assert stopping.check(1) is None
+        with patch("ga.stopping.time.perf_counter", return_value=stopping.start + 1.0):
+            assert stopping.check(1) == "time_budget"
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            EarlyStopping(stall_generations=-1)
+        with pytest.raises(ValueError):
+            EarlyStopping(time_budget=-1)
+
+    def test_from_config_uses_bound(self):
+        from ga.engine import GAConfig
+        instance = KnapsackInstance([Item(10, 5), Item(20, 10), Item(15, 8)], 20)
+
+        stopping = EarlyStopping.from_config(GAConfig(stop_at_bound=True), instance)
+
+        # Fractional relaxation: items 1 and 2 plus 2/5 of item 0, rounded down
+        assert stopping.target_fitness == 39
@@ -0,0 +1,150 @@
+import io
+import json
+
+import pytest
+from ga.engine import GAConfig
+from ga.exact import dp_solve
+from ga.fitness import Item, KnapsackInstance
+from batch import main, read_csv, read_jsonl, run_batch, solve_record, solve_stream
+
+
+JSONL_INPUT = "\n".join([
+    json.dumps({"id": "a", "capacity": 20, "items": [[10, 5], [20, 10], [15, 8]]}),
+    "",
+    json.dumps({"id": "b", "capacity": 10, "items": [{"value": 6, "weight": 6}, {"value": 5, "weight": 5}, {"value": 5, "weight": 5}]}),
+    json.dumps({"capacity": 5, "items": [[1, 10]]}),
+]) + "\n"
+
+CSV_INPUT = """id,capacity,value,weight
+a,20,10,5
+a,20,20,10
+a,20,15,8
+b,10,6,6
+b,10,5,5
+b,10,5,5
+"""
+
+
+class TestReaders:
+
+    def test_read_jsonl(self):
+        records = list(read_jsonl(io.StringIO(JSONL_INPUT)))
+
+        assert [r.instance_id for r in records] == ["a", "b", 2]
+        assert [r.index for r in records] == [0, 1, 2]
+        assert records[0].values == [10, 20, 15]
+        assert records[1].weights == [6, 5, 5]
+        assert records[0].capacity == 20
+
+    def test_read_jsonl_is_lazy(self):
+        lines = iter(JSONL_INPUT.splitlines())
+        records = read_jsonl(lines)
+
+        next(records)
+
+        assert next(lines) == ""  # Only the first line has been consumed
+
+    def test_read_jsonl_invalid_lines_become_error_records(self):
+        lines = '{"capacity": 1, "items": []}\n{"id": "x", "items": []}\nnot json\n{"capacity": 1, "items": [7]}\n'
+        records = list(read_jsonl(io.StringIO(lines)))
+
+        assert [r.instance_id for r in records] == [0, "x", 2, 3]
+        assert records[0].error is None
+        assert [r.error.split(":")[0] for r in records[1:]] == ["Line 2", "Line 3", "Line 4"]
+
+    def test_read_jsonl_multi_constraint(self):
+        line = '{"capacity": [10, 4], "items": [[6, 5, 3], {"value": 5, "weight": 4, "resources": [1]}]}\n'
+        record = next(read_jsonl(io.StringIO(line)))
+
+        assert record.resources == [(3,), (1,)]
+        assert record.instance().capacities.tolist() == [10, 4]
+
+    def test_read_csv_groups_consecutive_rows(self):
+        records = list(read_csv(io.StringIO(CSV_INPUT)))
+
+        assert [r.instance_id for r in records] == ["a", "b"]
+        assert records[0].values == [10, 20, 15]
+        assert records[1].capacity == 10
+
+    def test_read_csv_invalid_row_marks_its_instance(self):
+        records = list(read_csv(io.StringIO("id,capacity,value,weight\na,5,1,x\na,5,2,2\nb,5,3,3\n")))
+
+        assert records[0].error.startswith("Line 2")
+        assert records[1].error is None and records[1].values == [3]
+
+    def test_read_csv_missing_columns(self):
+        with pytest.raises(ValueError, match="weight"):
+            list(read_csv(io.StringIO("id,capacity,value\na,1,1\n")))
+
+
+class TestSolve:
+
+    @pytest.mark.parametrize("solver", ["dp", "bnb"])
+    def test_exact_solvers_match_dp(self, solver):
+        record = next(read_jsonl(io.StringIO(JSONL_INPUT)))
+        _, optimum = dp_solve(KnapsackInstance([Item(10, 5), Item(20, 10), Item(15, 8)], 20))
+
+        row = solve_record(record, solver)
+
+        assert row["best_fitness"] == optimum
+        assert row["selected"] == [1, 2]
+        assert row["weight"] == 18
+        assert row["elapsed"] >= 0
+
+    def test_ga_solver_is_seeded_per_instance(self):
+        records = list(read_jsonl(io.StringIO(JSONL_INPUT)))
+        config = GAConfig(population_size=10, generations=5, seed=3)
+
+        first = [solve_record(r, "ga", config) for r in records]
+        second = [solve_record(r, "ga", config) for r in records]
+
+        assert [row["selected"] for row in first] == [row["selected"] for row in second]
+        assert first[0]["best_fitness"] == 35
+
+    def test_unknown_solver(self):
+        with pytest.raises(ValueError, match="Unknown solver"):
+            list(solve_stream([], "lp"))
+
+    def test_worker_pool_returns_every_instance(self):
+        records = read_csv(io.StringIO(CSV_INPUT))
+
+        rows = list(solve_stream(records, "dp", workers=2))
+
+        assert sorted(row["id"] for row in rows) == ["a", "b"]
+        assert {row["id"]: row["best_fitness"] for row in rows} == {"a": 35, "b": 10}
+
+
+class TestRunBatch:
+
+    def test_writes_one_line_per_instance(self):
+        output = io.StringIO()
+
+        solved, failed, elapsed = run_batch(io.StringIO(JSONL_INPUT), output, solver="dp")
+
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert (solved, failed) == (3, 0)
+        assert [row["id"] for row in rows] == ["a", "b", 2]
+        assert rows[2]["best_fitness"] == 0 and rows[2]["selected"] == []
+        assert elapsed == pytest.approx(sum(row["elapsed"] for row in rows))
+
+    def test_bad_instances_are_reported_and_the_stream_continues(self):
+        lines = JSONL_INPUT + 'not json\n{"id": "x", "capacity": 5, "items": [["x", 2]]}\n' + JSONL_INPUT
+        output = io.StringIO()
+
+        solved, failed, _ = run_batch(io.StringIO(lines), output, solver="dp")
+
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert (solved, failed) == (6, 2)
+        assert [row["id"] for row in rows if "error" in row] == [3, "x"]
+        assert rows[3]["error"].startswith("Line 5")
+
+    def test_main_reads_csv_by_extension(self, tmp_path):
+        source = tmp_path / "loads.csv"
+        source.write_text(CSV_INPUT)
+        target = tmp_path / "results.jsonl"
+
+        exit_code = main([str(source), "-o", str(target), "--solver", "bnb"])
+
+        rows = [json.loads(line) for line in target.read_text().splitlines()]
+        assert exit_code == 0
+        assert [row["best_fitness"] for row in rows] == [35, 10]
@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import bench
+from bench import compare, ga_benchmark, make_instance, operator_benchmarks
+
+
+def report(*records):
+    return {"results": [dict(zip(("name", "items", "population", "seconds"), record[:4]), **record[4])
+                        for record in records]}
+
+
+def fake_time_call(function, repeat):
+    function()
+    return {"seconds": 1.0, "relative": 2.0, "noise": 0.1}
+
+
+class TestCompare:
+
+    def test_within_tolerance(self):
+        baseline = report(("evaluate_population", 50, 10, 1.0, {}))
+
+        assert compare(report(("evaluate_population", 50, 10, 1.2, {})), baseline, tolerance=0.25) == []
+
+    def test_slowdown_is_reported(self):
+        baseline = report(("evaluate_population", 50, 10, 1.0, {}))
+
+        regressions = compare(report(("evaluate_population", 50, 10, 1.3, {})), baseline, tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert "evaluate_population (items=50, population=10)" in regressions[0]
+
+    def test_slower_machine_is_not_a_regression(self):
+        baseline = report(("crossover_one_point", 50, 10, 1e-5, {"relative": 0.5}))
+
+        assert compare(report(("crossover_one_point", 50, 10, 2e-5, {"relative": 0.55})), baseline) == []
+
+    def test_slowdown_within_measurement_noise_is_ignored(self):
+        baseline = report(("crossover_one_point", 50, 10, 1e-5, {"relative": 0.5, "noise": 0.3}))
+
+        assert compare(report(("crossover_one_point", 50, 10, 1e-5, {"relative": 0.7, "noise": 0.1})), baseline) == []
+
+    def test_relative_slowdown_is_reported(self):
+        baseline = report(("crossover_one_point", 50, 10, 1e-5, {"relative": 0.5}))
+
+        regressions = compare(report(("crossover_one_point", 50, 10, 1e-5, {"relative": 0.7})), baseline)
+
+        assert len(regressions) == 1
+        assert "relative" in regressions[0]
+
+    def test_quality_drop_is_reported(self):
+        baseline = report(("genetic_algorithm", 50, 10, 1.0, {"quality": 0.95}))
+
+        regressions = compare(report(("genetic_algorithm", 50, 10, 0.5, {"quality": 0.90})), baseline)
+
+        assert len(regressions) == 1
+        assert "quality" in regressions[0]
+
+    def test_cases_missing_from_baseline_are_ignored(self):
+        assert compare(report(("evaluate_population", 100, 10, 9.0, {})), report()) == []
+
+
+class TestSuite:
+
+    def test_instance_is_reproducible(self):
+        assert make_instance(30).values.tolist() == make_instance(30).values.tolist()
+
+    def test_operator_records(self):
+        with patch.object(bench, "time_call", side_effect=fake_time_call):
+            records = operator_benchmarks(20, 10, repeat=1)
+
+        assert {record["name"] for record in records} >= {
+            "evaluate_fitness", "roulette_selection", "tournament_selection",
+            "crossover_one_point", "mutation_bit_flip", "create_population",
+        }
+        assert all(record["items"] == 20 and record["population"] == 10 for record in records)
+        assert all(record["seconds"] == 1.0 and record["relative"] == 2.0 for record in records)
+
+    def test_ga_quality_against_exact_optimum(self):
+        with patch.object(bench, "time_call", side_effect=fake_time_call) as timed:
+            record = ga_benchmark(20, 10, generations=5, repeat=4)
+
+        assert timed.call_args.args[1] == 4
+
+        assert record["reference_optimal"]
+        assert 0 < record["quality"] <= 1
+        assert record["best_fitness"] <= record["reference"]
+
+    def test_time_call_reports_median_and_calibrated_time(self):
+        timing = bench.time_call(lambda: sum(range(1_000)), repeat=3)
+
+        assert timing["seconds"] > 0 and timing["relative"] > 0 and timing["noise"] >= 0
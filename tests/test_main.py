@@ -1,12 +1,25 @@
+import random
+from functools import partial
 from unittest.mock import patch
 
 import pytest
+from ga.cache import FitnessCache
 from ga.crossover import Crossover
-from ga.fitness import evaluate_fitness, Item
+from ga.exact import dp_solve
+from ga.fitness import evaluate_fitness, Item, KnapsackInstance
 from ga.mutation import Mutation
+from ga.parallel import ParallelEvaluator
 from ga.population import create_population
 from ga.selection import tournament_selection
-from main import calculate_population_fitness, get_best_individual, genetic_algorithm, main
+from main import (
+    calculate_population_fitness,
+    display_results,
+    get_best_individual,
+    genetic_algorithm,
+    island_genetic_algorithm,
+    main,
+    solve,
+)
 
 
 class TestMainComponents:
@@ -24,6 +37,26 @@ class TestMainComponents:
         assert fitness_scores[1] == 20
         assert fitness_scores[2] == 30
 
+    def test_calculate_population_fitness_with_instance(self):
+        items = [Item(10, 5), Item(20, 10), Item(15, 8)]
+        population = [[1, 0, 1], [0, 1, 0], [1, 1, 0]]
+
+        fitness_scores = calculate_population_fitness(population, KnapsackInstance(items, 20), 20)
+
+        assert fitness_scores == calculate_population_fitness(population, items, 20)
+
+    def test_calculate_population_fitness_with_cache(self):
+        items = [Item(10, 5), Item(20, 10), Item(15, 8)]
+        population = [[1, 0, 1], [0, 1, 0], [1, 0, 1]]
+        cache = FitnessCache()
+
+        fitness_scores = calculate_population_fitness(population, KnapsackInstance(items, 20), 20, cache)
+
+        assert fitness_scores == [25, 20, 25]
+        assert all(isinstance(score, int) for score in fitness_scores)
+        assert cache.misses == 2
+        assert cache.hits == 1
+
     def test_get_best_individual(self):
         population = [[1, 0, 1], [0, 1, 0], [1, 1, 0]]
         fitness_scores = [25, 20, 30]
@@ -84,6 +117,168 @@ class TestGeneticAlgorithmIntegration:
             assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
 
 
+    def test_genetic_algorithm_with_fitness_cache(self, capsys):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 20), \
+             patch('main.GENERATIONS', 10), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.FITNESS_CACHE_SIZE', 1000):
+
+            best_solution, best_fitness, _, _ = genetic_algorithm()
+
+        assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
+        assert "Fitness cache: hits=" in capsys.readouterr().out
+
+    def test_genetic_algorithm_resumes_from_checkpoint(self, tmp_path, capsys):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+        path = str(tmp_path / "run.ckpt")
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 20), \
+             patch('main.GENERATIONS', 10), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.CHECKPOINT_PATH', path), \
+             patch('main.CHECKPOINT_INTERVAL', 5):
+            random.seed(9)
+            first = genetic_algorithm()
+            with patch('main.GENERATIONS', 15), patch('main.RESUME_FROM_CHECKPOINT', True):
+                resumed = genetic_algorithm()
+
+        assert "Resuming from checkpoint" in capsys.readouterr().out
+        assert resumed[2][:10] == first[2]
+        assert len(resumed[2]) == 15
+
+
+    def test_genetic_algorithm_with_incremental_evaluation(self):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 20), \
+             patch('main.GENERATIONS', 10), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.INCREMENTAL_EVALUATION', True):
+
+            best_solution, best_fitness, best_history, _ = genetic_algorithm()
+
+        assert isinstance(best_solution, list)
+        assert isinstance(best_fitness, int)
+        assert len(best_history) == 10
+        assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
+
+
+    def test_genetic_algorithm_tournament_selection(self):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 20), \
+             patch('main.GENERATIONS', 10), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.SELECTION_STRATEGY', 'tournament'):
+
+            best_solution, best_fitness, _, _ = genetic_algorithm()
+
+        assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
+
+    def test_genetic_algorithm_crossover_strategies(self):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        for strategy in ('two_point', 'k_point', 'uniform'):
+            with patch('main.items', test_items), \
+                 patch('main.POPULATION_SIZE', 20), \
+                 patch('main.GENERATIONS', 10), \
+                 patch('main.KNAPSACK_CAPACITY', 15), \
+                 patch('main.CROSSOVER_STRATEGY', strategy), \
+                 patch('main.CROSSOVER_RATE', 0.8):
+
+                best_solution, best_fitness, best_history, _ = genetic_algorithm()
+
+            assert len(best_history) == 10
+            assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
+
+    def test_genetic_algorithm_invalid_crossover_configuration(self):
+        with patch('main.CROSSOVER_STRATEGY', 'three_parent'):
+            with pytest.raises(ValueError):
+                genetic_algorithm()
+
+        with patch('main.CROSSOVER_STRATEGY', 'uniform'), patch('main.INCREMENTAL_EVALUATION', True):
+            with pytest.raises(ValueError):
+                genetic_algorithm()
+
+    def test_genetic_algorithm_greedy_seeding_and_repair(self):
+        test_items = [Item(i * 3 % 17 + 1, i % 7 + 1) for i in range(30)]
+
+        for seeding, repair, penalty in (('greedy', True, False), ('randomized_greedy', False, True)):
+            with patch('main.items', test_items), \
+                 patch('main.POPULATION_SIZE', 20), \
+                 patch('main.GENERATIONS', 5), \
+                 patch('main.KNAPSACK_CAPACITY', 40), \
+                 patch('main.SEEDING', seeding), \
+                 patch('main.REPAIR', repair), \
+                 patch('main.PENALTY_FITNESS', penalty):
+
+                best_solution, best_fitness, best_history, _ = genetic_algorithm()
+
+            assert best_history[0] > 0
+            assert evaluate_fitness(best_solution, test_items, 40) == best_fitness
+
+    def test_genetic_algorithm_unknown_selection(self):
+        with patch('main.SELECTION_STRATEGY', 'rank'):
+            with pytest.raises(ValueError):
+                genetic_algorithm()
+
+    def test_genetic_algorithm_parallel_matches_serial(self):
+        test_items = [Item(i*2, i) for i in range(1, 12)]
+        results = []
+
+        for workers in (0, 2):
+            random.seed(1234)
+            with patch('main.items', test_items), \
+                 patch('main.POPULATION_SIZE', 20), \
+                 patch('main.GENERATIONS', 8), \
+                 patch('main.KNAPSACK_CAPACITY', 25), \
+                 patch('main.PARALLEL_WORKERS', workers), \
+                 patch('ga.engine.ParallelEvaluator', partial(ParallelEvaluator, threshold=0)):
+
+                results.append(genetic_algorithm())
+
+        assert results[0] == results[1]
+
+
+    def test_island_genetic_algorithm(self):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 10), \
+             patch('main.GENERATIONS', 6), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.NUM_ISLANDS', 2), \
+             patch('main.MIGRATION_INTERVAL', 3):
+
+            best_solution, best_fitness, best_history, avg_history = island_genetic_algorithm()
+
+        assert len(best_history) == len(avg_history) == 6
+        assert evaluate_fitness(best_solution, test_items, 15) == best_fitness
+
+    def test_island_genetic_algorithm_follows_random_seed(self):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+        results = []
+
+        for _ in range(2):
+            random.seed(99)
+            with patch('main.items', test_items), \
+                 patch('main.POPULATION_SIZE', 10), \
+                 patch('main.GENERATIONS', 6), \
+                 patch('main.KNAPSACK_CAPACITY', 15), \
+                 patch('main.NUM_ISLANDS', 2), \
+                 patch('main.MIGRATION_INTERVAL', 3):
+
+                results.append(island_genetic_algorithm())
+
+        assert results[0] == results[1]
+
+
 class TestBruteForceComparison:
 
     @staticmethod
@@ -148,6 +343,68 @@ class TestBruteForceComparison:
                 assert ga_fitness > 0
 
 
+class TestSolverBackends:
+
+    def test_dp_backend_is_optimal(self):
+        test_items = [Item(6, 3), Item(8, 4), Item(12, 6), Item(10, 5)]
+
+        with patch('main.items', test_items), \
+             patch('main.KNAPSACK_CAPACITY', 10), \
+             patch('main.SOLVER_BACKEND', 'dp'):
+
+            best_solution, best_fitness, best_history, avg_history = solve()
+
+        _, optimal_value = TestBruteForceComparison.brute_force_knapsack(test_items, 10)
+        assert best_fitness == optimal_value
+        assert evaluate_fitness(best_solution, test_items, 10) == optimal_value
+        assert best_history == avg_history == [optimal_value]
+
+    def test_exact_seed_reaches_optimum(self):
+        test_items = [Item(i * 3 % 17 + 1, i % 7 + 1) for i in range(20)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 10), \
+             patch('main.GENERATIONS', 2), \
+             patch('main.KNAPSACK_CAPACITY', 30), \
+             patch('main.SEED_WITH_EXACT', True):
+
+            _, best_fitness, best_history, _ = solve()
+
+        _, optimal_value = dp_solve(KnapsackInstance(test_items, 30))
+        assert best_history[0] == best_fitness == optimal_value
+
+    def test_bnb_backend_is_optimal(self):
+        test_items = [Item(6, 3), Item(8, 4), Item(12, 6), Item(10, 5)]
+
+        with patch('main.items', test_items), \
+             patch('main.KNAPSACK_CAPACITY', 10), \
+             patch('main.SOLVER_BACKEND', 'bnb'):
+
+            best_solution, best_fitness, _, _ = solve()
+
+        _, optimal_value = TestBruteForceComparison.brute_force_knapsack(test_items, 10)
+        assert best_fitness == optimal_value
+        assert evaluate_fitness(best_solution, test_items, 10) == optimal_value
+
+    def test_report_optimality_gap(self, capsys):
+        test_items = [Item(i*2, i) for i in range(1, 8)]
+
+        with patch('main.items', test_items), \
+             patch('main.POPULATION_SIZE', 10), \
+             patch('main.GENERATIONS', 3), \
+             patch('main.KNAPSACK_CAPACITY', 15), \
+             patch('main.REPORT_OPTIMALITY_GAP', True):
+
+            solve()
+
+        assert "Optimality gap:" in capsys.readouterr().out
+
+    def test_unknown_backend(self):
+        with patch('main.SOLVER_BACKEND', 'milp'):
+            with pytest.raises(ValueError):
+                solve()
+
+
 class TestMainFunction:
 
     @patch('matplotlib.pyplot.show')
@@ -164,6 +421,24 @@ class TestMainFunction:
 
             mock_show.assert_called()
 
+    @patch('matplotlib.pyplot.show')
+    def test_main_headless(self, mock_show, tmp_path, capsys):
+        with patch('main.POPULATION_SIZE', 10), \
+             patch('main.GENERATIONS', 3), \
+             patch('main.items', [Item(i*2, i) for i in range(1, 6)]), \
+             patch('main.OUTPUT_MODE', 'headless'), \
+             patch('main.OUTPUT_DIR', str(tmp_path)):
+            main()
+
+        mock_show.assert_not_called()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["fitness.png", "history.csv", "results.json"]
+        assert "Results written to:" in capsys.readouterr().out
+
+    def test_unknown_output_mode(self):
+        with patch('main.OUTPUT_MODE', 'window'):
+            with pytest.raises(ValueError):
+                display_results([1, 0], 2, [2], [2.0])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+import csv
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from report import save_history_png, write_history_csv, write_outputs, write_results_json
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+class TestReport:
+
+    def test_history_csv(self, tmp_path):
+        path = tmp_path / "history.csv"
+
+        write_history_csv(path, [5, 7, 7], [2.5, 3.0, 4.25])
+
+        with open(path, newline="") as file:
+            rows = list(csv.reader(file))
+        assert rows == [["generation", "best_fitness", "avg_fitness"], ["0", "5", "2.5"], ["1", "7", "3.0"],
+                        ["2", "7", "4.25"]]
+
+    def test_results_json(self, tmp_path):
+        path = tmp_path / "results.json"
+
+        write_results_json(path, [1, 0, 1], 25, [20, 25], [10.0, 12.5], capacity=20)
+
+        assert json.loads(path.read_text()) == {
+            "best_fitness": 25, "best_solution": [1, 0, 1], "best_fitness_history": [20, 25],
+            "avg_fitness_history": [10.0, 12.5], "capacity": 20,
+        }
+
+    def test_png_is_rendered_without_pyplot(self, tmp_path):
+        path = tmp_path / "fitness.png"
+
+        save_history_png(path, [1, 2, 3], [0.5, 1.0, 2.0])
+
+        assert path.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_write_outputs(self, tmp_path):
+        directory = tmp_path / "out"
+
+        paths = write_outputs(str(directory), [1], 3, [3], [3.0], png=True)
+
+        assert sorted(Path(p).name for p in paths) == ["fitness.png", "history.csv", "results.json"]
+        assert write_outputs(str(directory), [1], 3, [3], [3.0])[-1].endswith("results.json")
+
+
+class TestImportHygiene:
+
+    def test_ga_and_main_do_not_import_matplotlib(self):
+        code = (
+            "import sys, pkgutil, importlib, ga\n"
+            "for module in pkgutil.iter_modules(ga.__path__):\n"
+            "    importlib.import_module('ga.' + module.name)\n"
+            "import batch, main, report\n"
+            "print('matplotlib' in sys.modules)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True)
+
+        assert output.stdout.strip() == "False"